@@ -0,0 +1,98 @@
+# benchmarks/bench_e2e.py - 로컬 가짜 TU/통계 사이트 대상 전체 흐름 단계별 소요 시간 측정
+#
+# 사용법:
+#   python benchmarks/bench_e2e.py                                  # http 백엔드, 지연 없음
+#   python benchmarks/bench_e2e.py --backend=chrome --latency=0.2   # headless Chrome (chromedriver 필요)
+#   python benchmarks/bench_e2e.py --export-delay=2 --rows=10000 --runs=3
+#
+# 단계: 드라이버 준비 → 로그인 → 팀 통계 이동 → CSV 내보내기 → 처리+검증 → 통계 업로드
+# 운영 사이트 없이 노트북에서 브라우저 단계 최적화 전후를 비교하는 용도 (reportbot/fakes/sites.py)
+import os
+import sys
+import time
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from reportbot.browsers import make_backend  # noqa: E402
+from reportbot.fakes.sites import FakeSites  # noqa: E402
+from reportbot.fakes.synthetic import synthetic_people, synthetic_config  # noqa: E402
+from reportbot.processing import process_export  # noqa: E402
+
+STAGES = ("start", "login", "open_team_stats", "export_csv", "process", "upload_stats")
+
+
+def run_once(sites, backend_name, rows, headless=True):
+    """전체 흐름 1회 실행 → {단계: 초} (실패한 단계에서 중단, 값 None)"""
+    import pandas as pd
+    timings = dict.fromkeys(STAGES)
+    with tempfile.TemporaryDirectory() as download_dir:
+        backend = make_backend(backend_name, headless=headless, download_dir=download_dir,
+                               tu_url=sites.tu_url, stats_url=sites.stats_url)
+        try:
+            def timed(stage, func):
+                start = time.perf_counter()
+                value = func()
+                timings[stage] = time.perf_counter() - start
+                return value
+
+            if not timed("start", backend.start):
+                return timings
+            if not timed("login", lambda: backend.login("bench@aceproject.co.kr", "bench")):
+                return timings
+            if not timed("open_team_stats", lambda: backend.open_team_stats("아트실")):
+                return timings
+            csv_file = timed("export_csv", backend.export_csv)
+            if not csv_file:
+                timings["export_csv"] = None
+                return timings
+
+            def process():
+                config = synthetic_config(synthetic_people(max(8, rows // 200), seed=sites.seed))
+                result = process_export(pd.read_csv(csv_file), config, (2026, 10), min_hours=160)
+                output_file = os.path.join(download_dir, "26_10.csv")
+                result.frame.to_csv(output_file, index=False, header=False, encoding='utf-8-sig')
+                return output_file
+
+            output_file = timed("process", process)
+            if not timed("upload_stats", lambda: backend.upload_stats(output_file)):
+                timings["upload_stats"] = None
+            return timings
+        finally:
+            backend.quit()
+
+
+def main(argv):
+    options = dict(a[2:].split("=", 1) for a in argv if a.startswith("--") and "=" in a)
+    backend_name = options.get("backend", "http")
+    latency = float(options.get("latency", 0))
+    export_delay = float(options.get("export-delay", 0))
+    rows = int(options.get("rows", 1000))
+    runs = int(options.get("runs", 1))
+
+    print(f"🧪 가짜 사이트 전체 흐름: 백엔드 {backend_name}, 응답 지연 {latency}s, 내보내기 지연 {export_delay}s, {rows}행")
+    all_timings = []
+    with FakeSites(latency=latency, export_delay=export_delay, export_rows=rows, seed=1) as sites:
+        for run in range(runs):
+            timings = run_once(sites, backend_name, rows)
+            all_timings.append(timings)
+            failed = [stage for stage, value in timings.items() if value is None]
+            status = f"❌ 실패: {failed[0]}" if failed else "✅"
+            print(f"  {run + 1}회차 {status} — 전체 {sum(v for v in timings.values() if v):.2f}s")
+        request_count = len(sites.requests)
+
+    print(f"\n{'단계':<18}{'최소(s)':>10}{'평균(s)':>10}")
+    for stage in STAGES:
+        values = [t[stage] for t in all_timings if t[stage] is not None]
+        if values:
+            print(f"{stage:<18}{min(values):>10.3f}{sum(values) / len(values):>10.3f}")
+        else:
+            print(f"{stage:<18}{'-':>10}{'-':>10}")
+    print(f"📨 서버 요청 수: {request_count} ({runs}회)")
+
+    return 0 if all(all(v is not None for v in t.values()) for t in all_timings) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
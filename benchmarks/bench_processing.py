@@ -0,0 +1,222 @@
+# benchmarks/bench_processing.py - 처리/검증 파이프라인 벤치마크 (합성 export 기준)
+#
+# 사용법:
+#   python benchmarks/bench_processing.py                        # 1k, 10k 측정 + 기준 이슈 비교 (다르면 exit 1)
+#   python benchmarks/bench_processing.py --sizes 1k,10k,100k,1m # 크기 지정
+#   python benchmarks/bench_processing.py --record               # 결과를 benchmarks/processing_history.jsonl 에 추가
+#   python benchmarks/bench_processing.py --update-baseline      # 현재 구현의 이슈 결과를 기준값으로 저장
+#   python benchmarks/bench_processing.py --sizes 200k --workers 1,2,4,8  # 검증 규칙 병렬 평가 프로세스 수별 속도 비교
+#
+# 측정 항목: process_export 전체 / validate_tags / validate_time_totals 소요 시간, 초당 처리 행 수,
+#            tracemalloc 최대 메모리, 이슈 수 + 이슈 목록 해시 + 제외 Tasklist 값별 / 연차 태그 행 수 (processing_baseline.json 과 비교)
+# 처리 로직을 바꾼 뒤에는 이슈 결과가 기준값과 같은지(동작 동일) + 처리 속도를 함께 확인
+# --workers: 프로세스 수별 검증 규칙 평가(원본 + 최종 4열 규칙) 시간 / 1개 대비 속도 배율 / 이슈 결과 동일 여부
+#            (rules.PARALLEL_MIN_ROWS 행 미만은 병렬로 나누지 않으므로 큰 크기로 측정)
+import os
+import sys
+import json
+import time
+import hashlib
+import tracemalloc
+from datetime import datetime, timezone, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from reportbot.fakes.synthetic import generate_export, synthetic_config  # noqa: E402
+from reportbot.processing import process_export, evaluate_processed, validate_tags, validate_time_totals  # noqa: E402
+from reportbot.rules import PARALLEL_MIN_ROWS, resolve_workers  # noqa: E402
+
+HISTORY_FILE = os.path.join(REPO_ROOT, "benchmarks", "processing_history.jsonl")
+BASELINE_FILE = os.path.join(REPO_ROOT, "benchmarks", "processing_baseline.json")
+# 기준값과 비교하는 결과 항목 (이슈 목록 해시 + 제외 Tasklist 값별 행 수 + 연차 자동 태그 행 수)
+BASELINE_KEYS = ("issues", "hours_issues", "tag_issues", "issues_sha1", "tasklist_excluded", "leave_count")
+
+DEFAULT_SIZES = "1k,10k"
+SEED = 1
+PERIOD = (2026, 10)
+MIN_HOURS = 160
+
+# 직전 기록 대비 초당 처리 행 수가 이 비율 이상 떨어지면 경고
+REGRESSION_TOLERANCE = 0.3
+
+
+def parse_size(value):
+    """'10k' → 10000, '1m' → 1000000"""
+    value = value.strip().lower()
+    if value.endswith("k"):
+        return int(float(value[:-1]) * 1_000)
+    if value.endswith("m"):
+        return int(float(value[:-1]) * 1_000_000)
+    return int(value)
+
+
+def issues_digest(issues):
+    return hashlib.sha1("\n".join(issues).encode("utf-8")).hexdigest()
+
+
+def _best_of(runs, func):
+    best, value = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        value = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def bench_size(rows, runs):
+    """rows 행 합성 export 1개에 대한 측정 결과 dict"""
+    df, people = generate_export(rows, seed=SEED)
+    config = synthetic_config(people)
+
+    total_s, result = _best_of(runs, lambda: process_export(df, config, PERIOD, min_hours=MIN_HOURS))
+    if not result.ok:
+        raise RuntimeError(f"{rows}행 처리 실패: {result.error}")
+
+    frame = result.frame
+    tags_s, _ = _best_of(runs, lambda: validate_tags(frame, config))
+    hours_s, _ = _best_of(runs, lambda: validate_time_totals(frame, MIN_HOURS, PERIOD, config.exclude_names))
+
+    # 메모리는 별도 1회 실행 (tracemalloc 켜면 느려지므로 시간 측정과 분리)
+    tracemalloc.start()
+    process_export(df, config, PERIOD, min_hours=MIN_HOURS)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "rows": rows,
+        "process_s": round(total_s, 4),
+        "validate_tags_s": round(tags_s, 4),
+        "validate_time_totals_s": round(hours_s, 4),
+        "rows_per_s": round(rows / total_s),
+        "peak_mb": round(peak / (1024 * 1024), 1),
+        "issues": len(result.issues),
+        "hours_issues": len(result.hours_issues),
+        "tag_issues": len(result.tag_issues),
+        "issues_sha1": issues_digest(result.issues),
+        "tasklist_excluded": result.tasklist_excluded,
+        "leave_count": result.leave_count,
+    }
+
+
+def bench_workers(rows, worker_counts, runs):
+    """프로세스 수별 검증 규칙 평가 시간 → [{workers, rules_s, speedup, same}] (1개 프로세스 결과와 비교)"""
+    df, people = generate_export(rows, seed=SEED)
+    config = synthetic_config(people)
+    result = process_export(df, config, PERIOD, min_hours=MIN_HOURS)
+    if not result.ok:
+        raise RuntimeError(f"{rows}행 처리 실패: {result.error}")
+    # 원본 규칙은 Name 열이 붙은 export 기준 — 처리 결과 frame 을 그대로 넣어 두 frame 규칙을 모두 측정
+    frame = result.frame
+
+    def evaluate():
+        issues = config.rules.evaluate("export", frame, config, PERIOD, MIN_HOURS)
+        issues.update(evaluate_processed(frame, config, PERIOD, MIN_HOURS))
+        return issues
+
+    measured, base_s, base_issues = [], None, None
+    for workers in worker_counts:
+        config.workers = workers
+        elapsed, issues = _best_of(runs, evaluate)
+        if base_s is None:
+            base_s, base_issues = elapsed, issues
+        measured.append({"workers": resolve_workers(workers), "rules_s": round(elapsed, 4),
+                         "speedup": round(base_s / elapsed, 2), "same": issues == base_issues})
+    return measured
+
+
+def _load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def _last_history(size_key):
+    """history 파일에서 해당 크기의 마지막 기록 (없으면 None)"""
+    last = None
+    if os.path.exists(HISTORY_FILE):
+        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line).get("results", {}).get(size_key)
+                if record:
+                    last = record
+    return last
+
+
+def main(argv):
+    record = "--record" in argv
+    update_baseline = "--update-baseline" in argv
+    sizes = DEFAULT_SIZES
+    if "--sizes" in argv:
+        sizes = argv[argv.index("--sizes") + 1]
+    worker_counts = None
+    if "--workers" in argv:
+        worker_counts = [int(w) for w in argv[argv.index("--workers") + 1].split(",") if w.strip()]
+
+    baseline = _load_json(BASELINE_FILE, {"seed": SEED, "sizes": {}})
+    results = {}
+    failed = False
+    for size_key in [s.strip() for s in sizes.split(",") if s.strip()]:
+        rows = parse_size(size_key)
+        runs = 3 if rows <= 10_000 else 1
+        print(f"⏱️ {size_key} ({rows}행) 측정 중...")
+        result = bench_size(rows, runs)
+        results[size_key] = result
+
+        print(f"   처리 {result['process_s']:.3f}s ({result['rows_per_s']:,}행/s) "
+              f"| 태그 검증 {result['validate_tags_s']:.3f}s | 시간 검증 {result['validate_time_totals_s']:.3f}s "
+              f"| 최대 메모리 {result['peak_mb']}MB")
+
+        # 이슈 결과 비교 (처리 로직 변경 후에도 결과가 같아야 함)
+        expected = baseline["sizes"].get(size_key)
+        if update_baseline:
+            baseline["sizes"][size_key] = {k: result[k] for k in BASELINE_KEYS}
+        elif expected is None:
+            print(f"   ⚠️ 기준값 없음 — --update-baseline 으로 저장 (이슈 {result['issues']}개)")
+        elif any(expected.get(k) != result[k] for k in BASELINE_KEYS):
+            failed = True
+            print(f"   ❌ 이슈 결과 불일치: 기준 {expected['issues']}개 (합산 {expected['hours_issues']}, 태그 {expected['tag_issues']}) "
+                  f"→ 현재 {result['issues']}개 (합산 {result['hours_issues']}, 태그 {result['tag_issues']})")
+            if expected.get("tasklist_excluded") != result["tasklist_excluded"]:
+                print(f"   ❌ 제외 Tasklist 행 수 불일치: 기준 {expected.get('tasklist_excluded')} → 현재 {result['tasklist_excluded']}")
+            if expected.get("leave_count") != result["leave_count"]:
+                print(f"   ❌ 연차 자동 태그 행 수 불일치: 기준 {expected.get('leave_count')} → 현재 {result['leave_count']}")
+        else:
+            print(f"   ✅ 이슈 결과 기준값과 동일 ({result['issues']}개)")
+
+        if worker_counts:
+            if rows < PARALLEL_MIN_ROWS:
+                print(f"   ℹ️ {PARALLEL_MIN_ROWS:,}행 미만은 병렬로 나누지 않음 (프로세스 수 무관)")
+            result["workers"] = bench_workers(rows, worker_counts, runs)
+            for item in result["workers"]:
+                print(f"   🧵 프로세스 {item['workers']}개: 규칙 평가 {item['rules_s']:.3f}s (×{item['speedup']:.2f})"
+                      f"{'' if item['same'] else ' ❌ 이슈 결과가 1개 프로세스와 다름'}")
+                failed = failed or not item["same"]
+
+        previous = _last_history(size_key)
+        if previous and result["rows_per_s"] < previous["rows_per_s"] * (1 - REGRESSION_TOLERANCE):
+            print(f"   ⚠️ 처리 속도 저하: 직전 기록 {previous['rows_per_s']:,}행/s → {result['rows_per_s']:,}행/s")
+
+    if update_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"📝 기준값 저장: {BASELINE_FILE}")
+
+    if record:
+        with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                "measured_at": datetime.now(timezone(timedelta(hours=9))).isoformat(timespec='seconds'),
+                "python": sys.version.split()[0],
+                "results": results,
+            }, ensure_ascii=False) + "\n")
+        print(f"📝 기록 추가: {HISTORY_FILE}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
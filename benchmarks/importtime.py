@@ -0,0 +1,99 @@
+# benchmarks/importtime.py - `python -X importtime` 기반 import 시간 측정
+#
+# 사용법:
+#   python benchmarks/importtime.py                    # 측정 + 예산 초과 시 exit 1
+#   python benchmarks/importtime.py --record           # 결과를 benchmarks/importtime_history.jsonl 에 추가
+#   python benchmarks/importtime.py --top 15           # 모듈별 가장 무거운 import 15개 출력
+#
+# tu_downloader 를 import 하는 것만으로 pandas/selenium/requests 가 로드되면 예산을 초과하도록 설정되어 있음
+import os
+import re
+import sys
+import json
+import subprocess
+from datetime import datetime, timezone, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(REPO_ROOT, "benchmarks", "importtime_history.jsonl")
+
+# 모듈별 import 시간 예산 (ms, 누적 기준) — 무거운 의존성이 import 시점에 끌려오면 초과
+IMPORT_BUDGET_MS = {
+    "tu_downloader": 100,
+    "tu_downloader_window": 100,
+    "reportbot.issue_state": 50,
+    "reportbot.browsers": 50,
+    "reportbot.downloader": 80,
+    "reportbot.cli": 100,
+}
+
+# 이 모듈들이 import 시점에 로드되면 안 됨 (필요한 단계에서만 import)
+HEAVY_MODULES = ("pandas", "selenium", "requests", "dotenv")
+
+_LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module, runs=3):
+    """새 인터프리터에서 module 을 import 하고 (누적 ms, 모듈별 누적 µs dict) 반환 — runs 회 중 최솟값"""
+    best_total, best_entries = None, None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+        # 출력은 자식 모듈이 부모보다 먼저, 더 깊게 들여쓰기되어 나옴 → 대상 모듈 줄에서 거꾸로 올라가며
+        # 들여쓰기가 더 깊은 줄만 모으면 대상 모듈이 끌어온 import 들 (인터프리터 시작 시 import 는 제외)
+        lines = [(len(m.group(3)), m.group(4), int(m.group(2)))
+                 for m in map(_LINE_RE.match, result.stderr.splitlines()) if m]
+        target = max(i for i, (_, name, _) in enumerate(lines) if name == module)
+        depth = lines[target][0]
+        entries = {module: lines[target][2]}
+        for indent, name, cumulative_us in reversed(lines[:target]):
+            if indent <= depth:
+                break
+            entries.setdefault(name, cumulative_us)
+        total_ms = entries[module] / 1000.0
+        if best_total is None or total_ms < best_total:
+            best_total, best_entries = total_ms, entries
+    return best_total, best_entries
+
+
+def main(argv):
+    record = "--record" in argv
+    top = 0
+    if "--top" in argv:
+        top = int(argv[argv.index("--top") + 1])
+
+    results = {}
+    failed = False
+    for module, budget in IMPORT_BUDGET_MS.items():
+        total_ms, entries = measure(module)
+        heavy = sorted(m for m in entries if m.split('.')[0] in HEAVY_MODULES and '.' not in m)
+        over = total_ms > budget or bool(heavy)
+        failed |= over
+        results[module] = round(total_ms, 1)
+
+        status = "❌" if over else "✅"
+        print(f"{status} {module}: {total_ms:.1f}ms (예산 {budget}ms)")
+        if heavy:
+            print(f"   ⚠️ import 시점에 로드된 무거운 모듈: {', '.join(heavy)}")
+        if top:
+            for name, us in sorted(entries.items(), key=lambda x: -x[1])[1:top + 1]:
+                print(f"   {us / 1000.0:8.1f}ms  {name}")
+
+    if record:
+        with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                "measured_at": datetime.now(timezone(timedelta(hours=9))).isoformat(timespec='seconds'),
+                "python": sys.version.split()[0],
+                "import_ms": results,
+            }, ensure_ascii=False) + "\n")
+        print(f"📝 기록 추가: {HISTORY_FILE}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1 @@
+# reportbot - tu_downloader.py / tu_downloader_window.py 공용 모듈 모음
@@ -0,0 +1,223 @@
+# reportbot/analytics.py - 월별 집계 DB (SQLite) + 여러 달 추세 조회 (analytics 모드)
+#
+# 월마다 처리 결과를 한 번만 집계해 저장하고, 추세 조회는 집계 테이블만 읽음 (원본 export 재처리 없음):
+#   months           — 월별 원본 export 해시, 행 수, 이슈 수
+#   person_tag_hours — 월 × 사람 × 첫/두 번째 태그 × 그룹 시간 합계 (tag_hours_report)
+#   person_month     — 월 × 사람 총 시간 / 연차 시간 / 이슈 수
+#
+# 증분 갱신: 원본 export 의 SHA-256 이 저장된 값과 같은 달은 건너뛰고, 새 달 / 바뀐 달만 다시 집계
+#   - 전체 / 검증 실행: 이번 달 결과를 실행 끝에 반영
+#   - python tu_downloader.py analytics [--force]: raw_exports/ · raw_archive/ 의 모든 달을 확인 후 추세 표 출력
+import os
+import time
+import glob
+
+from reportbot.issue_state import STATE_DIR, issue_person
+
+ANALYTICS_DB = os.path.join(STATE_DIR, "analytics.sqlite3")
+
+# 연차 시간으로 집계할 첫 번째 태그 (연차/반차류 Tasklist 행은 처리 단계에서 '연차' 태그로 바뀜)
+LEAVE_TAG = "연차"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS months (
+    period TEXT PRIMARY KEY,
+    source TEXT,
+    source_sha256 TEXT,
+    rows INTEGER,
+    issues INTEGER,
+    hours_issues INTEGER,
+    tag_issues INTEGER,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS person_tag_hours (
+    period TEXT NOT NULL,
+    name TEXT NOT NULL,
+    first_tag TEXT,
+    second_tag TEXT,
+    tag_group TEXT,
+    hours REAL
+);
+CREATE TABLE IF NOT EXISTS person_month (
+    period TEXT NOT NULL,
+    name TEXT NOT NULL,
+    hours REAL,
+    leave_hours REAL,
+    issues INTEGER,
+    PRIMARY KEY (period, name)
+);
+CREATE INDEX IF NOT EXISTS idx_person_tag_hours_period ON person_tag_hours(period);
+"""
+
+
+def _period_key(period):
+    year, month = period
+    return f"{year}-{month:02d}"
+
+
+def discover_sources(exports_dir=None, archive_dir=None):
+    """집계할 월별 원본 export → {(연도, 월): 경로} (raw_exports/ CSV 우선, 없으면 raw_archive/ 마지막 보관본)"""
+    from reportbot.backfill import parse_month, find_month_export
+    from reportbot.archive import list_archives
+    from reportbot.settings import BACKFILL_EXPORTS_DIR, RAW_ARCHIVE_DIR
+    exports_dir = exports_dir or BACKFILL_EXPORTS_DIR
+    archive_dir = archive_dir or RAW_ARCHIVE_DIR
+
+    periods = {period for period, _, _ in list_archives(archive_dir)}
+    for path in glob.glob(os.path.join(exports_dir, "????-??*")):
+        try:
+            periods.add(parse_month(os.path.splitext(os.path.basename(path))[0]))
+        except ValueError:
+            continue
+    sources = {}
+    for year, month in sorted(periods):
+        path = find_month_export(exports_dir, year, month, archive_dir)
+        if path:
+            sources[(year, month)] = path
+    return sources
+
+
+class MonthlyAggregates:
+    def __init__(self, path=ANALYTICS_DB):
+        self.path = path
+
+    def _connect(self):
+        import sqlite3
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _query(self, sql, params=()):
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def source_sha256(self, period):
+        """저장된 월의 원본 export 해시 (집계 전이면 None)"""
+        rows = self._query("SELECT source_sha256 FROM months WHERE period = ?", (_period_key(period),))
+        return rows[0][0] if rows else None
+
+    def ingest(self, period, frame, issues, issue_counts, config, source_sha256, source=None, columns=None):
+        """처리된 4열 DataFrame + 검증 이슈 → 해당 월 집계 교체
+
+        Args:
+            period (tuple): (연도, 월)
+            frame (DataFrame): 처리 결과 (Name, Task, Tags, Time Spent)
+            issues (list): 검증 이슈 목록
+            issue_counts (dict): 규칙 group → 이슈 수 (ProcessResult.issue_counts — 합산 / 태그 오류 수는 group 기준)
+            config (ProcessingConfig): 태그 그룹(아트/프로젝트) 판별용
+            source_sha256 (str): 원본 export 해시 (다음 갱신 때 변경 여부 판단)
+            columns (RowColumns): frame 의 파생 열 (process_export 결과의 result.columns, None이면 새로 계산)
+        """
+        from datetime import datetime
+        from reportbot.processing import tag_hours_report
+        key = _period_key(period)
+        report = tag_hours_report(frame, config, columns)
+        totals = report.groupby('Name')['시간'].sum()
+        leave = report[report['첫번째 태그'] == LEAVE_TAG].groupby('Name')['시간'].sum()
+        person_issues = {}
+        for issue in issues:
+            name = issue_person(issue) or '미분류'
+            person_issues[name] = person_issues.get(name, 0) + 1
+        names = sorted(set(totals.index) | set(person_issues))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM person_tag_hours WHERE period = ?", (key,))
+                conn.execute("DELETE FROM person_month WHERE period = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO person_tag_hours (period, name, first_tag, second_tag, tag_group, hours)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(key, *row[:4], float(row[4])) for row in report.itertuples(index=False)])
+                conn.executemany(
+                    "INSERT INTO person_month (period, name, hours, leave_hours, issues) VALUES (?, ?, ?, ?, ?)",
+                    [(key, name, round(float(totals.get(name, 0.0)), 1), round(float(leave.get(name, 0.0)), 1),
+                      person_issues.get(name, 0)) for name in names])
+                conn.execute(
+                    "INSERT OR REPLACE INTO months (period, source, source_sha256, rows, issues, hours_issues,"
+                    " tag_issues, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, source, source_sha256, len(frame), len(issues),
+                     issue_counts.get("hours_total", 0), issue_counts.get("tag_format", 0),
+                     datetime.now().isoformat(timespec='seconds')))
+        finally:
+            conn.close()
+
+    def update(self, sources, force=False):
+        """월별 원본 export 중 새 달 / 바뀐 달만 처리해서 집계 → 갱신한 (연도, 월) 목록
+
+        Args:
+            sources (dict): {(연도, 월): 원본 export 경로 (.csv / .parquet)}
+            force (bool): True면 해시가 같아도 다시 집계 (처리 규칙/설정을 바꾼 경우)
+        """
+        import pandas as pd
+        from reportbot.pipeline import file_digest
+        from reportbot.downloader import TaskworldDownloader
+        from reportbot.processing import process_export
+        updated = []
+        for period, path in sorted(sources.items()):
+            digest = file_digest(path)
+            if not force and digest == self.source_sha256(period):
+                continue
+            try:
+                processor = TaskworldDownloader(headless=True, connect_slack=False, period=period)
+                config = processor.load_config()
+                if path.endswith(".parquet"):
+                    from reportbot.archive import read_export
+                    df = read_export(path)
+                else:
+                    df = pd.read_csv(path)
+                result = process_export(df, config, period, min_hours=processor.min_required_hours)
+                if not result.ok:
+                    print(f"⚠️ {_period_key(period)} 집계 건너뜀: {result.error}")
+                    continue
+                self.ingest(period, result.frame, result.issues, result.issue_counts, config, digest,
+                            os.path.basename(path), columns=result.columns)
+                updated.append(period)
+            except Exception as e:
+                print(f"⚠️ {_period_key(period)} 집계 실패: {e}")
+        return updated
+
+    def tables(self):
+        """추세 표 목록 → [(제목, 헤더, 행 목록)] (집계 테이블만 조회)"""
+        periods = [row[0] for row in self._query("SELECT period FROM months ORDER BY period")]
+
+        def by_period(sql):
+            """(행 이름, 월, 값) 조회 결과 → 행 이름 × 월 표"""
+            values = {}
+            for name, period, value in self._query(sql):
+                values.setdefault(name, {})[period] = value
+            return [[name] + [values[name].get(p, "-") for p in periods] for name in sorted(values)]
+
+        return [
+            ("월별 요약", ["월", "원본", "처리 행", "이슈", "합산 오류", "태그 오류", "집계 시각"],
+             [list(row) for row in self._query(
+                 "SELECT period, source, rows, issues, hours_issues, tag_issues, updated_at"
+                 " FROM months ORDER BY period")]),
+            ("사람별 총 시간", ["이름"] + periods,
+             by_period("SELECT name, period, hours FROM person_month")),
+            ("사람별 연차 시간", ["이름"] + periods,
+             by_period("SELECT name, period, leave_hours FROM person_month WHERE leave_hours > 0")),
+            ("사람별 이슈 수", ["이름"] + periods,
+             by_period("SELECT name, period, issues FROM person_month WHERE issues > 0")),
+            ("첫 번째 태그별 시간", ["태그"] + periods,
+             by_period("SELECT first_tag, period, ROUND(SUM(hours), 1) FROM person_tag_hours"
+                       " GROUP BY first_tag, period")),
+            ("그룹별 시간 (아트/프로젝트)", ["그룹"] + periods,
+             by_period("SELECT tag_group, period, ROUND(SUM(hours), 1) FROM person_tag_hours"
+                       " GROUP BY tag_group, period")),
+        ]
+
+    def markdown(self):
+        start = time.perf_counter()
+        tables = self.tables()
+        lines = ["# 📊 월별 추세 (집계 기준)", ""]
+        for title, headers, rows in tables:
+            lines += [f"## {title}", "", "| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+            lines += ["| " + " | ".join("-" if v is None else str(v) for v in row) + " |" for row in rows]
+            lines.append("")
+        lines.append(f"_조회 {(time.perf_counter() - start) * 1000:.1f}ms_")
+        return "\n".join(lines)
@@ -0,0 +1,149 @@
+# reportbot/archive.py - 원본 TU export 월별 보관 (압축 Parquet, 월 / 실행 시각 파티션)
+#
+# 전체 / 검증 실행마다 처리 전 원본 export 를 한 번씩 저장 (처리된 4열 CSV는 매일 덮어써지므로 원본 이력 용도):
+#   raw_archive/period=2026-10/run=20261018T070012/export.parquet
+#
+# 열 타입:
+#   Project / Tasklist / Assigned To / Tags / Status — category (사람·태그 이름은 반복이 많아 사전 인코딩)
+#   Task / Time Spent — 문자열 그대로 (Time Spent 는 여러 형식이 섞여 있으므로 원본 유지)
+#   Hours — Time Spent 를 시간 단위 float 로 변환한 값 (분석용, convert_time_to_hours)
+#
+# 읽기:
+#   read_archive(columns=["Assigned To", "Hours"], periods=[(2026, 9), (2026, 10)])  # 필요한 열만, 월별 최신 실행
+#   read_export(path)   # 처리 입력용 — 원본 export 와 같은 열/타입 (backfill 에서 CSV 대신 사용)
+#
+# pyarrow (requirements.txt) 가 없으면 보관/읽기를 건너뛰고 안내만 출력
+import os
+import re
+import glob
+from datetime import datetime
+
+from reportbot.settings import RAW_ARCHIVE_DIR
+
+# 사전(category) 인코딩할 열
+CATEGORY_COLUMNS = ['Project', 'Tasklist', 'Assigned To', 'Tags', 'Status']
+
+# 분석용으로 추가하는 시간 열 (Time Spent → 시간 float)
+HOURS_COLUMN = 'Hours'
+
+# Parquet 압축 방식
+ARCHIVE_COMPRESSION = "zstd"
+
+ARCHIVE_FILE = "export.parquet"
+
+_PARTITION = re.compile(r"period=(\d{4})-(\d{2})[\\/]run=(\d{8}T\d{6})")
+
+
+def parquet_available():
+    """pyarrow 설치 여부 (없으면 안내 출력)"""
+    import importlib.util
+    if importlib.util.find_spec("pyarrow") is not None:
+        return True
+    print("⚠️ pyarrow 미설치 — 원본 export Parquet 보관/읽기 건너뜀 (pip install -r requirements.txt)")
+    return False
+
+
+def archive_path(year, month, run_time, archive_dir=RAW_ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"period={year}-{month:02d}",
+                        f"run={run_time.strftime('%Y%m%dT%H%M%S')}", ARCHIVE_FILE)
+
+
+def typed_export(df):
+    """원본 export DataFrame → 보관용 타입 (category / 문자열 + Hours 열), 입력은 수정하지 않음"""
+    import pandas as pd
+    from reportbot.processing import convert_time_to_hours
+    typed = pd.DataFrame(index=df.index)
+    for column in df.columns:
+        values = df[column]
+        if column in CATEGORY_COLUMNS:
+            typed[column] = values.astype("category")
+        else:
+            typed[column] = values.astype("string")
+    if 'Time Spent' in df.columns:
+        typed[HOURS_COLUMN] = df['Time Spent'].map(convert_time_to_hours).astype("float32")
+    return typed.reset_index(drop=True)
+
+
+def archive_export(csv_file, period, run_time=None, archive_dir=RAW_ARCHIVE_DIR):
+    """원본 export CSV → Parquet 보관 → 저장 경로 (pyarrow 없음 / 실패 시 None)
+
+    Args:
+        csv_file (str): 원본 export CSV
+        period (tuple): (연도, 월) — 파티션 월
+        run_time (datetime): 실행 시각 파티션 (None이면 현재 시각)
+    """
+    if not parquet_available():
+        return None
+    import pandas as pd
+    try:
+        typed = typed_export(pd.read_csv(csv_file, dtype=str))
+        path = archive_path(*period, run_time or datetime.now(), archive_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        typed.to_parquet(path + ".tmp", engine="pyarrow", compression=ARCHIVE_COMPRESSION, index=False)
+        os.replace(path + ".tmp", path)
+    except Exception as e:
+        print(f"⚠️ 원본 export 보관 실패: {e}")
+        return None
+    size_kb = os.path.getsize(path) / 1024
+    print(f"🗄️ 원본 export 보관: {path} ({len(typed)}행, {size_kb:.1f}KB)")
+    return path
+
+
+def list_archives(archive_dir=RAW_ARCHIVE_DIR):
+    """보관된 export 목록 → [((연도, 월), 실행 시각 문자열, 경로)] (월, 실행 순)"""
+    entries = []
+    for path in glob.glob(os.path.join(archive_dir, "period=*", "run=*", ARCHIVE_FILE)):
+        match = _PARTITION.search(path)
+        if match:
+            entries.append(((int(match.group(1)), int(match.group(2))), match.group(3), path))
+    return sorted(entries)
+
+
+def latest_archive(year, month, archive_dir=RAW_ARCHIVE_DIR):
+    """해당 월 마지막 실행의 보관 파일 경로 (없으면 None)"""
+    paths = [path for period, _, path in list_archives(archive_dir) if period == (year, month)]
+    return paths[-1] if paths else None
+
+
+def read_archive(columns=None, periods=None, latest_only=True, archive_dir=RAW_ARCHIVE_DIR):
+    """보관된 export 읽기 → DataFrame (period, run 열 추가) / pyarrow 없거나 보관 파일이 없으면 None
+
+    Args:
+        columns (list): 읽을 열 (None이면 전체) — Parquet 이라 필요한 열만 디스크에서 읽음
+        periods (list): 읽을 (연도, 월) 목록 (None이면 전체 월)
+        latest_only (bool): True면 월마다 마지막 실행만
+    """
+    if not parquet_available():
+        return None
+    import pandas as pd
+    entries = list_archives(archive_dir)
+    if periods is not None:
+        wanted = set(periods)
+        entries = [entry for entry in entries if entry[0] in wanted]
+    if latest_only:
+        entries = list({period: (period, run, path) for period, run, path in entries}.values())
+    if not entries:
+        return None
+
+    frames = []
+    for (year, month), run, path in entries:
+        frame = pd.read_parquet(path, columns=columns, engine="pyarrow")
+        frame["period"] = f"{year}-{month:02d}"
+        frame["run"] = run
+        frames.append(frame)
+    combined = pd.concat(frames, ignore_index=True)
+    # 월마다 사전이 달라 concat 후 object 가 된 열을 다시 category 로
+    for column in CATEGORY_COLUMNS + ["period", "run"]:
+        if column in combined.columns:
+            combined[column] = combined[column].astype("category")
+    return combined
+
+
+def read_export(path):
+    """보관 파일 → 원본 export 와 같은 형태의 DataFrame (문자열 object 열, Hours 제외) — 처리 입력용"""
+    import pandas as pd
+    frame = pd.read_parquet(path, engine="pyarrow")
+    frame = frame.drop(columns=[HOURS_COLUMN], errors="ignore")
+    for column in frame.columns:
+        frame[column] = frame[column].astype(object).where(frame[column].notna())
+    return frame
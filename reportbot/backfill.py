@@ -0,0 +1,146 @@
+# reportbot/backfill.py - 저장된 월별 원본 export를 프로세스 풀에서 재처리/재검증 (backfill 모드)
+import os
+import time
+import glob
+
+from reportbot.downloader import TaskworldDownloader
+from reportbot.settings import BACKFILL_EXPORTS_DIR, BACKFILL_OUTPUT_DIR, RAW_ARCHIVE_DIR
+
+
+def parse_month(value):
+    """월 문자열 → (연도, 월) — '2026-06', '2026-6', '26_6' 형식 지원"""
+    value = value.strip()
+    if '-' in value:
+        year, month = value.split('-', 1)
+    elif '_' in value:
+        year, month = value.split('_', 1)
+    else:
+        raise ValueError(f"월 형식 오류: '{value}' (예: 2026-06)")
+    if not (year.strip().isdigit() and month.strip().isdigit()):
+        raise ValueError(f"월 형식 오류: '{value}' (예: 2026-06)")
+    year, month = int(year), int(month)
+    if year < 100:
+        year += 2000
+    if not 1 <= month <= 12:
+        raise ValueError(f"월 형식 오류: '{value}' (1~12월)")
+    return year, month
+
+
+def iter_months(start, end):
+    """(연도, 월) 범위를 시작~끝 포함으로 순회"""
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def find_month_export(exports_dir, year, month, archive_dir=RAW_ARCHIVE_DIR):
+    """저장된 월별 원본 export 찾기 — <폴더>/<YYYY-MM>.csv 또는 <폴더>/<YYYY-MM>/ 안의 최신 CSV,
+    둘 다 없으면 원본 보관 폴더(reportbot/archive.py)의 해당 월 마지막 Parquet"""
+    key = f"{year}-{month:02d}"
+    single_file = os.path.join(exports_dir, f"{key}.csv")
+    if os.path.exists(single_file):
+        return single_file
+    month_files = glob.glob(os.path.join(exports_dir, key, "*.csv"))
+    if month_files:
+        return max(month_files, key=os.path.getmtime)
+    from reportbot.archive import latest_archive
+    return latest_archive(year, month, archive_dir)
+
+
+def _backfill_month(year, month, export_file, output_dir):
+    """backfill 워커 (프로세스 풀에서 실행) — 해당 월의 기준 시간/개인별 예외 시간으로 처리 + 검증
+
+    Returns:
+        dict: 월별 요약 (summary.csv 한 행)
+    """
+    summary = {
+        "month": f"{year}-{month:02d}",
+        "export": export_file,
+        "output": "",
+        "rows": 0,
+        "issues": 0,
+        "hours_issues": 0,
+        "tag_issues": 0,
+        "status": "",
+    }
+    try:
+        processor = TaskworldDownloader(headless=True, connect_slack=False, period=(year, month))
+        output_file = os.path.join(output_dir, processor.output_filename)
+        result, processed_file = processor.process_file(export_file, output_file=output_file)
+    except Exception as e:
+        summary["status"] = f"오류: {e}"
+        return summary
+
+    if not result.ok:
+        summary["status"] = f"오류: {result.error}"
+        return summary
+    validation_issues = result.issues
+
+    issues_file = os.path.splitext(processed_file)[0] + "_issues.txt"
+    with open(issues_file, 'w', encoding='utf-8') as f:
+        for issue in validation_issues:
+            f.write(f"{issue}\n")
+
+    summary.update({
+        "output": processed_file,
+        "rows": len(result.frame),
+        "issues": len(validation_issues),
+        "hours_issues": result.issue_counts.get("hours_total", 0),
+        "tag_issues": result.issue_counts.get("tag_format", 0),
+        "status": "검증 통과" if not validation_issues else "검증 오류",
+    })
+    return summary
+
+
+def run_backfill(start, end, exports_dir=BACKFILL_EXPORTS_DIR, output_dir=BACKFILL_OUTPUT_DIR, max_workers=None):
+    """여러 달의 저장된 원본 export를 프로세스 풀에서 월별로 처리 + 검증
+
+    - 월별 결과: <output_dir>/26_6.csv, <output_dir>/26_6_issues.txt
+    - 전체 요약: <output_dir>/summary.csv
+
+    Returns:
+        list: 월별 요약 dict 목록 (월 순서, 시작월 > 끝월이면 [])
+    """
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor
+    if start > end:
+        print(f"❌ 시작월이 끝월보다 늦음: {start[0]}-{start[1]:02d} > {end[0]}-{end[1]:02d} "
+              f"(사용법: backfill <시작월 YYYY-MM> <끝월 YYYY-MM> [원본 폴더])")
+        return []
+    start_time = time.time()
+    os.makedirs(output_dir, exist_ok=True)
+    months = list(iter_months(start, end))
+    print(f"📚 backfill 시작: {months[0][0]}-{months[0][1]:02d} ~ {months[-1][0]}-{months[-1][1]:02d} ({len(months)}개월)")
+
+    summaries = {}
+    jobs = []
+    for year, month in months:
+        export_file = find_month_export(exports_dir, year, month)
+        if export_file:
+            jobs.append((year, month, export_file))
+        else:
+            print(f"⚠️ {year}-{month:02d} 원본 export 없음 ({exports_dir})")
+            summaries[(year, month)] = {
+                "month": f"{year}-{month:02d}", "export": "", "output": "", "rows": 0,
+                "issues": 0, "hours_issues": 0, "tag_issues": 0, "status": "원본 없음",
+            }
+
+    if jobs:
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {(year, month): executor.submit(_backfill_month, year, month, export_file, output_dir)
+                       for year, month, export_file in jobs}
+            for key, future in futures.items():
+                summaries[key] = future.result()
+
+    ordered = [summaries[key] for key in months]
+    summary_file = os.path.join(output_dir, "summary.csv")
+    pd.DataFrame(ordered).to_csv(summary_file, index=False, encoding='utf-8-sig')
+
+    print(f"\n📊 backfill 요약 ({time.time() - start_time:.1f}초)")
+    for row in ordered:
+        print(f"  {row['month']}: {row['status']} — {row['rows']}행, 이슈 {row['issues']}개 "
+              f"(합산 {row['hours_issues']}, 태그 {row['tag_issues']})")
+    print(f"📁 요약 파일: {os.path.abspath(summary_file)}")
+    return ordered
@@ -0,0 +1,989 @@
+# reportbot/browsers.py - 브라우저 백엔드 (TU 로그인 / 통계 CSV 내보내기 / 통계 업로드 단계)
+#
+# - ChromeBackend / EdgeBackend: Selenium (tu_downloader.py / tu_downloader_window.py)
+# - HttpBackend: 브라우저 없이 requests 세션으로 같은 단계를 수행
+# - FakeBackend: 네트워크 없이 메모리/로컬 파일로 동작 (벤치마크, 오프라인 전체 흐름 확인용)
+import os
+import re
+import time
+import glob
+import shutil
+from datetime import datetime
+from urllib.parse import urlparse, unquote
+
+from reportbot.settings import DEFAULT_HEADLESS, DEFAULT_BACKEND, DEFAULT_TEAM
+from reportbot.tracing import span, add_metric
+from reportbot.instrument import CommandStats, InstrumentedDriver, WebDriverWait
+
+# 사이트 주소 (로컬 대역 서버로 테스트할 때는 TU_BASE_URL / STATS_BASE_URL 환경변수로 덮어쓰기)
+TU_BASE_URL = "https://tu.aceproject.co.kr"
+STATS_BASE_URL = "https://fbcweb.aceproject.co.kr/stats"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class BrowserBackend:
+    name = None
+    label = None
+
+    def __init__(self, headless=DEFAULT_HEADLESS, download_dir=None, tu_url=None, stats_url=None):
+        """
+        브라우저 백엔드 공통 인터페이스 — 모든 단계는 예외 대신 성공 여부(bool) 또는 결과(None=실패)를 반환
+
+        Args:
+            headless (bool): 브라우저를 숨김 모드로 실행할지 여부 (Selenium 백엔드만 사용)
+            download_dir (str): 내보낸 CSV가 저장될 폴더 (기본: 현재 폴더)
+            tu_url (str): TU 인트라넷 주소 (None이면 TU_BASE_URL 환경변수 → 기본 주소)
+            stats_url (str): 통계 업로드 페이지 주소 (None이면 STATS_BASE_URL 환경변수 → 기본 주소)
+        """
+        self.headless = headless
+        self.download_dir = os.path.abspath(download_dir or "./")
+        self.tu_url = (tu_url or os.getenv("TU_BASE_URL") or TU_BASE_URL).rstrip('/')
+        self.stats_url = (stats_url or os.getenv("STATS_BASE_URL") or STATS_BASE_URL).rstrip('/')
+        self.home_url = None
+        self.command_stats = None   # WebDriver 명령 통계 (Selenium 백엔드만, reportbot/instrument.py)
+
+    def start(self):
+        """백엔드 준비 (드라이버/세션 생성)"""
+        return True
+
+    def login(self, email, password):
+        """TU 인트라넷 로그인"""
+        raise NotImplementedError
+
+    def open_team_stats(self, team_name=DEFAULT_TEAM):
+        """현재 탭에서 팀 통계 페이지로 이동"""
+        raise NotImplementedError
+
+    def new_tab(self):
+        """팀을 하나 더 열 새 탭 준비 (멀티 팀 모드) — 탭 개념이 없는 백엔드는 아무것도 안 함"""
+
+    def prepare_download(self):
+        """내보내기 전 다운로드 폴더의 기존 CSV 경로 set 반환"""
+        return set(glob.glob(os.path.join(self.download_dir, "*.csv")))
+
+    def click_export(self):
+        """현재 팀 통계 페이지에서 내보내기 시작 (다운로드 완료는 기다리지 않음)"""
+        raise NotImplementedError
+
+    def wait_for_exports(self, existing_csvs, expected_count=1, timeout=120):
+        """새 CSV가 expected_count개 생길 때까지 대기 → 파일 목록 (타임아웃 시 받은 것까지만)"""
+        raise NotImplementedError
+
+    def export_csv(self):
+        """통계 CSV 내보내기 → 다운로드된 파일 경로 (실패 시 None)"""
+        try:
+            existing_csvs = self.prepare_download()
+            if not self.click_export():
+                return None
+            new_csvs = self.wait_for_exports(existing_csvs, expected_count=1)
+            return new_csvs[0] if new_csvs else None
+        except Exception as e:
+            print(f"❌ CSV 내보내기 실패: {e}")
+            return None
+
+    def upload_stats(self, csv_file_path):
+        """통계 페이지에 처리된 CSV 업로드"""
+        raise NotImplementedError
+
+    def quit(self):
+        """드라이버/세션 정리 (여러 번 호출해도 안전)"""
+
+
+class SeleniumBackend(BrowserBackend):
+    label = "Selenium"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.driver = None
+        self.wait = None
+        self.command_stats = CommandStats()
+
+    def _options_class(self):
+        raise NotImplementedError
+
+    def _driver_class(self):
+        raise NotImplementedError
+
+    def _sleep(self, seconds):
+        """고정 대기 — 실행 리포트에 누적 대기 시간(selenium_sleep_s) 기록"""
+        add_metric("selenium_sleep_s", seconds)
+        time.sleep(seconds)
+
+    def start(self):
+        """브라우저 드라이버 설정 (GitHub Actions용 최적화)"""
+        try:
+            print(f"🔧 {self.label} 드라이버 설정 시작...")
+            chrome_options = self._options_class()()
+            
+            if self.headless:
+                chrome_options.add_argument("--headless")
+            
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-web-security")
+            chrome_options.add_argument("--allow-running-insecure-content")
+            chrome_options.add_argument("--window-size=1920,1080")
+            
+            # 다운로드 설정
+            prefs = {
+                "download.default_directory": self.download_dir,
+                "download.prompt_for_download": False,
+                "download.directory_upgrade": True,
+                "safebrowsing.enabled": True,
+                "profile.default_content_settings.popups": 0
+            }
+            chrome_options.add_experimental_option("prefs", prefs)
+            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+            
+            self.driver = InstrumentedDriver(self._driver_class()(options=chrome_options), self.command_stats, "tu")
+            self.wait = WebDriverWait(self.driver, 30)
+            
+            print(f"✅ {self.label} 드라이버 설정 완료")
+            
+            if not self.headless:
+                self._sleep(3)
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ 드라이버 설정 실패: {e}")
+            return False
+
+    def new_tab(self):
+        """새 탭을 열고 로그인 후 도착했던 TU 홈으로 이동 (멀티 팀 모드)"""
+        self.driver.switch_to.new_window('tab')
+        self.driver.get(self.home_url or self.tu_url)
+        self._sleep(3)
+
+    def login(self, email, password):
+        """TU 인트라넷 로그인 (이메일 + 비밀번호)"""
+        try:
+            print("🔍 TU 인트라넷 로그인 시작...")
+            
+            self.driver.get(self.tu_url + "/login")
+            self._sleep(3)
+            
+            return self._handle_email_login(email, password)
+                    
+        except Exception as e:
+            print(f"❌ 로그인 전체 프로세스 실패: {e}")
+            return False
+
+    def _handle_email_login(self, email, password):
+        """이메일 + 비밀번호 로그인 처리 (TU 인트라넷)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        try:
+            print("📧 이메일 로그인 시작...")
+            
+            # 이메일 입력 (label이 '이메일'인 input)
+            email_input = self.wait.until(
+                EC.presence_of_element_located((By.XPATH, "//input[@type='email' or @name='email' or @placeholder]"))
+            )
+            email_input.clear()
+            email_input.send_keys(email)
+            print("✅ 이메일 입력 완료")
+            
+            # 비밀번호 입력 (label이 '비밀번호'인 input)
+            password_input = self.wait.until(
+                EC.presence_of_element_located((By.XPATH, "//input[@type='password' or @name='password']"))
+            )
+            password_input.clear()
+            password_input.send_keys(password)
+            print("✅ 비밀번호 입력 완료")
+            
+            # 로그인 버튼 클릭 — 구글 로그인 버튼과 혼동되지 않도록 정확히 지정
+            # submit 타입 버튼 우선, 없으면 비밀번호 입력창 이후에 오는 로그인 버튼
+            login_btn = None
+            login_btn_selectors = [
+                "//button[@type='submit' and not(contains(text(),'Google'))]",
+                "//form//button[contains(text(),'로그인')]",
+                "//button[text()='로그인']",
+                "//input[@type='submit' and not(contains(@value,'Google'))]",
+            ]
+            for selector in login_btn_selectors:
+                with span("probe", step="login_btn", selector=selector) as probe:
+                    try:
+                        login_btn = self.wait.until(
+                            EC.element_to_be_clickable((By.XPATH, selector))
+                        )
+                        print(f"✅ 로그인 버튼 발견: '{login_btn.text.strip()}'")
+                        break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not login_btn:
+                print("❌ 로그인 버튼을 찾지 못함")
+                return False
+
+            login_btn.click()
+            print("✅ 로그인 버튼 클릭")
+            
+            # 로그인 완료 대기 — TU 도메인(tu_url)으로 돌아올 때까지
+            # 1단계: 로그인 페이지에서 벗어날 때까지 대기
+            print("⏳ 로그인 페이지 이탈 대기...")
+            with span("login.wait_redirect", timeout=30):
+                WebDriverWait(self.driver, 30).until(
+                    lambda driver: "login" not in driver.current_url
+                )
+            print(f"  → 현재 URL: {self.driver.current_url}")
+
+            # 2단계: 구글 OAuth 중간 페이지를 거칠 수 있으므로 TU 홈까지 대기
+            print("⏳ TU 홈 페이지 도착 대기 (최대 60초)...")
+            tu_host = urlparse(self.tu_url).netloc
+            with span("login.wait_home", timeout=60):
+                WebDriverWait(self.driver, 60).until(
+                    lambda driver: tu_host in driver.current_url
+                                   and "login" not in driver.current_url
+                )
+            self._sleep(3)
+            print(f"  → TU 홈 도착: {self.driver.current_url}")
+            
+            self.home_url = self.driver.current_url
+            print("✅ TU 인트라넷 로그인 완료!")
+            return True
+            
+        except Exception as e:
+            print(f"❌ 이메일 로그인 실패: {e}")
+            return False
+
+    def _add_artroom_team(self, team_name=DEFAULT_TEAM):
+        """사이드바 팀 섹션에서 + 버튼 클릭 → 팀 추가 (기본: 아트실)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        try:
+            # 팀 섹션 안에서만 정확히 팀 이름 텍스트 확인
+            # (프로젝트의 '아트실 5월' 등과 혼동 방지)
+            try:
+                # '팀' 텍스트 이후에 오는 요소 중 text()가 정확히 팀 이름인 것만
+                team_artroom = self.driver.find_elements(
+                    By.XPATH,
+                    f"//*[text()='팀']/following::*[text()='{team_name}']"
+                )
+                visible = [el for el in team_artroom if el.is_displayed() and el.text.strip() == team_name]
+                if visible:
+                    print(f"✅ {team_name} 팀이 이미 사이드바 팀 섹션에 존재함, 추가 생략")
+                    return True
+                else:
+                    print(f"ℹ️ 팀 섹션에 {team_name} 없음, + 버튼으로 추가 시작")
+            except Exception as e:
+                print(f"ℹ️ 팀 섹션 확인 중 오류: {e}, + 버튼으로 추가 시작")
+
+            print("➕ 팀 섹션 + 버튼 탐색 중...")
+
+            # + 버튼은 SVG 아이콘 (class="w-3.5 h-3.5")을 포함한 버튼
+            plus_selectors = [
+                # SVG 클래스로 직접 찾고 부모 버튼 클릭
+                "//*[text()='팀']/following::*[.//*[contains(@class,'w-3.5')]][1]",
+                "//*[text()='팀']/following::button[.//*[contains(@class,'w-3.5')]][1]",
+                "//*[text()='팀']/following::button[1]",
+                "//*[text()='팀']/parent::*//button",
+                "//*[text()='팀']/parent::*/button",
+                # SVG 부모 요소 직접
+                "//svg[contains(@class,'w-3.5')]/parent::button",
+                "//svg[contains(@class,'w-3.5')]/parent::*[@role='button']",
+                "//svg[contains(@class,'w-3.5')]/parent::*",
+            ]
+
+            plus_btn = None
+            for selector in plus_selectors:
+                with span("probe", step="plus", selector=selector) as probe:
+                    try:
+                        els = self.driver.find_elements(By.XPATH, selector)
+                        for el in els:
+                            if el.is_displayed():
+                                print(f"✅ 팀 + 버튼 발견: tag={el.tag_name} class='{el.get_attribute('class')}'")
+                                plus_btn = el
+                                break
+                        if plus_btn:
+                            break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not plus_btn:
+                print("❌ 팀 + 버튼을 찾지 못함")
+                return False
+
+            try:
+                plus_btn.click()
+            except:
+                self.driver.execute_script("arguments[0].click();", plus_btn)
+
+            self._sleep(2)
+            print("✅ 팀 + 버튼 클릭 완료, 팀 검색창 대기...")
+
+            # 팀 검색 입력창 대기 후 팀 이름 입력
+            search_input = None
+            search_selectors = [
+                "//input[@placeholder]",
+                "//input[@type='text']",
+                "//input[@type='search']",
+                "//input[contains(@class,'search') or contains(@class,'input')]",
+            ]
+            for selector in search_selectors:
+                with span("probe", step="search", selector=selector) as probe:
+                    try:
+                        search_input = WebDriverWait(self.driver, 8).until(
+                            EC.presence_of_element_located((By.XPATH, selector))
+                        )
+                        if search_input.is_displayed():
+                            break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not search_input:
+                print("❌ 팀 검색 입력창을 찾지 못함")
+                return False
+
+            search_input.clear()
+            search_input.send_keys(team_name)
+            print(f"✅ '{team_name}' 입력 완료")
+            self._sleep(2)
+
+            # 검색 결과에서 팀 항목 클릭 ('아트실 5월' 같은 프로젝트 제외)
+            result_selectors = [
+                f"//*[text()='{team_name}']",
+                f"//li[contains(text(),'{team_name}')]",
+                f"//div[contains(text(),'{team_name}')]",
+                f"//*[contains(text(),'{team_name}') and not(contains(text(),'{team_name} '))]",
+            ]
+            for selector in result_selectors:
+                with span("probe", step="result", selector=selector) as probe:
+                    try:
+                        result_item = WebDriverWait(self.driver, 5).until(
+                            EC.element_to_be_clickable((By.XPATH, selector))
+                        )
+                        try:
+                            result_item.click()
+                        except:
+                            self.driver.execute_script("arguments[0].click();", result_item)
+                        print(f"✅ '{team_name}' 팀 선택 완료")
+                        self._sleep(2)
+                        return True
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            print(f"❌ 검색 결과에서 '{team_name}'을 찾지 못함")
+            return False
+
+        except Exception as e:
+            print(f"❌ {team_name} 팀 추가 실패: {e}")
+            return False
+
+    def open_team_stats(self, team_name=DEFAULT_TEAM):
+        """TU 인트라넷: 사이드바에 팀 추가 후 클릭 → 통계 탭 이동 (기본: 아트실)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        try:
+            print(f"📂 '{team_name}' 사이드바 메뉴 찾기...")
+
+            # 팀 추가 (없을 경우 + 버튼으로 추가)
+            self._add_artroom_team(team_name)
+            self._sleep(2)
+
+            max_attempts = 3
+            for attempt in range(1, max_attempts + 1):
+                print(f"\n🔄 시도 {attempt}/{max_attempts}")
+                
+                # 사이드바에서 팀 클릭 — 정확히 팀 이름 텍스트만 매칭
+                artroom_selectors = [
+                    f"//*[text()='{team_name}']",
+                    f"//a[text()='{team_name}']",
+                    f"//span[text()='{team_name}']",
+                    f"//div[text()='{team_name}']",
+                    f"//*[normalize-space(text())='{team_name}']",
+                ]
+                
+                clicked = False
+                for selector in artroom_selectors:
+                    with span("probe", step="artroom", selector=selector) as probe:
+                        try:
+                            els = self.driver.find_elements(By.XPATH, selector)
+                            for el in els:
+                                # 텍스트가 정확히 팀 이름인지 재확인 (아트실5월 등 제외)
+                                if el.text.strip() == team_name and el.is_displayed():
+                                    try:
+                                        el.click()
+                                    except:
+                                        self.driver.execute_script("arguments[0].click();", el)
+                                    print(f"✅ '{team_name}' 클릭 성공")
+                                    clicked = True
+                                    self._sleep(3)
+                                    break
+                            if clicked:
+                                break
+                        except:
+                            probe.fail("not_found")
+                            continue
+                
+                if not clicked:
+                    print(f"❌ 시도 {attempt}: '{team_name}' 메뉴를 찾지 못함")
+                    if attempt < max_attempts:
+                        self.driver.refresh()
+                        self._sleep(3)
+                    continue
+                
+                # '통계' 탭 클릭
+                stats_selectors = [
+                    "//button[contains(text(), '통계')]",
+                    "//span[contains(text(), '통계')]",
+                    "//a[contains(text(), '통계')]",
+                    "//*[text()='통계']",
+                    "//*[contains(@class, 'tab') and contains(text(), '통계')]",
+                ]
+                
+                stats_clicked = False
+                for selector in stats_selectors:
+                    with span("probe", step="stats", selector=selector) as probe:
+                        try:
+                            el = WebDriverWait(self.driver, 8).until(
+                                EC.element_to_be_clickable((By.XPATH, selector))
+                            )
+                            try:
+                                el.click()
+                            except:
+                                self.driver.execute_script("arguments[0].click();", el)
+                            print("✅ '통계' 탭 클릭 성공")
+                            stats_clicked = True
+                            self._sleep(3)
+                            break
+                        except:
+                            probe.fail("not_found")
+                            continue
+                
+                if stats_clicked:
+                    print(f"✅ {team_name} 통계 페이지 접속 완료!")
+                    return True
+                
+                print(f"❌ 시도 {attempt}: '통계' 탭을 찾지 못함")
+                if attempt < max_attempts:
+                    self.driver.refresh()
+                    self._sleep(3)
+            
+            print("❌ 모든 시도 실패")
+            return False
+            
+        except Exception as e:
+            print(f"❌ 워크스페이스 접속 중 오류: {e}")
+            return False
+
+    def prepare_download(self):
+        """다운로드 전 기존 CSV 파일 목록 저장 및 정리 → 기존 CSV 경로 set 반환"""
+        export_files = glob.glob(os.path.join(self.download_dir, "export-projects*.csv"))
+        for file in export_files:
+            try:
+                os.remove(file)
+            except:
+                pass
+        
+        return set(glob.glob(os.path.join(self.download_dir, "*.csv")))
+
+    def click_export(self):
+        """현재 탭의 통계 페이지에서 'Taskworld 내보내기' 버튼 클릭 (다운로드 완료는 기다리지 않음)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        # 'Taskworld 내보내기' 버튼 찾기
+        print("🔍 'Taskworld 내보내기' 버튼 탐색 중...")
+        tw_export_selectors = [
+            "//button[contains(text(), 'Taskworld 내보내기')]",
+            "//a[contains(text(), 'Taskworld 내보내기')]",
+            "//span[contains(text(), 'Taskworld 내보내기')]",
+            "//*[contains(text(), 'Taskworld 내보내기')]",
+            "//button[contains(text(), 'Taskworld')]",
+            "//*[contains(text(), 'Taskworld') and contains(text(), '내보내기')]",
+        ]
+        
+        export_btn = None
+        for selector in tw_export_selectors:
+            with span("probe", step="tw_export", selector=selector) as probe:
+                try:
+                    export_btn = WebDriverWait(self.driver, 8).until(
+                        EC.element_to_be_clickable((By.XPATH, selector))
+                    )
+                    print(f"✅ 'Taskworld 내보내기' 버튼 발견: {selector}")
+                    break
+                except:
+                    probe.fail("not_found")
+                    continue
+        
+        if not export_btn:
+            print("❌ 'Taskworld 내보내기' 버튼을 찾지 못함")
+            return False
+        
+        # 1차: 일반 클릭
+        try:
+            export_btn.click()
+            print("✅ 버튼 클릭 (일반)")
+        except:
+            pass
+        
+        self._sleep(2)
+        
+        # 2차: JavaScript 강제 클릭
+        try:
+            self.driver.execute_script("arguments[0].click();", export_btn)
+            print("✅ 버튼 클릭 (JavaScript)")
+        except:
+            pass
+        
+        self._sleep(2)
+        return True
+
+    def wait_for_exports(self, existing_csvs, expected_count=1, timeout=120):
+        """새 CSV가 expected_count개 생길 때까지 대기 → 생성 시각 순 파일 목록 반환 (타임아웃 시 받은 것까지만)
+
+        ~/Downloads 에 받아진 export 는 download_dir 로 옮긴 뒤 그 절대 경로로 기록 (다음 확인 때 다시 세지 않음)
+        """
+        print("⏳ CSV 다운로드 대기 중...")
+        check_interval = 2
+        found = []
+        seen = set(existing_csvs)
+        
+        for i in range(0, timeout, check_interval):
+            # 현재 폴더에서 새 CSV 확인
+            current_csvs = set(glob.glob(os.path.join(self.download_dir, "*.csv")))
+            new_csvs = current_csvs - seen
+            
+            for new_file in sorted(new_csvs, key=os.path.getctime):
+                if os.path.getsize(new_file) > 0:
+                    print(f"✅ CSV 다운로드 완료: {os.path.basename(new_file)}")
+                    found.append(new_file)
+                    seen.add(new_file)
+            
+            # Downloads 폴더도 확인
+            downloads_pattern = os.path.expanduser("~/Downloads/export-projects*.csv")
+            downloads_csvs = glob.glob(downloads_pattern)
+            for latest_download in sorted(downloads_csvs, key=os.path.getctime):
+                if time.time() - os.path.getmtime(latest_download) < 600:
+                    local_file = os.path.join(self.download_dir, os.path.basename(latest_download))
+                    if local_file in found:
+                        continue  # 이전 확인 때 옮겼는데 원본 삭제에 실패한 파일
+                    shutil.copy(latest_download, local_file)
+                    try:
+                        os.remove(latest_download)
+                    except:
+                        pass
+                    print(f"✅ CSV 다운로드 완료 (Downloads 폴더): {os.path.basename(local_file)}")
+                    found.append(local_file)
+                    seen.add(local_file)
+            
+            if len(found) >= expected_count:
+                return found[:expected_count]
+            
+            # .crdownload 확인 (다운로드 중)
+            if glob.glob(os.path.join(self.download_dir, "*.crdownload")):
+                pass  # 아직 다운로드 중
+            elif i % 20 == 0 and i > 0:
+                print(f"  ⏳ {i}초 경과, 계속 대기 중... ({len(found)}/{expected_count})")
+            
+            self._sleep(check_interval)
+        
+        print(f"❌ CSV 다운로드 타임아웃 ({timeout}초 초과, {len(found)}/{expected_count}개 수신)")
+        return found
+
+    def export_csv(self):
+        """TU 인트라넷 통계 페이지에서 'Taskworld 내보내기' 버튼 클릭 → CSV 다운로드"""
+        try:
+            existing_csvs = self.prepare_download()
+            
+            self._sleep(2)
+            
+            if not self.click_export():
+                return None
+            
+            new_csvs = self.wait_for_exports(existing_csvs, expected_count=1)
+            return new_csvs[0] if new_csvs else None
+            
+        except Exception as e:
+            print(f"❌ CSV 내보내기 실패: {e}")
+            return None
+
+    def _dump_debug_info(self, driver, label):
+        """실패 시 현재 URL/스크린샷/페이지 소스 일부를 남겨 원인 구분"""
+        try:
+            print(f"  🔎 [DEBUG:{label}] 현재 URL: {driver.current_url}")
+            screenshot_path = f"debug_{label}.png"
+            driver.save_screenshot(screenshot_path)
+            print(f"  🔎 [DEBUG:{label}] 스크린샷 저장: {os.path.abspath(screenshot_path)}")
+
+            source = driver.page_source
+            err_match = re.search(r'ERR_[A-Z_]+', source)
+            if err_match:
+                print(f"  🔎 [DEBUG:{label}] ⚠️ 크롬 네트워크 에러 감지: {err_match.group()}")
+
+            page_snippet = source[:4000].replace("\n", " ")
+            print(f"  🔎 [DEBUG:{label}] page_source (최대 4000자): {page_snippet}")
+            print(f"  🔎 [DEBUG:{label}] page_source 총 길이: {len(source)}자")
+        except Exception as e:
+            print(f"  🔎 [DEBUG:{label}] 디버그 정보 수집 실패: {e}")
+
+    def upload_stats(self, csv_file_path):
+        """fbcweb.aceproject.co.kr/stats/ 에 CSV 파일 업로드 (Selenium, Basic Auth 불필요)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        art_driver = None
+        try:
+            print("🌐 통계 업로드 시작 (Selenium)...")
+
+            art_options = self._options_class()()
+            if self.headless:
+                art_options.add_argument("--headless")
+            art_options.add_argument("--no-sandbox")
+            art_options.add_argument("--disable-dev-shm-usage")
+            art_options.add_argument("--disable-gpu")
+            art_options.add_argument("--window-size=1920,1080")
+            art_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+            art_driver = InstrumentedDriver(self._driver_class()(options=art_options), self.command_stats, "art")
+
+            # 1단계: /stats/ 페이지 이동 (Basic Auth 해제됨, 인증 정보 불필요)
+            art_driver.get(self.stats_url + "/")
+            self._sleep(3)
+            print(f"  ✅ 페이지 이동 완료 (현재 URL: {art_driver.current_url})")
+
+            # 2단계: 'CSV 업로드' 링크 클릭
+            csv_upload_selectors = [
+                "//a[@href='upload']",
+                "//a[contains(@href, 'upload')]",
+                "//*[contains(text(), 'CSV 업로드')]",
+            ]
+            csv_btn = None
+            for selector in csv_upload_selectors:
+                with span("probe", step="csv_upload", selector=selector) as probe:
+                    try:
+                        csv_btn = WebDriverWait(art_driver, 8).until(
+                            EC.element_to_be_clickable((By.XPATH, selector))
+                        )
+                        break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not csv_btn:
+                print("  ❌ CSV 업로드 링크를 찾지 못함")
+                self._dump_debug_info(art_driver, "csv_btn_not_found")
+                return False
+
+            try:
+                csv_btn.click()
+            except:
+                art_driver.execute_script("arguments[0].click();", csv_btn)
+            self._sleep(2)
+            print(f"  ✅ CSV 업로드 링크 클릭 (현재 URL: {art_driver.current_url})")
+
+            # 3단계: 파일 input에 파일 경로 전달
+            abs_path = os.path.abspath(csv_file_path)
+            file_input_selectors = [
+                "//input[@id='fileInput']",
+                "//input[@type='file']",
+            ]
+            file_input = None
+            for selector in file_input_selectors:
+                with span("probe", step="file_input", selector=selector) as probe:
+                    try:
+                        file_input = WebDriverWait(art_driver, 8).until(
+                            EC.presence_of_element_located((By.XPATH, selector))
+                        )
+                        break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not file_input:
+                print("  ❌ 파일 input 요소를 찾지 못함")
+                self._dump_debug_info(art_driver, "file_input_not_found")
+                return False
+
+            art_driver.execute_script("arguments[0].style.display = 'block';", file_input)
+            file_input.send_keys(abs_path)
+            self._sleep(2)
+            print(f"  ✅ 파일 선택 완료: {os.path.basename(abs_path)}")
+
+            # 4단계: 업로드 버튼 클릭 (파일 선택 후 JS가 주기를 자동 감지해야 disabled가 풀림)
+            upload_btn_selectors = [
+                "//button[@id='submitBtn']",
+                "//button[contains(text(), '업로드')]",
+            ]
+            upload_btn = None
+            for selector in upload_btn_selectors:
+                with span("probe", step="upload_btn", selector=selector) as probe:
+                    try:
+                        upload_btn = WebDriverWait(art_driver, 10).until(
+                            EC.element_to_be_clickable((By.XPATH, selector))
+                        )
+                        break
+                    except:
+                        probe.fail("not_found")
+                        continue
+
+            if not upload_btn:
+                try:
+                    disabled_btn = art_driver.find_element(By.XPATH, "//button[@id='submitBtn']")
+                    print(f"  ❌ 업로드 버튼이 비활성화 상태로 남아있음, disabled={disabled_btn.get_attribute('disabled')}")
+                except:
+                    print("  ❌ 업로드 버튼을 찾지 못함")
+                self._dump_debug_info(art_driver, "upload_btn_not_found")
+                return False
+
+            try:
+                upload_btn.click()
+            except:
+                art_driver.execute_script("arguments[0].click();", upload_btn)
+            self._sleep(3)
+            print(f"  ✅ 업로드 버튼 클릭 완료 (현재 URL: {art_driver.current_url})")
+
+            # 6단계: 실제로 업로드가 반영됐는지 결과 페이지 내용으로 확인
+            # (클릭 자체는 예외 없이 되어도 서버/네트워크 단에서 간헐적으로 막히는 경우가 있어
+            #  URL 도달 여부만으로는 성공 여부를 신뢰할 수 없음)
+            if "업로드 완료" in art_driver.page_source:
+                print("✅ 통계 업로드 완료! (결과 페이지에서 성공 확인됨)")
+                return True
+            else:
+                print("❌ 통계 업로드 실패 — 클릭은 됐지만 결과 페이지에서 성공 문구를 확인 못함")
+                self._dump_debug_info(art_driver, "upload_not_confirmed")
+                return False
+
+        except Exception as e:
+            import traceback
+            print(f"❌ 통계 업로드 실패: {e}")
+            print(traceback.format_exc())
+            return False
+
+        finally:
+            if art_driver:
+                art_driver.quit()
+
+    def quit(self):
+        """드라이버 종료"""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+
+class ChromeBackend(SeleniumBackend):
+    name = "chrome"
+    label = "Chrome"
+
+    def _options_class(self):
+        from selenium.webdriver.chrome.options import Options
+        return Options
+
+    def _driver_class(self):
+        from selenium import webdriver
+        return webdriver.Chrome
+
+
+class EdgeBackend(SeleniumBackend):
+    name = "edge"
+    label = "Edge"
+
+    def _options_class(self):
+        from selenium.webdriver.edge.options import Options
+        return Options
+
+    def _driver_class(self):
+        from selenium import webdriver
+        return webdriver.Edge
+
+
+class HttpBackend(BrowserBackend):
+    name = "http"
+    label = "HTTP"
+
+    # TU 통계 CSV 직접 다운로드 경로 / 통계 업로드 폼 필드 이름 (환경변수로 변경 가능)
+    EXPORT_PATH = "/api/stats/export"
+    UPLOAD_FIELD = "file"
+
+    def __init__(self, *args, **kwargs):
+        """
+        브라우저 없이 requests 세션으로 동작하는 백엔드
+
+        - 로그인: {tu_url}/login 에 email/password 폼 전송 (세션 쿠키 유지)
+        - 내보내기: {tu_url}{TU_EXPORT_PATH}?team=<팀명> 에서 CSV 직접 다운로드
+        - 업로드: {stats_url}/upload 에 multipart 전송 후 '업로드 완료' 문구 확인
+        """
+        super().__init__(*args, **kwargs)
+        self.export_path = os.getenv("TU_EXPORT_PATH", self.EXPORT_PATH)
+        self.upload_field = os.getenv("STATS_UPLOAD_FIELD", self.UPLOAD_FIELD)
+        self.session = None
+        self.team_name = DEFAULT_TEAM
+        self._downloaded = []
+
+    def start(self):
+        import requests
+        print("🔧 HTTP 세션 설정...")
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        return True
+
+    def login(self, email, password):
+        try:
+            print("🔍 TU 인트라넷 로그인 시작 (HTTP)...")
+            response = self.session.post(self.tu_url + "/login", data={"email": email, "password": password}, timeout=30)
+            if response.status_code >= 400 or "login" in urlparse(response.url).path:
+                print(f"❌ 로그인 실패 (HTTP {response.status_code}, URL: {response.url})")
+                return False
+            self.home_url = response.url
+            print("✅ TU 인트라넷 로그인 완료!")
+            return True
+        except Exception as e:
+            print(f"❌ 로그인 전체 프로세스 실패: {e}")
+            return False
+
+    def open_team_stats(self, team_name=DEFAULT_TEAM):
+        self.team_name = team_name
+        print(f"✅ {team_name} 통계 대상 설정 (HTTP)")
+        return True
+
+    def click_export(self):
+        try:
+            response = self.session.get(self.tu_url + self.export_path, params={"team": self.team_name}, timeout=120)
+            if response.status_code != 200 or not response.content:
+                print(f"❌ CSV 내보내기 실패 (HTTP {response.status_code})")
+                return False
+
+            filename = self._filename_from_response(response)
+            path = os.path.join(self.download_dir, filename)
+            with open(path, 'wb') as f:
+                f.write(response.content)
+            self._downloaded.append(path)
+            print(f"✅ CSV 다운로드 완료: {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ CSV 내보내기 실패: {e}")
+            return False
+
+    def _filename_from_response(self, response):
+        """Content-Disposition 파일명 (없으면 export-<팀명>-<시각>.csv)"""
+        disposition = response.headers.get("Content-Disposition", "")
+        match = re.search(r"filename\*=UTF-8''([^;]+)", disposition) or re.search(r'filename="?([^";]+)"?', disposition)
+        if match:
+            return os.path.basename(unquote(match.group(1)))
+        return f"export-{self.team_name}-{datetime.now().strftime('%Y%m%d%H%M%S%f')}.csv"
+
+    def wait_for_exports(self, existing_csvs, expected_count=1, timeout=120):
+        # 다운로드는 click_export에서 동기적으로 끝나므로 받은 파일만 돌려줌
+        found = [path for path in self._downloaded if path not in existing_csvs]
+        if len(found) < expected_count:
+            print(f"❌ CSV 다운로드 부족 ({len(found)}/{expected_count}개 수신)")
+        return found[:expected_count]
+
+    def upload_stats(self, csv_file_path):
+        import requests
+        try:
+            print("🌐 통계 업로드 시작 (HTTP)...")
+            session = self.session or requests.Session()
+            with open(csv_file_path, 'rb') as f:
+                response = session.post(
+                    self.stats_url + "/upload",
+                    files={self.upload_field: (os.path.basename(csv_file_path), f, "text/csv")},
+                    timeout=60,
+                )
+            if "업로드 완료" in response.text:
+                print("✅ 통계 업로드 완료! (결과 페이지에서 성공 확인됨)")
+                return True
+            print(f"❌ 통계 업로드 실패 — 결과 페이지에서 성공 문구를 확인 못함 (HTTP {response.status_code})")
+            return False
+        except Exception as e:
+            print(f"❌ 통계 업로드 실패: {e}")
+            return False
+
+    def quit(self):
+        if self.session:
+            self.session.close()
+            self.session = None
+
+
+class FakeBackend(BrowserBackend):
+    name = "fake"
+    label = "Fake"
+
+    def __init__(self, *args, export_source=None, latency=0.0, fail_steps=(), **kwargs):
+        """
+        네트워크/브라우저 없이 동작하는 백엔드 (벤치마크, 오프라인 전체 흐름 확인용)
+
+        Args:
+            export_source: 내보내기 결과로 쓸 CSV 경로, {팀명: 경로} dict, 또는 팀명 → CSV 경로를 돌려주는 함수
+                           (None이면 FAKE_EXPORT_CSV 환경변수)
+            latency (float): 단계마다 추가할 인위적 지연 (초)
+            fail_steps (iterable): 실패시킬 단계 이름 ('start', 'login', 'open_team_stats', 'export', 'upload')
+        """
+        super().__init__(*args, **kwargs)
+        self.export_source = export_source or os.getenv("FAKE_EXPORT_CSV")
+        self.latency = latency
+        self.fail_steps = set(fail_steps)
+        self.team_name = DEFAULT_TEAM
+        self.calls = []       # 호출된 단계 기록
+        self.uploads = []     # 업로드된 파일 경로
+        self._downloaded = []
+
+    def _step(self, name):
+        self.calls.append(name)
+        if self.latency:
+            time.sleep(self.latency)
+        return name not in self.fail_steps
+
+    def _source_for(self, team_name):
+        if callable(self.export_source):
+            return self.export_source(team_name)
+        if isinstance(self.export_source, dict):
+            return self.export_source.get(team_name)
+        return self.export_source
+
+    def start(self):
+        return self._step("start")
+
+    def login(self, email, password):
+        ok = self._step("login")
+        if ok:
+            self.home_url = self.tu_url + "/"
+        return ok
+
+    def open_team_stats(self, team_name=DEFAULT_TEAM):
+        self.team_name = team_name
+        return self._step("open_team_stats")
+
+    def click_export(self):
+        if not self._step("export"):
+            return False
+        source = self._source_for(self.team_name)
+        if not source or not os.path.exists(source):
+            print(f"❌ [Fake] {self.team_name} 내보내기 원본 없음: {source}")
+            return False
+        stamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+        path = os.path.join(self.download_dir, f"export-{self.team_name}-fake-{stamp}.csv")
+        shutil.copy(source, path)
+        self._downloaded.append(path)
+        return True
+
+    def wait_for_exports(self, existing_csvs, expected_count=1, timeout=120):
+        found = [path for path in self._downloaded if path not in existing_csvs]
+        return found[:expected_count]
+
+    def upload_stats(self, csv_file_path):
+        if not self._step("upload"):
+            return False
+        self.uploads.append(os.path.abspath(csv_file_path))
+        return True
+
+
+BACKENDS = {
+    ChromeBackend.name: ChromeBackend,
+    EdgeBackend.name: EdgeBackend,
+    HttpBackend.name: HttpBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def make_backend(backend=DEFAULT_BACKEND, **kwargs):
+    """백엔드 이름(chrome/edge/http/fake) 또는 인스턴스 → BrowserBackend 인스턴스"""
+    if isinstance(backend, BrowserBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 브라우저 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](**kwargs)
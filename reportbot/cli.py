@@ -0,0 +1,253 @@
+# reportbot/cli.py - 실행 모드 분기 (tu_downloader.py / tu_downloader_window.py 공용 진입점)
+#
+# 모드: full(기본) / validation / process <csv> [YYYY-MM] / backfill <시작월> <끝월> [폴더] / teams <팀...> / history
+#       / analytics [--force]
+import os
+import time
+
+from reportbot.browsers import BACKENDS
+from reportbot.downloader import TaskworldDownloader
+from reportbot.backfill import parse_month, run_backfill
+from reportbot.tracing import RUN_REPORTS_DIR
+from reportbot.settings import (
+    MONTHLY_HOURS, current_period, output_filename_for, ConfigFileError,
+    BACKFILL_EXPORTS_DIR, DEFAULT_TEAM, DEFAULT_HEADLESS, DEFAULT_BACKEND, DISABLE_SLACK_NOTIFICATIONS,
+    VALIDATION_WORKERS,
+)
+
+
+def make_downloader(**options):
+    """TaskworldDownloader 생성 — 대상 월 기준 시간(MONTHLY_HOURS)이 없으면 안내 출력 후 None"""
+    try:
+        return TaskworldDownloader(**options)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+
+
+def run_process_only(csv_file, period=None, workers=VALIDATION_WORKERS):
+    """오프라인 처리 모드: 로컬 export CSV를 브라우저/슬랙/업로드 없이 처리 + 검증만 실행
+
+    태그 설정 파일 수정 후 결과를 빠르게 확인하는 용도
+
+    Returns:
+        list: 검증 이슈 목록 (처리 실패 시 None)
+    """
+    start = time.perf_counter()
+    processor = make_downloader(headless=True, connect_slack=False, period=period, workers=workers)
+    if processor is None:
+        return None
+    init_done = time.perf_counter()
+
+    result_df, _, processed_file, validation_issues = processor.process_csv(csv_file)
+    process_done = time.perf_counter()
+
+    if result_df is None:
+        print(f"\n❌ 처리 실패: {processed_file}")
+        return None
+
+    if validation_issues:
+        print(f"\n⚠️ 검증 이슈 {len(validation_issues)}개 발견:")
+        for issue in validation_issues:
+            print(f"  - {issue}")
+    else:
+        print("\n✅ 검증 이슈 없음")
+
+    print(f"\n📁 처리된 파일: {os.path.abspath(processed_file)} ({len(result_df)}행)")
+    print(f"⏱️ 초기화 {(init_done - start) * 1000:.0f}ms / 처리+검증 {(process_done - init_done) * 1000:.0f}ms "
+          f"/ 전체 {(process_done - start) * 1000:.0f}ms")
+    return validation_issues
+
+
+def main(argv, backend=DEFAULT_BACKEND, disable_slack_notifications=DISABLE_SLACK_NOTIFICATIONS,
+         script_dir=None, prog="tu_downloader.py"):
+    """
+    명령행 실행 → 종료 코드 (0: 성공, 1: 실패)
+
+    Args:
+        argv (list): 명령행 인자 (sys.argv[1:])
+        backend (str): 기본 브라우저 백엔드 (--backend=... 로 덮어쓰기)
+        disable_slack_notifications (bool): True면 슬랙 전송 없이 콘솔에만 출력
+        script_dir (str): 작업 폴더로 고정할 실행 스크립트 폴더
+        prog (str): 사용법 안내에 표시할 스크립트 이름
+    """
+    try:
+        return _main(argv, backend, disable_slack_notifications, script_dir, prog)
+    except ConfigFileError as e:
+        # 설정 파일 오류는 라이브러리 쪽에서 예외로만 알리고 종료 코드는 여기서 결정
+        print(f"❌ 설정 파일 오류: {e}")
+        return 1
+
+
+def _main(argv, backend, disable_slack_notifications, script_dir, prog):
+    # 실행 모드 확인 (파일/폴더 인자는 작업 폴더를 바꾸기 전에 절대경로로 변환)
+    args = [a for a in argv if not a.startswith("--")]
+    flags = {a for a in argv if a.startswith("--")}
+    mode = args[0] if args else "full"
+    args = args[:1] + [os.path.abspath(a) if os.path.exists(a) else a for a in args[1:]]
+    
+    # 실행 위치(작업 스케줄러/cron 등)와 무관하게 항상 실행 스크립트(tu_downloader.py 등)가 있는 폴더를 기준으로 동작하도록 고정
+    # (안 그러면 상대경로로 저장되는 CSV/디버그 스크린샷이 스케줄러의 "시작 위치" 설정에 따라 엉뚱한 폴더에 저장될 수 있음)
+    if script_dir:
+        os.chdir(script_dir)
+    
+    # .env 파일 로드
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # 브라우저 백엔드: --backend=chrome|edge|http|fake (기본은 실행 스크립트별 값)
+    for flag in flags:
+        if flag.startswith("--backend="):
+            backend = flag.split("=", 1)[1]
+    if backend not in BACKENDS:
+        print(f"❌ 알 수 없는 브라우저 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+        return 1
+    workers = VALIDATION_WORKERS
+    for flag in flags:
+        if flag.startswith("--workers="):
+            value = flag.split("=", 1)[1]
+            if not value.isdigit():
+                print(f"❌ --workers 는 0 이상의 정수: {value}")
+                return 1
+            workers = int(value)
+    # --profile: 단계별 cProfile(.pstats) / tracemalloc 할당 보고서를 출력 CSV 옆 profile_<시각>_<모드>/ 에 저장
+    # --no-cache: 단계 캐시 없이 항상 새로 내보내기/처리 (reportbot/pipeline.py)
+    # --force-upload: 마지막 업로드와 처리 결과가 같아도 통계 업로드
+    # --workers=N: 검증 규칙 병렬 평가 프로세스 수 (0이면 CPU 수, 큰 export 에서만 나눔 — reportbot/rules.py)
+    # --reuse-export: EXPORT_REUSE_MINUTES 안에 받은 같은 팀·월 export 재사용 (업로드 실패 직후 재시도 등, 기본은 항상 새로 내보내기)
+    options = {"backend": backend, "disable_slack_notifications": disable_slack_notifications,
+               "profile": "--profile" in flags, "use_cache": "--no-cache" not in flags,
+               "force_upload": "--force-upload" in flags, "workers": workers,
+               "reuse_export": "--reuse-export" in flags}
+    
+    print("🔍 환경변수 확인:")
+    print(f"📧 TU_EMAIL: {'설정됨' if os.getenv('TU_EMAIL') else '❌ 없음'}")
+    print(f"🔒 TU_PASSWORD: {'설정됨' if os.getenv('TU_PASSWORD') else '❌ 없음'}")
+    print(f"🤖 SLACK_BOT_TOKEN: {'설정됨' if os.getenv('SLACK_BOT_TOKEN') else '❌ 없음'}")
+    print(f"💬 SLACK_CHANNEL: {os.getenv('SLACK_CHANNEL', '❌ 없음')}")
+    print(f"💬 SLACK_CHANNEL_VALIDATION: {os.getenv('SLACK_CHANNEL_VALIDATION', '❌ 없음')}")
+    print(f"🌐 브라우저 백엔드: {backend}")
+    
+    print("\n🔍 설정값 확인:")
+    year, month = current_period()
+    print(f"📄 출력 파일명: {output_filename_for(year, month)}")
+    if (year, month) in MONTHLY_HOURS:
+        print(f"⏱️ 최소 필수 시간: {MONTHLY_HOURS[(year, month)]}시간")
+    else:
+        print(f"⏱️ 최소 필수 시간: ❌ MONTHLY_HOURS에 {year}년 {month}월 없음")
+    
+    if mode == "validation":
+        # 검증 전용 모드
+        #   --all-channels: SLACK_CHANNEL_VALIDATION + SLACK_CHANNEL 동시 전송
+        #   --full-report: 변경분이 아닌 전체 이슈 목록 전송
+        print("🔍 검증 전용 모드로 실행")
+        if "--all-channels" in flags:
+            channel_env_var = ("SLACK_CHANNEL_VALIDATION", "SLACK_CHANNEL")
+        else:
+            channel_env_var = "SLACK_CHANNEL_VALIDATION"
+        downloader = make_downloader(headless=True, **options)
+        if downloader is None:
+            return 1
+        # --full-report: 이전 실행과 비교하지 않고 전체 이슈 목록 전송
+        result = downloader.run_validation_only(channel_env_var, full_report="--full-report" in flags)
+        
+        if not result:
+            return 1
+    elif mode == "process":
+        # 오프라인 처리: python tu_downloader.py process <export.csv> [YYYY-MM]
+        if len(args) < 2:
+            print(f"❌ 사용법: python {prog} process <export.csv> [YYYY-MM]")
+            return 1
+        try:
+            period = parse_month(args[2]) if len(args) > 2 else None
+        except ValueError as e:
+            print(f"❌ {e}")
+            print(f"❌ 사용법: python {prog} process <export.csv> [YYYY-MM]")
+            return 1
+        issues = run_process_only(args[1], period, workers=options["workers"])
+        
+        if issues is None:
+            return 1
+    elif mode == "backfill":
+        # 지난 달 재처리/재검증: python tu_downloader.py backfill 2026-06 2026-09 [원본 폴더]
+        if len(args) < 3:
+            print(f"❌ 사용법: python {prog} backfill <시작월 YYYY-MM> <끝월 YYYY-MM> [원본 폴더]")
+            return 1
+        exports_dir = args[3] if len(args) > 3 else BACKFILL_EXPORTS_DIR
+        try:
+            start_month, end_month = parse_month(args[1]), parse_month(args[2])
+        except ValueError as e:
+            print(f"❌ {e}")
+            print(f"❌ 사용법: python {prog} backfill <시작월 YYYY-MM> <끝월 YYYY-MM> [원본 폴더]")
+            return 1
+        summaries = run_backfill(start_month, end_month, exports_dir)
+        
+        if not summaries or any(row["status"] not in ("검증 통과", "검증 오류") for row in summaries):
+            return 1
+    elif mode == "history":
+        # 실행 이력 추세 리포트: python tu_downloader.py history [출력 폴더]
+        from reportbot.history import RunHistory, HISTORY_DB
+        if not os.path.exists(HISTORY_DB):
+            print(f"⚠️ 실행 이력 없음: {HISTORY_DB}")
+            return 0
+        history = RunHistory()
+        print(history.markdown())
+        md_path, html_path = history.write_trend_report(args[1] if len(args) > 1 else RUN_REPORTS_DIR)
+        print(f"📝 추세 리포트: {os.path.abspath(md_path)}, {os.path.abspath(html_path)}")
+    elif mode == "analytics":
+        # 여러 달 추세: python tu_downloader.py analytics [--force] — 새 달 / 바뀐 달만 집계 후 집계 테이블로 조회
+        from reportbot.analytics import MonthlyAggregates, discover_sources
+        store = MonthlyAggregates()
+        sources = discover_sources()
+        start = time.perf_counter()
+        updated = store.update(sources, force="--force" in flags)
+        print(f"📊 월별 집계: 원본 {len(sources)}개월 중 {len(updated)}개월 갱신 ({time.perf_counter() - start:.1f}초)")
+        report = store.markdown()
+        print(report)
+        os.makedirs(RUN_REPORTS_DIR, exist_ok=True)
+        report_path = os.path.join(RUN_REPORTS_DIR, "analytics.md")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📝 월별 추세 리포트: {os.path.abspath(report_path)}")
+    elif mode == "teams":
+        # 멀티 팀 모드: python tu_downloader.py teams 아트실 UI팀 ... (또는 TU_TEAMS="아트실,UI팀")
+        teams = args[1:] or [t.strip() for t in os.getenv("TU_TEAMS", DEFAULT_TEAM).split(",") if t.strip()]
+        print(f"👥 멀티 팀 모드로 실행: {teams}")
+        
+        email = os.getenv("TU_EMAIL")
+        password = os.getenv("TU_PASSWORD")
+        
+        if not email or not password:
+            print("❌ 환경변수 필요: TU_EMAIL, TU_PASSWORD")
+            return 1
+        
+        downloader = make_downloader(headless=DEFAULT_HEADLESS, **options)
+        if downloader is None:
+            return 1
+        results = downloader.run_multi_team(email, password, teams)
+        
+        if not all(results.values()):
+            return 1
+    else:
+        # 기존 전체 프로세스 모드
+        print("🚀 전체 프로세스 모드로 실행")
+        
+        # 환경변수에서 로그인 정보 읽기
+        email = os.getenv("TU_EMAIL")
+        password = os.getenv("TU_PASSWORD")
+        
+        if not email or not password:
+            print("❌ 환경변수 필요: TU_EMAIL, TU_PASSWORD")
+            return 1
+        
+        downloader = make_downloader(headless=DEFAULT_HEADLESS, **options)
+        if downloader is None:
+            return 1
+        result = downloader.run_complete_automation(email, password)
+        
+        if result:
+            print(f"📁 최종 파일: {result}")
+        else:
+            print("\n❌ 실패")
+            return 1
+    return 0
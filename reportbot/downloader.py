@@ -0,0 +1,1194 @@
+# reportbot/downloader.py - TU 통계 다운로드 → CSV 처리/검증 → 업로드/슬랙 전송 흐름
+#
+# 브라우저 단계는 reportbot/browsers.py 의 백엔드(Chrome/Edge/HTTP/Fake)에 위임
+# pandas · selenium · requests 는 필요한 단계에서만 import
+import os
+import time
+import glob
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+import logging
+
+from reportbot.issue_state import IssueStateStore, UploadStateStore
+from reportbot.browsers import make_backend
+from reportbot.tracing import Tracer, span, traced, set_metric, add_section
+from reportbot.processing import (
+    OUTPUT_COLUMNS, RULE_GROUP_ATTRS, ProcessingConfig, ProcessResult, process_export, person_hours, tag_hours_report, tag_hours_pivot,
+    validate_processed, validate_tags, validate_time_totals,
+)
+from reportbot.settings import (
+    current_period, output_filename_for, required_hours_for, ConfigFileError,
+    FIRST_TAGS_REQUIRED_ART_FILE, FIRST_TAGS_OPTIONAL_SECOND_FILE, SECOND_TAGS_ART_FILE, SECOND_TAGS_PROJECT_FILE,
+    EXCLUDE_VALUES_FILE, EMAIL_MAP_FILE, EXCLUDE_NAMES_FILE, LEAVE_KEYWORDS_FILE, VALIDATION_RULES_FILE,
+    TEAMS_DIR, DEFAULT_TEAM, DEFAULT_HEADLESS, DISABLE_SLACK_NOTIFICATIONS, DEFAULT_BACKEND, EXPORT_REUSE_MINUTES,
+    VALIDATION_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TaskworldDownloader:
+    def __init__(self, headless=DEFAULT_HEADLESS, config_dir=None, connect_slack=True, period=None,
+                 backend=DEFAULT_BACKEND, disable_slack_notifications=DISABLE_SLACK_NOTIFICATIONS, profile=False,
+                 use_cache=True, force_upload=False, workers=VALIDATION_WORKERS, reuse_export=False):
+        """
+        TU 인트라넷 자동 다운로더 + CSV 처리 + 슬랙 전송
+        (tu.aceproject.co.kr 기준, 브라우저 단계는 backend가 담당)
+        
+        Args:
+            headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+            config_dir (str): 설정 파일을 먼저 찾을 폴더 (없는 파일은 루트 파일 사용)
+            connect_slack (bool): 슬랙 봇 연결 여부 (CSV 처리 전용 워커는 False)
+            period (tuple): 처리할 (연도, 월) — None이면 현재 한국 시간 기준 월 (backfill용)
+            backend (str|BrowserBackend): 브라우저 백엔드 이름(chrome/edge/http/fake) 또는 인스턴스
+            disable_slack_notifications (bool): True면 슬랙 전송 없이 콘솔에만 출력
+            profile (bool): True면 단계별 cProfile / tracemalloc 프로파일을 출력 CSV 옆 폴더에 저장 (--profile)
+            use_cache (bool): False면 단계 캐시 없이 항상 새로 내보내기/처리 (--no-cache, reportbot/pipeline.py)
+            force_upload (bool): True면 마지막 업로드와 내용이 같아도 통계 업로드 (--force-upload)
+            workers (int): 검증 규칙 병렬 평가 프로세스 수 (--workers=N, 0이면 CPU 수, reportbot/rules.py)
+            reuse_export (bool): True면 EXPORT_REUSE_MINUTES 안에 받은 같은 팀·월 export 를 다시 쓰고 브라우저 단계 생략
+                                 (--reuse-export, 기본은 매 실행마다 새로 내보내기)
+        """
+        self.headless = headless
+        self.profile = profile
+        self.use_cache = use_cache
+        self.force_upload = force_upload
+        self.workers = workers
+        self.reuse_export = reuse_export
+        self.config_dir = config_dir
+        self._pipeline_config = None   # build_pipeline 실행 중 한 번 읽은 (ProcessingConfig, 오류 메시지)
+
+        # 처리 대상 월 — 출력 파일명/기준 시간/개인별 예외 시간을 모두 이 월 기준으로 결정
+        self.year, self.month = period or current_period()
+        self.output_filename = output_filename_for(self.year, self.month)
+        self.min_required_hours = required_hours_for(self.year, self.month)
+        self.download_dir = os.path.abspath("./")
+        self.disable_slack_notifications = disable_slack_notifications
+
+        # 브라우저 단계 (로그인 / 통계 CSV 내보내기 / 통계 업로드)
+        self.browser = make_backend(backend, headless=headless, download_dir=self.download_dir)
+        
+        # 슬랙 봇 설정
+        self.slack_token = os.getenv("SLACK_BOT_TOKEN")
+        self.slack_channel = os.getenv("SLACK_CHANNEL", "#아트실")
+        self.slack_client = None
+        
+        # 한국 시간대 설정
+        self.korea_tz = timezone(timedelta(hours=9))
+        
+        print(f"🤖 TU 자동화 다운로더 초기화 - headless: {headless}, 백엔드: {self.browser.label}")
+        print(f"📄 출력 파일명: {self.output_filename}")
+        print(f"⏱️ 최소 필수 시간: {self.min_required_hours}시간")
+        print(f"💬 슬랙 채널: '{self.slack_channel}' (따옴표 포함 확인)")
+        
+        # 슬랙 봇 초기화
+        # (429/일시 오류는 Retry-After + 백오프로 재시도, 커넥션 풀은 모든 전송에서 공유)
+        if not connect_slack:
+            print("ℹ️ 슬랙 연결 생략 (CSV 처리 전용)")
+        elif self.slack_token:
+            from reportbot.slack import SlackSender
+            self.slack_client = SlackSender(self.slack_token)
+            response = self.slack_client.auth_test()
+            if response.get('ok'):
+                print(f"✅ 슬랙 봇 연결 성공: {response['user']}")
+            else:
+                print(f"❌ 슬랙 봇 연결 실패: {response.get('error')}")
+        else:
+            print("⚠️ 슬랙 토큰이 없어 슬랙 전송 기능 비활성화")
+        
+    def _config_path(self, filename):
+        """설정 파일 경로 — config_dir에 파일이 있으면 그 파일, 없으면 루트 파일"""
+        if self.config_dir:
+            team_path = os.path.join(self.config_dir, filename)
+            if os.path.exists(team_path):
+                return team_path
+        return filename
+    
+    def load_exclude_values(self):
+        """제외할 Tasklist 값들을 텍스트 파일에서 로드"""
+        try:
+            exclude_values_file = self._config_path(EXCLUDE_VALUES_FILE)
+            if os.path.exists(exclude_values_file):
+                with open(exclude_values_file, 'r', encoding='utf-8') as f:
+                    exclude_values = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+                print(f"✅ 제외 값 설정 로드 완료: {len(exclude_values)}개 ({EXCLUDE_VALUES_FILE})")
+                return exclude_values
+            else:
+                default_values = ["주요일정", "아트실", "UI팀", "리소스팀", "디자인팀", "TA팀"]
+                print(f"❌ {EXCLUDE_VALUES_FILE} 파일이 없습니다!")
+                print(f"🔧 기본값으로 파일을 생성합니다: {default_values}")
+                
+                with open(EXCLUDE_VALUES_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 제외할 Tasklist 값들 (한 줄에 하나씩)\n")
+                    f.write("# 주석은 #으로 시작\n\n")
+                    for value in default_values:
+                        f.write(f"{value}\n")
+                
+                print(f"✅ {EXCLUDE_VALUES_FILE} 파일이 생성되었습니다. 필요시 수정하세요.")
+                return default_values
+                
+        except Exception as e:
+            print(f"❌ 제외 값 로드 실패: {e}")
+            return ["주요일정", "아트실", "UI팀", "리소스팀", "디자인팀", "TA팀"]
+    
+    def load_email_map(self):
+        """이메일 → 이름 매핑 파일 로드 (email_map.txt)
+        형식: jhee@aceproject.co.kr : 배진희
+        """
+        try:
+            email_map_file = self._config_path(EMAIL_MAP_FILE)
+            if os.path.exists(email_map_file):
+                email_map = {}
+                with open(email_map_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith('#'):
+                            continue
+                        parts = [p.strip() for p in line.split(':')]
+                        if len(parts) >= 2:
+                            email_map[parts[0]] = parts[1]
+                print(f"✅ 이메일 매핑 로드 완료: {len(email_map)}명")
+                return email_map
+            else:
+                print(f"⚠️ {EMAIL_MAP_FILE} 파일이 없습니다! 기본 파일을 생성합니다.")
+                with open(EMAIL_MAP_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 이메일 → 이름 매핑\n")
+                    f.write("# 형식: 이메일@도메인 : 이름\n\n")
+                    f.write("# jhee@aceproject.co.kr : 배진희\n")
+                return {}
+        except Exception as e:
+            print(f"❌ 이메일 매핑 로드 실패: {e}")
+            return {}
+
+    def load_leave_keywords(self):
+        """연차/반차류 Tasklist 키워드 로드 (leave_keywords.txt)
+        이 키워드에 해당하는 행은 Tags가 자동으로 "연차"로 설정됨
+        """
+        try:
+            leave_keywords_file = self._config_path(LEAVE_KEYWORDS_FILE)
+            if os.path.exists(leave_keywords_file):
+                keywords = set()
+                with open(leave_keywords_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        kw = line.strip()
+                        if kw and not kw.startswith('#'):
+                            keywords.add(kw)
+                print(f"✅ 연차 키워드 로드: {len(keywords)}개 → {keywords}")
+                return keywords
+            else:
+                # 기본값으로 파일 생성
+                defaults = ["연차", "반차", "오전반차", "오후반차", "생일", "시간차", "공휴일"]
+                with open(LEAVE_KEYWORDS_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 연차/반차류 Tasklist 키워드 (한 줄에 하나)\n")
+                    f.write("# 이 키워드에 해당하는 행은 Tags가 자동으로 '연차'로 설정됨\n\n")
+                    for kw in defaults:
+                        f.write(f"{kw}\n")
+                print(f"✅ {LEAVE_KEYWORDS_FILE} 기본 파일 생성 완료")
+                return set(defaults)
+        except Exception as e:
+            print(f"❌ 연차 키워드 로드 실패: {e}")
+            return set(["연차", "반차", "오전반차", "오후반차", "생일", "시간차", "공휴일"])
+
+    def load_exclude_names(self):
+        """검증에서 제외할 이름 목록 로드 (exclude_names.txt)
+        형식: 한 줄에 이름 하나
+        예시: 김찬준
+        """
+        try:
+            exclude_names_file = self._config_path(EXCLUDE_NAMES_FILE)
+            if os.path.exists(exclude_names_file):
+                exclude_names = set()
+                with open(exclude_names_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        name = line.strip()
+                        if name and not name.startswith('#'):
+                            exclude_names.add(name)
+                print(f"✅ 검증 제외 이름 로드: {len(exclude_names)}명 → {exclude_names}")
+                return exclude_names
+            else:
+                with open(EXCLUDE_NAMES_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 검증에서 제외할 이름 목록 (한 줄에 하나)\n")
+                    f.write("# 예시: 김찬준\n")
+                print(f"✅ {EXCLUDE_NAMES_FILE} 템플릿 생성 완료")
+                return set()
+        except Exception as e:
+            print(f"❌ 검증 제외 이름 로드 실패: {e}")
+            return set()
+
+    def load_allowed_tags(self):
+        """허용된 태그 목록 파일에서 로드 (없는 파일은 기본값으로 생성)
+
+        Raises:
+            ConfigFileError: 태그 설정 파일을 읽거나 만들 수 없음
+        """
+        try:
+            # 첫 번째 태그 (두 번째 태그 필수) — art 파일 하나로 통합
+            try:
+                with open(self._config_path(FIRST_TAGS_REQUIRED_ART_FILE), 'r', encoding='utf-8') as f:
+                    first_tags_required_art = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+                print(f"✅ 필수 첫번째 태그 로드: {len(first_tags_required_art)}개")
+            except FileNotFoundError:
+                default_art = ["cpm", "9up", "c-"]
+                with open(FIRST_TAGS_REQUIRED_ART_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 두 번째 태그가 반드시 있어야 하는 첫 번째 태그들\n")
+                    f.write("# 한 줄에 하나씩, 주석은 #으로 시작\n\n")
+                    for tag in default_art:
+                        f.write(f"{tag}\n")
+                first_tags_required_art = default_art
+
+            # project는 art와 동일하게 처리 (파일 통합됨)
+            first_tags_required_project = first_tags_required_art
+            
+            # 두 번째 태그 선택적인 첫 번째 태그들 (기존과 동일)
+            try:
+                with open(self._config_path(FIRST_TAGS_OPTIONAL_SECOND_FILE), 'r', encoding='utf-8') as f:
+                    first_tags_optional_second = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            except FileNotFoundError:
+                default_optional = ["공통업무", "공통작업", "연차", "사내행사", "공휴일"]
+                with open(FIRST_TAGS_OPTIONAL_SECOND_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 두 번째 태그가 있어도 되고 없어도 되는 첫 번째 태그들\n")
+                    f.write("# 한 줄에 하나씩, 주석은 #으로 시작\n\n")
+                    for tag in default_optional:
+                        f.write(f"{tag}\n")
+                first_tags_optional_second = default_optional
+            
+            # 아트용 두 번째 태그들
+            try:
+                with open(self._config_path(SECOND_TAGS_ART_FILE), 'r', encoding='utf-8') as f:
+                    second_tags_art = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            except FileNotFoundError:
+                default_art_second = ["회의", "문서작업"]
+                with open(SECOND_TAGS_ART_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 아트 그룹용 두 번째 태그로 허용되는 값들 (완전 일치)\n")
+                    f.write("# 한 줄에 하나씩, 주석은 #으로 시작\n\n")
+                    for tag in default_art_second:
+                        f.write(f"{tag}\n")
+                second_tags_art = default_art_second
+
+            # 프로젝트용 두 번째 태그들
+            try:
+                with open(self._config_path(SECOND_TAGS_PROJECT_FILE), 'r', encoding='utf-8') as f:
+                    second_tags_project = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            except FileNotFoundError:
+                default_project_second = ["피드백", "교육"]
+                with open(SECOND_TAGS_PROJECT_FILE, 'w', encoding='utf-8') as f:
+                    f.write("# 프로젝트 그룹용 두 번째 태그로 허용되는 값들 (완전 일치)\n")
+                    f.write("# 한 줄에 하나씩, 주석은 #으로 시작\n\n")
+                    for tag in default_project_second:
+                        f.write(f"{tag}\n")
+                second_tags_project = default_project_second
+            
+            return first_tags_required_art, first_tags_required_project, first_tags_optional_second, second_tags_art, second_tags_project
+            
+        except Exception as e:
+            print(f"❌ 태그 설정 파일 읽기 실패: {e}")
+            raise ConfigFileError(f"태그 설정 파일 읽기 실패: {e}") from e
+
+    def load_rules(self):
+        """검증 규칙 로드 (validation_rules.txt, 형식은 reportbot/rules.py) — 파일이 없으면 기본 규칙으로 생성
+
+        Raises:
+            RuleFileError: 규칙 파일을 읽을 수 없거나 형식 / 식 오류 (메시지에 파일 경로 포함)
+        """
+        from reportbot.rules import DEFAULT_RULES, RuleSet, RuleFileError
+        rules_file = VALIDATION_RULES_FILE
+        try:
+            rules_file = self._config_path(VALIDATION_RULES_FILE)
+            if not os.path.exists(rules_file):
+                with open(VALIDATION_RULES_FILE, 'w', encoding='utf-8') as f:
+                    f.write(DEFAULT_RULES)
+                print(f"✅ {VALIDATION_RULES_FILE} 기본 파일 생성 완료")
+                rules_file = VALIDATION_RULES_FILE
+            with open(rules_file, 'r', encoding='utf-8') as f:
+                rules = RuleSet.parse(f.read())
+            print(f"✅ 검증 규칙 로드: {len(rules.rules)}개 ({', '.join(rules.groups)})")
+            return rules
+        except (RuleFileError, OSError) as e:
+            print(f"❌ 검증 규칙 파일 오류: {e}")
+            raise RuleFileError(f"{rules_file}: {e}") from e
+
+    def load_config(self):
+        """설정 파일들 → ProcessingConfig (process_export 입력, 없는 파일은 기본값으로 생성)"""
+        first_tags_required_art, first_tags_required_project, first_tags_optional_second, second_tags_art, second_tags_project = self.load_allowed_tags()
+        return ProcessingConfig(
+            email_map=self.load_email_map(),
+            exclude_values=self.load_exclude_values(),
+            exclude_names=self.load_exclude_names(),
+            leave_keywords=self.load_leave_keywords(),
+            first_tags_required=first_tags_required_art + first_tags_required_project,
+            first_tags_optional=first_tags_optional_second,
+            second_tags_art=second_tags_art,
+            second_tags_project=second_tags_project,
+            rules=self.load_rules(),
+            workers=self.workers,
+        )
+
+    def try_load_config(self):
+        """load_config → (ProcessingConfig, None) — 태그 / 규칙 설정 파일 오류면 (None, 오류 메시지)"""
+        from reportbot.rules import RuleFileError
+        try:
+            return self.load_config(), None
+        except RuleFileError as e:
+            return None, f"검증 규칙 파일 오류: {e}"
+        except ConfigFileError as e:
+            return None, str(e)
+
+    def validate_tags(self, df, first_tags_required_art, first_tags_required_project, first_tags_optional_second, second_tags_art, second_tags_project, exclude_names=None):
+        """C열 태그 검증 (reportbot.processing.validate_tags)"""
+        config = ProcessingConfig(
+            exclude_names=exclude_names,
+            first_tags_required=first_tags_required_art + first_tags_required_project,
+            first_tags_optional=first_tags_optional_second,
+            second_tags_art=second_tags_art,
+            second_tags_project=second_tags_project,
+        )
+        return validate_tags(df, config)
+    
+    def validate_csv_data(self, df, min_hours=None):
+        """CSV 데이터 검증 - 시간 합계 + 태그 검증 (min_hours 기본값: 처리 대상 월 기준 시간)"""
+        if min_hours is None:
+            min_hours = self.min_required_hours
+        hours_issues, tag_issues = validate_processed(df, self.load_config(), (self.year, self.month), min_hours)
+        all_issues = hours_issues + tag_issues
+        if not all_issues:
+            print("모든 검증 통과!")
+        return all_issues
+    
+    def _validate_time_totals(self, df, min_hours, exclude_names=None):
+        """시간 합계 검증 (reportbot.processing.validate_time_totals)"""
+        return validate_time_totals(df, min_hours, (self.year, self.month), exclude_names)
+    
+    def process_csv(self, input_file, columns=['Assigned To', 'Task', 'Tags', 'Time Spent'], output_file=None):
+        """CSV 파일 처리 - 파일 읽기 → process_export(처리 + 검증) → 결과 출력/저장
+
+        Args:
+            output_file (str): 처리된 CSV 저장 경로 (None이면 처리 대상 월 파일명, 예: 26_5.csv)
+
+        Returns:
+            tuple: (최종 DataFrame, 제거된 행 수, 저장 경로, 검증 이슈) — 실패 시 (None, None, 오류 메시지, [])
+        """
+        result, output_file = self.process_file(input_file, output_file)
+        if not result.ok:
+            return None, None, result.error, []
+        return result.frame, 0, output_file, result.issues
+
+    def process_file(self, input_file, output_file=None, config=None):
+        """process_csv 본체 → (ProcessResult, 저장 경로) — 실패 시 result.error 에 오류 메시지, 경로는 None
+        (파이프라인 / backfill 처럼 규칙 group 별 이슈 수 등 ProcessResult 전체가 필요한 쪽에서 사용)
+
+        config 를 주면 설정 파일을 다시 읽지 않음 (파이프라인에서 캐시 키와 같은 설정 사용)
+        """
+        import pandas as pd
+        try:
+            with span("read_csv"):
+                if input_file.endswith(".parquet"):
+                    # 보관된 원본 export (reportbot/archive.py) — backfill
+                    from reportbot.archive import read_export
+                    df = read_export(input_file)
+                else:
+                    df = pd.read_csv(input_file)
+        except Exception as e:
+            return ProcessResult(error=f"CSV 처리 오류: {str(e)}"), None
+        print(f"📊 원본 행 수: {len(df)}")
+
+        if config is None:
+            with span("load_config"):
+                config, error = self.try_load_config()
+            if error:
+                return ProcessResult(error=error), None
+        with span("process_export", rows=len(df)):
+            result = process_export(df, config, (self.year, self.month), min_hours=self.min_required_hours)
+        self._print_process_result(result)
+        if not result.ok:
+            return result, None
+
+        set_metric("rows_in", result.original_count)
+        set_metric("rows_out", len(result.frame))
+        set_metric("tasklist_excluded", result.tasklist_excluded_count)
+        set_metric("issues", len(result.issues))
+        # 이슈 종류별 지표는 규칙 group 기준 (메트릭 파일 / 실행 이력 / 월별 집계 모두 같은 값)
+        for group, attr in RULE_GROUP_ATTRS.items():
+            set_metric(attr, result.issue_counts.get(group, 0))
+        add_section("person_hours", person_hours(result.frame, result.columns) or {})
+
+        # 파일 저장
+        try:
+            with span("write_csv"):
+                output_file = output_file or self.output_filename
+                if os.path.exists(output_file):
+                    os.remove(output_file)
+                result.frame.to_csv(output_file, index=False, header=False, encoding='utf-8-sig')
+            print(f"✅ 파일 저장 완료: {output_file}")
+        except Exception as e:
+            return ProcessResult(error=f"CSV 처리 오류: {str(e)}"), None
+
+        self.write_tag_reports(result.frame, config, output_file, result.columns)
+        return result, output_file
+
+    @staticmethod
+    def tag_report_paths(output_file):
+        """처리된 CSV 옆 사람 × 태그 시간 리포트 경로 → (태그별 합계, 사람별 표) 예: 26_5_tag_hours.csv, 26_5_tag_pivot.csv"""
+        base = os.path.splitext(output_file)[0]
+        return base + "_tag_hours.csv", base + "_tag_pivot.csv"
+
+    def write_tag_reports(self, frame, config, output_file, columns=None):
+        """사람 × 첫/두 번째 태그 × 아트/프로젝트 그룹 시간 합계 리포트 저장 (실패해도 처리 결과에는 영향 없음)
+
+        columns: process_export 결과의 파생 열 (RowColumns — 태그 분리 / 시간 변환 재사용)
+        """
+        try:
+            with span("tag_report"):
+                report = tag_hours_report(frame, config, columns)
+                hours_file, pivot_file = self.tag_report_paths(output_file)
+                report.to_csv(hours_file, index=False, encoding='utf-8-sig')
+                tag_hours_pivot(report).to_csv(pivot_file, index=False, encoding='utf-8-sig')
+            print(f"✅ 태그별 시간 리포트 저장: {hours_file}, {pivot_file}")
+            return hours_file, pivot_file
+        except Exception as e:
+            print(f"⚠️ 태그별 시간 리포트 저장 실패: {e}")
+            return None
+
+    def _print_process_result(self, result):
+        """process_export 결과 요약 출력"""
+        if result.name_mapped:
+            print("✅ 이름 변환 완료")
+        else:
+            print("⚠️ 'Assigned To' 열 없음")
+        for issue in result.assigned_issues:
+            print(f"⚠️ {issue}")
+        for item in result.unmapped:
+            print(f"⚠️ email_map 미등록 이메일: {item['address']} ({item['rows']}행)")
+        if result.multi_assignee_count:
+            print(f"ℹ️ 담당자가 여러 명인 행 {result.multi_assignee_count}개 → 첫 번째 담당자 기준으로 변환")
+        print(f"📊 전체 행 수: {result.original_count}")
+        if result.tasklist_excluded:
+            detail = ", ".join(f"{value} {count}행" for value, count in result.tasklist_excluded.items())
+            print(f"✅ 제외 Tasklist 필터링: {result.tasklist_excluded_count}행 제거 ({detail})")
+        if result.excluded_count > 0:
+            print(f"✅ 제외 이름 필터링: {result.excluded_count}행 제거")
+        if result.leave_count > 0:
+            print(f"✅ 연차/반차 자동 태그 처리: {result.leave_count}행")
+        if result.ok and not result.hours_issues and not result.tag_issues:
+            print("모든 검증 통과!")
+
+    def send_validation_report_to_slack(self, validation_issues, channel_env_var="SLACK_CHANNEL_VALIDATION", team_name=DEFAULT_TEAM):
+        """검증 결과를 슬랙에 전송 (파일 업로드 없이) - 오류가 있을 때만 전송"""
+        if self.disable_slack_notifications:
+            print("⏸️ 슬랙 노티 임시 비활성화 (테스트 중)")
+            return True
+
+        if not self.slack_client:
+            return False
+        
+        # 오류가 없으면 아무것도 전송하지 않음
+        if not validation_issues:
+            return True
+        
+        try:
+            # channel_env_var에 여러 환경변수를 주면 모든 채널에 동시 전송 (fan-out)
+            env_vars = [channel_env_var] if isinstance(channel_env_var, str) else list(channel_env_var)
+            validation_channels = [os.getenv(env_var, "#아트실") for env_var in env_vars]
+            mentioned_people = self._extract_people_from_issues(validation_issues)
+            message_text = f"[TU 검토] {team_name} 오류 발견 ☠️"
+
+            # 사람 이름이 없는 이슈(담당자 없음 / 실행 실패 등)만 있어도 전송 — 멘션 줄만 생략
+            if mentioned_people:
+                people_list = ", ".join(mentioned_people)
+                message_text += f"\n🧨 확인 필요한 사람 : {people_list}"
+            message_text += "\n```[오류 내용 확인]"
+            for issue in validation_issues:
+                message_text += f"\n- {issue}"
+            message_text += "```"
+
+            responses = self.slack_client.post_to_channels(validation_channels, message_text)
+            failed = {ch: r for ch, r in responses.items() if not r.get('ok')}
+            for ch, r in failed.items():
+                print(f"❌ 검증 결과 슬랙 전송 실패 ({ch}): {r.get('error', r)}")
+            return not failed
+
+        except Exception as e:
+            print(f"❌ 검증 결과 슬랙 전송 실패 상세: {e}")
+            return False
+
+    def send_validation_diff_to_slack(self, issue_diff, channel_env_var="SLACK_CHANNEL_VALIDATION", team_name=DEFAULT_TEAM):
+        """이전 실행 대비 변경분만 슬랙에 전송 (새 오류 / 해결된 오류 / 사람별 남은 오류 수)
+        변경이 없으면 아무것도 전송하지 않음
+        """
+        if self.disable_slack_notifications:
+            print("⏸️ 슬랙 노티 임시 비활성화 (테스트 중)")
+            return True
+
+        if not self.slack_client:
+            return False
+
+        if not issue_diff.has_changes:
+            print("✅ 이전 실행 대비 검증 결과 변경 없음 — 슬랙 전송 생략")
+            return True
+
+        try:
+            env_vars = [channel_env_var] if isinstance(channel_env_var, str) else list(channel_env_var)
+            validation_channels = [os.getenv(env_var, "#아트실") for env_var in env_vars]
+
+            if issue_diff.new:
+                message_text = f"[TU 검토] {team_name} 새 오류 {len(issue_diff.new)}건 ☠️"
+                mentioned_people = self._extract_people_from_issues(issue_diff.new)
+                if mentioned_people:
+                    message_text += f"\n🧨 확인 필요한 사람 : {', '.join(mentioned_people)}"
+            else:
+                message_text = f"[TU 검토] {team_name} 오류 {len(issue_diff.resolved)}건 해결 ✅"
+
+            message_text += "\n```"
+            if issue_diff.new:
+                message_text += "[새 오류]"
+                for issue in issue_diff.new:
+                    message_text += f"\n- {issue}"
+            if issue_diff.resolved:
+                if issue_diff.new:
+                    message_text += "\n\n"
+                message_text += "[해결된 오류]"
+                for issue in issue_diff.resolved:
+                    message_text += f"\n- {issue}"
+            message_text += f"\n\n[남은 오류 {len(issue_diff.current)}건]"
+            for name, count in sorted(issue_diff.person_counts.items(), key=lambda x: (-x[1], x[0])):
+                message_text += f"\n- {name}: {count}건"
+            message_text += "```"
+
+            responses = self.slack_client.post_to_channels(validation_channels, message_text)
+            failed = {ch: r for ch, r in responses.items() if not r.get('ok')}
+            for ch, r in failed.items():
+                print(f"❌ 검증 변경분 슬랙 전송 실패 ({ch}): {r.get('error', r)}")
+            return not failed
+
+        except Exception as e:
+            print(f"❌ 검증 변경분 슬랙 전송 실패 상세: {e}")
+            return False
+
+    def _extract_people_from_issues(self, validation_issues):
+        """검증 오류에서 사람 이름 추출"""
+        people = set()
+        try:
+            for issue in validation_issues:
+                if "님" in issue:
+                    parts = issue.split("님")
+                    if len(parts) > 0:
+                        name_part = parts[0].strip()
+                        words = name_part.split()
+                        if words:
+                            name = words[-1]
+                            if len(name) >= 2 and all('\uac00' <= char <= '\ud7a3' for char in name):
+                                people.add(name)
+            
+            return list(people)
+            
+        except Exception:
+            return []
+
+    def build_pipeline(self, email, password, team_name=DEFAULT_TEAM):
+        """단일 팀 수집 파이프라인: 드라이버 설정 → 로그인 → 팀 통계 이동 → CSV 내보내기 → 처리 + 검증
+
+        전체 / 검증 모드 공용 — 출력: csv_file, processed_file, validation_issues
+        (처리 결과는 원본·설정·처리 코드가 같으면 캐시 재사용, export 는 reuse_export 일 때만 EXPORT_REUSE_MINUTES 동안)
+        """
+        from reportbot import processing, rules
+        from reportbot.pipeline import Pipeline, Stage, ArtifactCache, file_digest
+        period = (self.year, self.month)
+        self._pipeline_config = None
+
+        def config():
+            # 설정 / 규칙 파일은 실행당 한 번만 로드 (캐시 키 · 처리 · 월별 집계가 같은 설정 사용) → (config, 오류 메시지)
+            if self._pipeline_config is None:
+                with span("load_config"):
+                    self._pipeline_config = self.try_load_config()
+            return self._pipeline_config
+
+        def driver_setup(ctx):
+            print("1️⃣ 드라이버 설정...")
+            return self.browser.start() and {"driver": True}
+
+        def login(ctx):
+            print("\n2️⃣ 로그인...")
+            return self.browser.login(email, password) and {"session": True}
+
+        def open_team_stats(ctx):
+            print(f"\n3️⃣ {team_name} 이동...")
+            return self.browser.open_team_stats(team_name) and {"team_page": team_name}
+
+        def export_csv(ctx):
+            print("\n4️⃣ CSV 내보내기...")
+            csv_file = self.browser.export_csv()
+            return csv_file and {"csv_file": csv_file}
+
+        def process(ctx):
+            print("\n5️⃣ CSV 파일 처리 및 검증...")
+            processing_config, error = config()
+            if error:
+                return error
+            result, processed_file = self.process_file(ctx["csv_file"], config=processing_config)
+            if not result.ok:
+                return result.error
+            outputs = {"processed_file": processed_file, "validation_issues": result.issues,
+                       "issue_counts": result.issue_counts}
+            for name, path in zip(("tag_hours_file", "tag_pivot_file"), self.tag_report_paths(processed_file)):
+                if os.path.exists(path):
+                    outputs[name] = path
+            return outputs
+
+        def process_key(ctx):
+            # 처리 코드: 처리 / 검증 규칙 평가 / 이 모듈(process_csv · 태그 리포트 저장) — 코드가 바뀌면 다시 처리
+            code = [file_digest(module_file) for module_file in (processing.__file__, rules.__file__, __file__)]
+            # 규칙 파일 오류면 설정 해시 대신 None — 저장된 캐시가 없으니 처리 단계가 실행되어 오류로 끝남
+            processing_config, _ = config()
+            fingerprint = processing_config.fingerprint() if processing_config else None
+            return [file_digest(ctx["csv_file"]), fingerprint, *period,
+                    self.min_required_hours, self.output_filename, *code]
+
+        # export 는 --reuse-export 일 때만 캐시 (기본은 항상 새로 내보내기 — TU 에서 고친 태그가 바로 반영되도록)
+        export_key = (lambda ctx: [team_name, *period]) if self.reuse_export else None
+
+        stages = [
+            Stage("driver_setup", driver_setup, outputs=("driver",), error="브라우저 드라이버 설정 실패"),
+            Stage("login", login, inputs=("driver",), outputs=("session",), error="TU 인트라넷 로그인 실패"),
+            Stage("open_team_stats", open_team_stats, inputs=("session",), outputs=("team_page",),
+                  error=f"{team_name} 통계 페이지 접속 실패"),
+            Stage("export_csv", export_csv, inputs=("team_page",), outputs=("csv_file",), error="CSV 다운로드 실패",
+                  key=export_key, files=("csv_file",), max_age=EXPORT_REUSE_MINUTES * 60),
+            Stage("process_csv", process, inputs=("csv_file",),
+                  outputs=("processed_file", "validation_issues", "issue_counts", "tag_hours_file", "tag_pivot_file"),
+                  key=process_key, key_inputs=("csv_file",),
+                  files=("processed_file", "tag_hours_file", "tag_pivot_file")),
+        ]
+        return Pipeline(stages, cache=ArtifactCache() if self.use_cache else None)
+
+    def archive_raw_export(self, collected):
+        """이번 실행에서 새로 받은 원본 export 를 Parquet 으로 보관 (캐시에서 복원한 export 는 이미 보관됨)"""
+        if "export_csv" not in collected.executed:
+            return None
+        from reportbot.archive import archive_export
+        with span("archive_export"):
+            return archive_export(collected.context["csv_file"], (self.year, self.month))
+
+    def update_analytics(self, collected):
+        """이번 달 월별 집계 갱신 (reportbot/analytics.py) — 원본 export 가 지난 집계와 같으면 건너뜀 → 갱신 여부"""
+        import pandas as pd
+        from reportbot.analytics import MonthlyAggregates
+        from reportbot.pipeline import file_digest
+        try:
+            with span("analytics"):
+                store = MonthlyAggregates()
+                csv_file = collected.context["csv_file"]
+                digest = file_digest(csv_file)
+                if digest == store.source_sha256((self.year, self.month)):
+                    return False
+                frame = pd.read_csv(collected.context["processed_file"], header=None, names=OUTPUT_COLUMNS,
+                                    dtype=str, encoding='utf-8-sig')
+                config = self._pipeline_config[0] if self._pipeline_config else self.load_config()
+                store.ingest((self.year, self.month), frame, collected.context["validation_issues"],
+                             collected.context["issue_counts"], config, digest,
+                             os.path.basename(csv_file))
+            print(f"📊 월별 집계 갱신: {self.year}-{self.month:02d}")
+            return True
+        except Exception as e:
+            print(f"⚠️ 월별 집계 갱신 실패: {e}")
+            return False
+
+    @contextmanager
+    def _traced_run(self, mode):
+        """실행 1회를 Tracer로 감싸기 — 끝나면 단계별 소요 시간 표 출력 + run_reports/ 에 JSON 리포트 저장"""
+        profiler = None
+        if self.profile:
+            from reportbot.profiling import StageProfiler
+            output_dir = os.path.dirname(os.path.abspath(self.output_filename))
+            stamp = datetime.now(timezone(timedelta(hours=9))).strftime('%Y%m%d_%H%M%S')
+            profiler = StageProfiler(os.path.join(output_dir, f"profile_{stamp}_{mode}"))
+        tracer = Tracer(mode, profiler=profiler)
+        tracer.set("backend", self.browser.name)
+        tracer.set("period", f"{self.year}-{self.month:02d}")
+        try:
+            with tracer.activate():
+                yield tracer
+        finally:
+            if self.slack_client:
+                tracer.set("slack_retries", self.slack_client.retry_count)
+                tracer.add_section("slack_calls", [
+                    {"method": method, "duration_s": round(duration, 3), "ok": ok}
+                    for method, duration, ok in self.slack_client.call_timings])
+            print("\n⏱️ 단계별 소요 시간")
+            print(tracer.summary_table())
+            stats = self.browser.command_stats
+            if stats and stats.count:
+                tracer.add_section("selenium_commands", stats.summary())
+                print(f"\n🔍 WebDriver 명령 {stats.count}회")
+                print(stats.table())
+            if profiler:
+                tracer.add_section("profile", profiler.summary())
+                print(f"\n🧪 단계별 프로파일: {os.path.abspath(profiler.output_dir)}")
+                print(profiler.write_summary())
+                profiler.close()
+            report_path = tracer.write_report()
+            if report_path:
+                print(f"📝 실행 리포트: {os.path.abspath(report_path)}")
+            report = tracer.report()
+            if self.use_cache:
+                try:
+                    from reportbot.pipeline import ArtifactCache
+                    ArtifactCache().prune()
+                except Exception as e:
+                    print(f"⚠️ 단계 캐시 정리 실패: {e}")
+            try:
+                from reportbot.history import RunHistory
+                RunHistory().record(report)
+            except Exception as e:
+                print(f"⚠️ 실행 이력 저장 실패: {e}")
+            try:
+                from reportbot.metrics import write_textfile
+                metrics_path = write_textfile(report)
+                print(f"📊 메트릭 파일: {os.path.abspath(metrics_path)}")
+            except Exception as e:
+                print(f"⚠️ 메트릭 파일 저장 실패: {e}")
+
+    def run_validation_only(self, channel_env_var="SLACK_CHANNEL_VALIDATION", full_report=False):
+        """검증 전용 실행 (전체 프로세스와 동일하되 파일 업로드 없이 검증 결과만 슬랙 전송)
+
+        Args:
+            full_report (bool): True면 전체 이슈 목록 전송, False면 이전 실행 대비 변경분만 전송
+        """
+        with self._traced_run("validation") as tracer:
+            result = self._run_validation_only(channel_env_var, full_report)
+            tracer.set("ok", bool(result))
+            return result
+
+    def _run_validation_only(self, channel_env_var, full_report):
+        try:
+            # 환경변수에서 로그인 정보 읽기
+            email = os.getenv("TU_EMAIL")
+            password = os.getenv("TU_PASSWORD")
+            
+            if not email or not password:
+                error_msg = "환경변수 필요: TU_EMAIL, TU_PASSWORD"
+                self.send_validation_report_to_slack([error_msg], channel_env_var)
+                return False
+            
+            # 1~5. 드라이버 설정 → 로그인 → 아트실 이동 → CSV 내보내기 → 처리 + 검증 (입력이 같은 단계는 캐시 재사용)
+            collected = self.build_pipeline(email, password).run(["processed_file", "validation_issues"])
+            if not collected.ok:
+                self.send_validation_report_to_slack([collected.error], channel_env_var)
+                return False
+            csv_file = collected.context["csv_file"]
+            processed_file = collected.context["processed_file"]
+            validation_issues = collected.context["validation_issues"]
+            self.archive_raw_export(collected)
+            self.update_analytics(collected)
+            
+            # 6. 검증 결과 터미널 출력 + 슬랙 전송
+            if validation_issues:
+                print(f"\n⚠️ 검증 이슈 {len(validation_issues)}개 발견:")
+                for issue in validation_issues:
+                    print(f"  - {issue}")
+            else:
+                print("\n✅ 검증 이슈 없음")
+
+            # 이번 달 마지막으로 알린 이슈 목록과 비교 (첫 실행이거나 full_report면 전체 전송)
+            state_store = IssueStateStore()
+            issue_diff = state_store.diff(self.year, self.month, validation_issues)
+            if full_report or issue_diff.is_first_run:
+                success = traced("slack_report", self.send_validation_report_to_slack, validation_issues, channel_env_var,
+                                 team_name=DEFAULT_TEAM)
+            else:
+                print(f"🔁 변경분 알림: 새 오류 {len(issue_diff.new)}건, 해결 {len(issue_diff.resolved)}건")
+                success = traced("slack_report", self.send_validation_diff_to_slack, issue_diff, channel_env_var,
+                                 team_name=DEFAULT_TEAM)
+
+            # 전송에 성공한 경우에만 상태 갱신 (실패 시 다음 실행에서 다시 알림)
+            if success and not self.disable_slack_notifications:
+                state_store.save(self.year, self.month, validation_issues)
+
+            print(f"\n✅ 처리된 파일 로컬 저장: {processed_file}")
+            print(f"📁 파일 위치: {os.path.abspath(processed_file)}")
+
+            # 7. 파일 정리 없음 — 원본 + 처리된 파일 모두 유지 (검토용)
+            print(f"📁 원본 파일: {os.path.abspath(csv_file)}")
+
+            if success:
+                return True
+            else:
+                return False
+                
+        except Exception as e:
+            error_msg = f"검증 전용 프로세스 실패: {str(e)}"
+            
+            try:
+                self.send_validation_report_to_slack([error_msg], channel_env_var)
+            except:
+                pass
+            
+            return False
+            
+        finally:
+            self.browser.quit()
+
+    def run_multi_team(self, email, password, teams, channel_env_var="SLACK_CHANNEL_VALIDATION"):
+        """멀티 팀 실행: 한 번 로그인 → 팀별 탭에서 통계 CSV 내보내기 → 팀별 처리/검증 병렬 실행
+
+        - 팀별 설정: teams/<팀명>/ 폴더 (폴더에 없는 설정 파일은 루트 파일 사용)
+        - 팀별 결과: teams/<팀명>/<월별 파일명>
+        - 업로드 없이 팀별 검증 결과만 슬랙 전송
+
+        Returns:
+            dict: {팀명: 처리된 파일 경로 또는 None(실패)}
+        """
+        with self._traced_run("teams") as tracer:
+            results = self._run_multi_team(email, password, teams, channel_env_var)
+            tracer.set("ok", all(results.values()))
+            return results
+
+    def _run_multi_team(self, email, password, teams, channel_env_var):
+        from concurrent.futures import ProcessPoolExecutor
+        start_time = time.time()
+        results = {team: None for team in teams}
+        try:
+            print(f"🚀 멀티 팀 모드 시작: {', '.join(teams)}")
+            print("=" * 60)
+
+            # 1. 드라이버 설정 + 로그인 (모든 팀이 공유)
+            if not traced("driver_setup", self.browser.start):
+                self.send_validation_report_to_slack(["브라우저 드라이버 설정 실패"], channel_env_var)
+                return results
+
+            if not traced("login", self.browser.login, email, password):
+                self.send_validation_report_to_slack(["TU 인트라넷 로그인 실패"], channel_env_var)
+                return results
+
+            # 2. 팀별 탭에서 통계 페이지 이동 → 내보내기 → 다운로드 완료까지 대기 후 다음 팀
+            #    (TU export 파일명은 모두 export-projects*.csv 라 동시에 받으면 어느 팀 파일인지 알 수 없음)
+            existing_csvs = self.browser.prepare_download()
+            team_files = {}
+            for idx, team in enumerate(teams):
+                print(f"\n📑 [{team}] 탭 준비 ({idx + 1}/{len(teams)})")
+                if idx > 0:
+                    self.browser.new_tab()
+
+                if not traced(f"open_team_stats[{team}]", self.browser.open_team_stats, team):
+                    print(f"❌ [{team}] 통계 페이지 접속 실패")
+                    continue
+                if not traced(f"click_export[{team}]", self.browser.click_export):
+                    print(f"❌ [{team}] 내보내기 버튼 클릭 실패")
+                    continue
+                new_csvs = traced(f"wait_for_exports[{team}]", self.browser.wait_for_exports, existing_csvs, expected_count=1)
+                if not new_csvs:
+                    print(f"❌ [{team}] CSV 다운로드 실패")
+                    continue
+                team_files[team] = new_csvs[0]
+                existing_csvs.add(new_csvs[0])
+
+            # 브라우저는 더 이상 필요 없으므로 처리 전에 종료
+            self.browser.quit()
+
+            if not team_files:
+                print("❌ CSV 다운로드에 성공한 팀이 없음")
+                return results
+
+            # 3. 팀별 처리 + 검증 병렬 실행 (팀마다 설정 폴더/출력 파일 분리, 대상 월/검증 프로세스 수는 이 실행 기준)
+            print(f"\n⚙️ {len(team_files)}개 팀 CSV 병렬 처리...")
+            period = (self.year, self.month)
+            with span("process_teams", teams=len(team_files)), \
+                    ProcessPoolExecutor(max_workers=min(len(team_files), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(_process_team_export, team, csv_file, period, self.workers, self.use_cache)
+                           for team, csv_file in team_files.items()]
+                processed = [future.result() for future in futures]
+
+            # 4. 팀별 결과 출력 + 슬랙 전송
+            for team, row_count, processed_file, validation_issues in processed:
+                if row_count is None:
+                    print(f"\n❌ [{team}] 처리 실패: {processed_file}")
+                    continue
+
+                results[team] = processed_file
+                print(f"\n📊 [{team}] {row_count}행 → {processed_file}")
+                if validation_issues:
+                    print(f"⚠️ [{team}] 검증 이슈 {len(validation_issues)}개:")
+                    for issue in validation_issues:
+                        print(f"  - {issue}")
+                else:
+                    print(f"✅ [{team}] 검증 이슈 없음")
+                traced(f"slack_report[{team}]", self.send_validation_report_to_slack, validation_issues, channel_env_var, team_name=team)
+
+            succeeded = sum(1 for f in results.values() if f)
+            print(f"\n🎉 멀티 팀 처리 완료: {succeeded}/{len(teams)}팀 성공 ({time.time() - start_time:.1f}초)")
+            return results
+
+        except Exception as e:
+            print(f"❌ 멀티 팀 프로세스 실패: {e}")
+            return results
+
+        finally:
+            self.browser.quit()
+
+    def send_to_slack(self, csv_file_path, stats=None, error_message=None, validation_issues=None):
+        """슬랙에 리포트 전송 (파일 업로드 + 메시지)"""
+        if self.disable_slack_notifications:
+            print("⏸️ 슬랙 노티 임시 비활성화 (테스트 중)")
+            return True
+
+        if not self.slack_client:
+            return False
+        
+        try:
+            # 1. 기본 인증 확인
+            auth_response = self.slack_client.auth_test()
+            if not auth_response.get('ok'):
+                print(f"❌ 슬랙 인증 실패: {auth_response.get('error', auth_response)}")
+                return False
+
+            # 2. 채널 ID 확보
+            actual_channel_id = self.slack_channel
+            if self.slack_channel.startswith('#'):
+                channel_name = self.slack_channel[1:]
+                try:
+                    conversations = self.slack_client.conversations_list(limit=1000)
+                    if conversations.get('ok'):
+                        channels = conversations.get('channels', [])
+                        found_channel = next((ch for ch in channels if ch['name'] == channel_name), None)
+                        if found_channel:
+                            actual_channel_id = found_channel['id']
+                        else:
+                            print(f"⚠️ 슬랙 채널 '{channel_name}'을 찾지 못함 (봇이 워크스페이스에 없거나 channels:read 권한 없음) — '{self.slack_channel}' 그대로 사용 시도")
+                    else:
+                        print(f"⚠️ conversations_list 실패: {conversations.get('error', conversations)}")
+                except Exception as e:
+                    print(f"⚠️ 채널 조회 중 오류: {e}")
+            
+            # 3. 메시지 전송
+            today = datetime.now(self.korea_tz).strftime("%Y-%m-%d")
+            message_text = f"[{today}] TU 인트라넷 리포트 (아트실)"
+
+            if error_message:
+                message_text += f"\n❌ 오류 발생: `{error_message}`"
+            elif validation_issues:
+                message_text += "\n⚠️ 검증 오류 발견으로 통계 CSV가 업데이트 되지 않습니다."
+                message_text += "\n```"
+                message_text += "\n[검증 오류]"
+                for issue in validation_issues:
+                    message_text += f"\n- {issue}"
+                message_text += "\n```"
+            else:
+                message_text += "\n✅ 통계 CSV 업데이트 완료"
+
+            msg_response = self.slack_client.chat_postMessage(
+                channel=actual_channel_id,
+                text=message_text
+            )
+
+            if not msg_response.get('ok'):
+                print(f"❌ 슬랙 메시지 전송 실패: {msg_response.get('error', msg_response)}")
+                return False
+
+            return True
+
+        except Exception as e:
+            print(f"❌ 슬랙 전송 실패 상세: {e}")
+            return False
+
+    def _send_upload_error_thread(self, channel, thread_ts, filename, error_detail, full_response):
+        """파일 업로드 실패 시 스레드에 상세 오류 정보 전송"""
+        try:
+            thread_text = "파일 업로드 실패 상세 정보\n\n"
+            thread_text += f"파일명: `{filename}`\n"
+            thread_text += f"오류: {error_detail}\n"
+            
+            if full_response:
+                if 'needed' in full_response:
+                    thread_text += f"필요한 권한: {full_response.get('needed')}\n"
+                if 'provided' in full_response:
+                    thread_text += f"현재 권한: {full_response.get('provided')}\n"
+            
+            thread_text += "\n파일은 서버에 생성되었으니 수동으로 업로드 가능합니다."
+            
+            self.slack_client.chat_postMessage(
+                channel=channel,
+                text=thread_text,
+                thread_ts=thread_ts
+            )
+            
+        except Exception:
+            pass
+
+
+    def run_complete_automation(self, email, password):
+        """완전 자동화 프로세스 실행: 다운로드 → 처리 → 슬랙 전송"""
+        with self._traced_run("full") as tracer:
+            result = self._run_complete_automation(email, password)
+            tracer.set("ok", bool(result))
+            return result
+
+    def _run_complete_automation(self, email, password):
+        try:
+            print("🚀 완전 자동화 프로세스 시작")
+            print("=" * 60)
+            
+            # 1~5. 드라이버 설정 → 로그인 → 아트실 이동 → CSV 내보내기 → 처리 + 검증 (Due Date 체크 제외)
+            #      원본 export 가 같으면 처리 + 검증은 캐시 재사용 (export 자체는 --reuse-export 일 때만 재사용)
+            collected = self.build_pipeline(email, password).run(["processed_file", "validation_issues"])
+            if not collected.ok:
+                self.send_to_slack(None, None, collected.error)
+                return None
+            csv_file = collected.context["csv_file"]
+            processed_file = collected.context["processed_file"]
+            validation_issues = collected.context["validation_issues"]
+            self.archive_raw_export(collected)
+            self.update_analytics(collected)
+
+            print(f"\n✅ TU CSV 다운로드 완료: {csv_file}")
+            print(f"✅ CSV 처리 완료: {processed_file}")
+            
+            # 검증 결과 표시
+            if validation_issues:
+                print(f"⚠️ 검증 이슈 {len(validation_issues)}개 발견:")
+                for issue in validation_issues:
+                    print(f"  - {issue}")
+            else:
+                print("✅ 모든 데이터 검증 통과")
+            
+            
+            # 6. art 페이지 CSV 업로드 — 검증 오류 있으면 건너뜀, 마지막 업로드와 내용이 같으면 생략
+            print("\n6️⃣ art 페이지 CSV 업로드...")
+            today_str = datetime.now(self.korea_tz).strftime("%Y-%m-%d")
+            from reportbot.pipeline import file_digest
+            upload_store = UploadStateStore()
+            processed_sha256 = file_digest(processed_file)
+            set_metric("upload_sha256", processed_sha256)
+
+            if validation_issues:
+                print("⚠️ 검증 오류 있음 — art 업로드 건너뜀, 슬랙에 수동 업데이트 요청")
+                art_success = False
+                art_skipped = True
+                set_metric("upload", "skipped")
+            elif not self.force_upload and processed_sha256 == upload_store.last_sha256(self.year, self.month):
+                print(f"♻️ 마지막 업로드와 내용이 같음 (SHA-256 {processed_sha256[:12]}) — art 업로드 생략 (--force-upload 로 강제 업로드)")
+                art_success = True
+                art_skipped = False
+                set_metric("upload", "unchanged")
+            else:
+                art_skipped = False
+                art_success = traced("upload_stats", self.browser.upload_stats, processed_file)
+                set_metric("upload", "ok" if art_success else "failed")
+                if art_success:
+                    print("✅ art 페이지 업로드 완료!")
+                    try:
+                        upload_store.record(self.year, self.month, processed_sha256, os.path.basename(processed_file))
+                    except Exception as e:
+                        print(f"⚠️ 업로드 이력 저장 실패: {e}")
+                else:
+                    print("❌ 통계 업로드 실패 — 슬랙에 오류 알림")
+
+            # 7. 슬랙 노티 — 오류/실패 시에만 전송
+            print("\n7️⃣ 슬랙 노티 확인...")
+            needs_notify = art_skipped or not art_success
+
+            if not needs_notify:
+                print("✅ 오류 없음 — 슬랙 노티 생략")
+            else:
+                # 검증 오류 담당자 추출 (이름 → 슬랙 태그)
+                if art_skipped and validation_issues:
+                    # 오류 담당자 이름 추출
+                    error_names = set()
+                    for issue in validation_issues:
+                        if '님' in issue:
+                            name_part = issue.split('님')[0].strip().split()[-1]
+                            error_names.add(name_part)
+
+                    people_list = ", ".join(sorted(error_names))
+                    notify_msg = f"[{today_str}] ⚠️ 검증 오류 발견 — 확인 후 수동 업데이트 해주세요."
+                    if people_list:
+                        notify_msg += f"\n🧨 확인 필요한 사람 : {people_list}"
+                    notify_msg += "\n```\n[검증 오류]"
+                    for issue in validation_issues:
+                        notify_msg += f"\n- {issue}"
+                    notify_msg += "\n```"
+                else:
+                    notify_msg = f"[{today_str}] ❌ 통계 업로드 실패"
+
+                print(notify_msg)
+
+                if self.slack_client:
+                    success = traced(
+                        "slack_notify", self.send_to_slack,
+                        None, None,
+                        None if art_skipped else "통계 업로드 실패",
+                        validation_issues if art_skipped else None
+                    )
+                    if success:
+                        print("✅ 슬랙 노티 전송 완료!")
+                    else:
+                        print("❌ 슬랙 전송 실패")
+                else:
+                    print("⚠️ 슬랙 토큰이 없어 전송을 건너뜁니다.")
+            
+            # 8. 파일 정리
+            print("\n8️⃣ 파일 정리...")
+            with span("cleanup"):
+                try:
+                    # 원본 파일 삭제 (처리된 파일만 남김)
+                    if os.path.exists(csv_file):
+                        os.remove(csv_file)
+                        print(f"🗑️ 원본 파일 삭제: {os.path.basename(csv_file)}")
+                
+                    # Downloads 폴더의 export-projects 관련 파일들도 정리
+                    downloads_pattern = os.path.expanduser("~/Downloads/export-projects*.csv")
+                    downloads_files = glob.glob(downloads_pattern)
+                    for file in downloads_files:
+                        try:
+                            os.remove(file)
+                            print(f"🗑️ Downloads 파일 삭제: {os.path.basename(file)}")
+                        except:
+                            pass
+                
+                    print(f"📁 최종 파일: {processed_file}")
+                    print(f"📂 파일 위치: {os.path.abspath(processed_file)}")
+                    if os.path.exists(processed_file):
+                        file_size = os.path.getsize(processed_file)
+                        print(f"📊 파일 정보: {file_size} 바이트")
+                        print("💡 슬랙 업로드가 실패했다면 위 파일을 수동으로 업로드하세요.")
+                    print("✅ 파일 정리 완료 - 처리된 파일만 보존")
+                except Exception as e:
+                    print(f"⚠️ 파일 정리 실패: {e}")
+            
+            print("\n🎉 완전 자동화 프로세스 완료!")
+            print(f"📁 최종 파일: {processed_file}")
+            return processed_file
+                
+        except Exception as e:
+            error_msg = f"완전 자동화 프로세스 실패: {str(e)}"
+            print(f"\n❌ {error_msg}")
+            self.send_to_slack(None, None, error_msg)
+            return None
+            
+        finally:
+            # 브라우저 종료 (headless=False일 때는 5초 대기)
+            if not self.headless:
+                print("\n⏳ 브라우저 확인을 위해 5초 후 종료...")
+                time.sleep(5)
+            
+            self.browser.quit()
+            print("🔚 브라우저 종료")
+
+
+def _process_team_export(team_name, csv_file, period=None, workers=VALIDATION_WORKERS, use_cache=True):
+    """멀티 팀 모드 워커 (프로세스 풀에서 실행) — 팀 설정 폴더 기준 CSV 처리 + 검증
+
+    Args:
+        period (tuple): 처리할 (연도, 월) — 호출한 TaskworldDownloader 의 월 (None이면 현재 월)
+        workers (int): 검증 규칙 병렬 평가 프로세스 수 (--workers=N)
+        use_cache (bool): --no-cache 여부 (워커 인스턴스에도 그대로 전달)
+
+    Returns:
+        tuple: (팀명, 처리된 행 수 또는 None, 처리된 파일 경로 또는 오류 메시지, 검증 이슈 목록)
+    """
+    team_dir = os.path.join(TEAMS_DIR, team_name)
+    os.makedirs(team_dir, exist_ok=True)
+    processor = TaskworldDownloader(headless=True, config_dir=team_dir, connect_slack=False, period=period,
+                                    use_cache=use_cache, workers=workers)
+    result_df, _, processed_file, validation_issues = processor.process_csv(
+        csv_file, output_file=os.path.join(team_dir, processor.output_filename)
+    )
+    row_count = None if result_df is None else len(result_df)
+    return team_name, row_count, processed_file, validation_issues
@@ -0,0 +1 @@
+# reportbot/fakes - 로컬 테스트/벤치마크용 가짜 서버 모음 (운영 코드에서는 사용하지 않음)
@@ -0,0 +1,354 @@
+# reportbot/fakes/sites.py - 로컬 가짜 TU 인트라넷 + fbcweb 통계 업로드 사이트
+#
+# 실제 사이트의 선택자/흐름을 그대로 재현 (ChromeBackend/EdgeBackend/HttpBackend 공용)
+#   TU    : /login (이메일/비밀번호 폼) → /home (사이드바 '팀' + 버튼 → 팀 검색 다이얼로그)
+#           → /team/<팀명> ('통계' 탭) → /team/<팀명>/stats ('Taskworld 내보내기' 버튼)
+#           → /api/stats/export?team=<팀명> (CSV 다운로드)
+#   통계  : /stats/ ('CSV 업로드' 링크) → /stats/upload (#fileInput / #submitBtn) → '업로드 완료' 페이지
+#
+# 사용 예:
+#   with FakeSites(latency=0.2) as sites:
+#       backend = make_backend("http", tu_url=sites.tu_url, stats_url=sites.stats_url)
+#
+# 단독 실행: python -m reportbot.fakes.sites [포트] [--latency=초] [--export-delay=초] [--rows=N]
+#   → TU_BASE_URL / STATS_BASE_URL 을 출력된 주소로 설정하고 봇을 실행하면 실제 사이트 대신 이 서버로 접속
+import html
+import sys
+import threading
+import time
+import uuid
+from email import message_from_bytes
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote, unquote
+
+SESSION_COOKIE = "tu_session"
+
+
+class FakeSites:
+    def __init__(self, port=0, latency=0.0, export_delay=0.0, accounts=None, teams=None,
+                 preadded_teams=(), export_source=None, export_rows=300, seed=0):
+        """
+        Args:
+            port (int): 바인딩 포트 (0이면 임의 포트)
+            latency (float): 모든 응답에 추가할 지연 (초)
+            export_delay (float): CSV 내보내기 응답 추가 지연 (초, 서버에서 파일 만드는 시간 재현)
+            accounts (dict): 이메일 → 비밀번호 (None이면 비어있지 않은 아무 값이나 로그인 성공)
+            teams (list): 팀 검색 다이얼로그에 나오는 팀 목록
+            preadded_teams (iterable): 로그인 직후부터 사이드바에 있는 팀
+            export_source: 내보내기 CSV 경로, {팀명: 경로}, 또는 팀명 → CSV bytes 함수 (None이면 합성 export)
+            export_rows (int): 합성 export 행 수
+            seed (int): 합성 export seed
+        """
+        self.latency = latency
+        self.export_delay = export_delay
+        self.accounts = accounts
+        self.teams = list(teams or ["아트실", "UI팀", "리소스팀", "디자인팀", "TA팀"])
+        self.preadded_teams = list(preadded_teams)
+        self.export_source = export_source
+        self.export_rows = export_rows
+        self.seed = seed
+
+        self.requests = []     # (method, path, status, 처리 시간 초) 기록
+        self.uploads = []      # (파일명, bytes) 업로드 기록
+        self.exports = []      # 내보내기된 팀 이름 기록
+        self._sessions = {}    # 세션 토큰 → 사이드바 팀 목록
+        self._export_cache = {}
+        self._lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._httpd.server_address[1]
+
+    @property
+    def tu_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def stats_url(self):
+        return f"http://127.0.0.1:{self.port}/stats"
+
+    def export_bytes(self, team_name):
+        """팀의 내보내기 CSV 내용 (합성 export는 팀별로 한 번만 생성)"""
+        source = self.export_source
+        if callable(source):
+            return source(team_name)
+        if isinstance(source, dict):
+            source = source.get(team_name)
+        if source:
+            with open(source, 'rb') as f:
+                return f.read()
+        with self._lock:
+            if team_name not in self._export_cache:
+                from reportbot.fakes.synthetic import generate_export
+                df, _ = generate_export(self.export_rows, seed=self.seed)
+                self._export_cache[team_name] = df.to_csv(index=False).encode('utf-8-sig')
+            return self._export_cache[team_name]
+
+    # ------------------------------------------------------------------
+    # 페이지
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _page(title, body, script=""):
+        return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title></head>"
+                f"<body>{body}<script>{script}</script></body></html>")
+
+    def _login_page(self, error=""):
+        error_html = f"<p class='error'>{html.escape(error)}</p>" if error else ""
+        return self._page("로그인", f"""
+            <h1>TU 인트라넷</h1>{error_html}
+            <form method="post" action="/login">
+              <label>이메일<input type="email" name="email" placeholder="이메일"></label>
+              <label>비밀번호<input type="password" name="password"></label>
+              <button type="submit">로그인</button>
+            </form>
+            <button type="button" class="google">Google 계정으로 로그인</button>""")
+
+    def _sidebar(self, token):
+        teams = self._sessions.get(token, [])
+        team_links = "".join(f"<li><a href='/team/{quote(t)}'>{html.escape(t)}</a></li>" for t in teams)
+        return f"""
+            <nav class="sidebar">
+              <div>프로젝트</div>
+              <ul><li><a href="#">아트실 5월</a></li></ul>
+              <div class="section"><span>팀</span>
+                <button type="button" class="add-team" onclick="openTeamDialog()">
+                  <svg class="w-3.5 h-3.5" viewBox="0 0 14 14"><path d="M7 1v12M1 7h12"></path></svg>
+                </button>
+              </div>
+              <ul id="teams">{team_links}</ul>
+            </nav>"""
+
+    def _home_page(self, token):
+        options = "".join(f"<li class='team-option' style='display:none' onclick='addTeam(this.textContent)'>{html.escape(t)}</li>"
+                          for t in self.teams)
+        script = """
+            function openTeamDialog() { document.getElementById('teamDialog').style.display = 'block'; }
+            function filterTeams(q) {
+              document.querySelectorAll('.team-option').forEach(function (li) {
+                li.style.display = q && li.textContent.indexOf(q) >= 0 ? 'block' : 'none';
+              });
+            }
+            function addTeam(name) {
+              fetch('/teams/add', {method: 'POST', body: new URLSearchParams({name: name})})
+                .then(function () { location.reload(); });
+            }"""
+        return self._page("TU 홈", self._sidebar(token) + f"""
+            <main><h2>홈</h2></main>
+            <div id="teamDialog" style="display:none">
+              <input type="text" placeholder="팀 검색" oninput="filterTeams(this.value)">
+              <ul>{options}</ul>
+            </div>""", script)
+
+    def _team_page(self, token, team_name):
+        stats_url = f"/team/{quote(team_name)}/stats"
+        return self._page(team_name, self._sidebar(token) + f"""
+            <main><h2>{html.escape(team_name)}</h2>
+              <div class="tabs">
+                <button type="button" class="tab">업무</button>
+                <button type="button" class="tab" onclick="location.href='{stats_url}'">통계</button>
+              </div>
+            </main>""")
+
+    def _stats_page(self, token, team_name):
+        export_url = f"/api/stats/export?team={quote(team_name)}"
+        # 연속 클릭(일반 클릭 + JS 클릭)은 한 번만 내보내기
+        script = f"""
+            function exportCsv(btn) {{
+              if (btn.dataset.clicked) return;
+              btn.dataset.clicked = '1';
+              location.href = '{export_url}';
+            }}"""
+        return self._page(f"{team_name} 통계", self._sidebar(token) + f"""
+            <main><h2>{html.escape(team_name)} 통계</h2>
+              <button type="button" onclick="exportCsv(this)">Taskworld 내보내기</button>
+            </main>""", script)
+
+    def _upload_page(self):
+        script = """
+            document.getElementById('fileInput').addEventListener('change', function () {
+              document.getElementById('submitBtn').disabled = !this.files.length;
+            });"""
+        return self._page("CSV 업로드", """
+            <h1>통계 CSV 업로드</h1>
+            <form method="post" action="upload" enctype="multipart/form-data">
+              <input type="file" id="fileInput" name="file" accept=".csv" style="display:none">
+              <button type="submit" id="submitBtn" disabled>업로드</button>
+            </form>""", script)
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    def _make_handler(self):
+        sites = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+            def log_message(self, format, *args):
+                pass
+
+            def _token(self):
+                for part in (self.headers.get("Cookie") or "").split(";"):
+                    key, _, value = part.strip().partition("=")
+                    if key == SESSION_COOKIE and value in sites._sessions:
+                        return value
+                return None
+
+            def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+                return status
+
+            def _redirect(self, location, headers=None):
+                return self._send(303, headers={"Location": location, **(headers or {})})
+
+            def _read_body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _handle(self, method):
+                start = time.perf_counter()
+                if sites.latency:
+                    time.sleep(sites.latency)
+                path = unquote(urlparse(self.path).path)
+                query = parse_qs(urlparse(self.path).query)
+                try:
+                    status = self._route(method, path, query)
+                except Exception as e:
+                    status = self._send(500, f"서버 오류: {e}")
+                with sites._lock:
+                    sites.requests.append((method, path, status, time.perf_counter() - start))
+
+            def _route(self, method, path, query):
+                # 통계 업로드 사이트 (인증 없음)
+                if path in ("/stats", "/stats/"):
+                    return self._send(200, sites._page("통계", "<h1>통계</h1><a href='upload'>CSV 업로드</a>"))
+                if path == "/stats/upload" and method == "GET":
+                    return self._send(200, sites._upload_page())
+                if path == "/stats/upload" and method == "POST":
+                    return self._upload()
+
+                # TU 인트라넷
+                if path == "/login" and method == "GET":
+                    return self._send(200, sites._login_page())
+                if path == "/login" and method == "POST":
+                    return self._login()
+
+                token = self._token()
+                if token is None:
+                    return self._redirect("/login")
+                if path in ("/", "/home"):
+                    return self._send(200, sites._home_page(token))
+                if path == "/teams/add" and method == "POST":
+                    name = parse_qs(self._read_body().decode("utf-8")).get("name", [""])[0].strip()
+                    if name in sites.teams and name not in sites._sessions[token]:
+                        sites._sessions[token].append(name)
+                    return self._send(200, "ok", "text/plain; charset=utf-8")
+                if path.startswith("/team/"):
+                    parts = path[len("/team/"):].split("/")
+                    team_name = parts[0]
+                    if team_name not in sites._sessions[token]:
+                        return self._send(404, "팀 없음")
+                    if len(parts) > 1 and parts[1] == "stats":
+                        return self._send(200, sites._stats_page(token, team_name))
+                    return self._send(200, sites._team_page(token, team_name))
+                if path == "/api/stats/export":
+                    return self._export(query.get("team", [""])[0])
+                return self._send(404, "페이지 없음")
+
+            def _login(self):
+                form = parse_qs(self._read_body().decode("utf-8"))
+                email = form.get("email", [""])[0].strip()
+                password = form.get("password", [""])[0]
+                if sites.accounts is None:
+                    ok = bool(email and password)
+                else:
+                    ok = sites.accounts.get(email) == password
+                if not ok:
+                    return self._send(200, sites._login_page("이메일 또는 비밀번호가 올바르지 않습니다"))
+                token = uuid.uuid4().hex
+                with sites._lock:
+                    sites._sessions[token] = list(sites.preadded_teams)
+                return self._redirect("/home", {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/"})
+
+            def _export(self, team_name):
+                if team_name not in sites.teams:
+                    return self._send(404, "팀 없음")
+                if sites.export_delay:
+                    time.sleep(sites.export_delay)
+                data = sites.export_bytes(team_name)
+                with sites._lock:
+                    sites.exports.append(team_name)
+                    count = len(sites.exports)
+                filename = quote(f"export-projects-{team_name}-{count}.csv")
+                return self._send(200, data, "text/csv; charset=utf-8",
+                                  {"Content-Disposition": f"attachment; filename*=UTF-8''{filename}"})
+
+            def _upload(self):
+                content_type = self.headers.get("Content-Type", "")
+                body = self._read_body()
+                message = message_from_bytes(
+                    f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body, policy=HTTP
+                )
+                files = [(part.get_filename(), part.get_payload(decode=True) or b"")
+                         for part in message.iter_parts() if part.get_filename()] if message.is_multipart() else []
+                if not files or not files[0][1]:
+                    return self._send(200, sites._page("업로드 실패", "<h1>업로드 실패</h1><p>파일이 없습니다</p>"))
+                filename, data = files[0]
+                with sites._lock:
+                    sites.uploads.append((filename, data))
+                rows = data.decode("utf-8-sig", errors="replace").count("\n")
+                return self._send(200, sites._page("업로드 완료", f"<h1>업로드 완료</h1><p>{html.escape(filename)} ({rows}행)</p>"))
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    sites = FakeSites(
+        port=int(args[0]) if args else 8766,
+        latency=float(options.get("latency", 0)),
+        export_delay=float(options.get("export-delay", 0)),
+        export_rows=int(options.get("rows", 300)),
+    )
+    print("🧪 가짜 TU/통계 사이트 실행:")
+    print(f"   TU_BASE_URL={sites.tu_url}")
+    print(f"   STATS_BASE_URL={sites.stats_url}")
+    try:
+        sites._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
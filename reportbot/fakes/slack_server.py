@@ -0,0 +1,149 @@
+# reportbot/fakes/slack_server.py - 로컬 가짜 슬랙 Web API 서버
+#
+# 사용 예:
+#   with FakeSlackServer(rate_limit_first=2, retry_after=1) as server:
+#       sender = SlackSender("xoxb-test", base_url=server.base_url)
+#       sender.chat_postMessage(channel="#아트실", text="hi")
+#       print(server.requests)
+#
+# 단독 실행: python -m reportbot.fakes.slack_server [포트]
+#   → SLACK_API_URL=http://127.0.0.1:<포트>/api/ 로 봇을 실행하면 실제 슬랙 대신 이 서버로 전송됨
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeSlackServer:
+    def __init__(self, port=0, rate_limit_first=0, retry_after=1, server_errors_first=0, latency=0.0, channels=None):
+        """
+        Args:
+            port (int): 바인딩 포트 (0이면 임의 포트)
+            rate_limit_first (int): 처음 N개 요청에 429 + Retry-After 응답
+            retry_after (int): 429 응답의 Retry-After 값 (초)
+            server_errors_first (int): (429 이후) 다음 N개 요청에 500 응답
+            latency (float): 모든 응답에 추가할 지연 (초)
+            channels (list): conversations.list 가 돌려줄 채널 이름 목록
+        """
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.server_errors_first = server_errors_first
+        self.latency = latency
+        self.channels = channels or ["아트실"]
+
+        self.requests = []          # (method, payload, Authorization 헤더, 응답 HTTP 상태) 기록 — 429/500 응답도 포함
+        self.connections = set()    # 요청이 들어온 클라이언트 포트 (커넥션 재사용 확인용)
+        self._lock = threading.Lock()
+        self._count = 0
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}/api/"
+
+    def messages(self):
+        """chat.postMessage 로 성공 처리된 (채널, 텍스트) 목록"""
+        return [(p.get("channel"), p.get("text")) for m, p, _, status in self.requests
+                if m == "chat.postMessage" and status == 200]
+
+    def _next_status(self):
+        with self._lock:
+            self._count += 1
+            n = self._count
+        if n <= self.rate_limit_first:
+            return 429
+        if n <= self.rate_limit_first + self.server_errors_first:
+            return 500
+        return 200
+
+    def _respond(self, method, payload):
+        if method == "auth.test":
+            return {"ok": True, "user": "reportbot", "team": "fake"}
+        if method == "chat.postMessage":
+            if not payload.get("channel"):
+                return {"ok": False, "error": "channel_not_found"}
+            return {"ok": True, "channel": payload["channel"], "ts": f"{time.time():.6f}"}
+        if method == "conversations.list":
+            return {"ok": True, "channels": [{"id": f"C{i:04d}", "name": name} for i, name in enumerate(self.channels)]}
+        return {"ok": False, "error": "unknown_method"}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                try:
+                    payload = json.loads(body.decode("utf-8")) if body else {}
+                except ValueError:
+                    payload = {}
+                method = self.path.rstrip("/").rsplit("/", 1)[-1]
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                status = server._next_status()
+                with server._lock:
+                    server.requests.append((method, payload, self.headers.get("Authorization"), status))
+                    server.connections.add(self.client_address[1])
+
+                if status == 429:
+                    data, headers = {"ok": False, "error": "ratelimited"}, {"Retry-After": str(server.retry_after)}
+                elif status == 500:
+                    data, headers = {"ok": False, "error": "internal_error"}, {}
+                else:
+                    data, headers = server._respond(method, payload), {}
+
+                raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json; charset=utf-8")
+                    self.send_header("Content-Length", str(len(raw)))
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(raw)
+                except ConnectionError:
+                    # 클라이언트가 응답 타임아웃으로 먼저 연결을 끊은 경우 (latency 테스트)
+                    self.close_connection = True
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = FakeSlackServer(port=port)
+    print(f"🧪 가짜 슬랙 서버 실행: SLACK_API_URL={server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,183 @@
+# reportbot/fakes/synthetic.py - 벤치마크/오프라인 확인용 합성 TU 통계 export 생성기
+#
+# 사용 예:
+#   df, people = generate_export(10_000, seed=1)
+#   result = process_export(df, synthetic_config(people), (2026, 10))
+#
+# 단독 실행: python -m reportbot.fakes.synthetic <행 수> [저장 경로] [--seed=N]
+#   → 실제 export와 같은 열 구성의 CSV 저장 (email_map 용 "이메일 : 이름" 목록은 <저장 경로>.email_map.txt)
+#
+# 같은 (행 수, seed) 면 항상 같은 데이터가 나옴 (벤치마크 이슈 수 비교 기준)
+import sys
+
+from reportbot.processing import ProcessingConfig
+
+EXPORT_COLUMNS = ['Project', 'Tasklist', 'Task', 'Assigned To', 'Tags', 'Status', 'Time Spent']
+
+# 이름 생성용 음절 (성 + 이름 두 글자)
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민진나"
+_GIVEN = "민서지현수영준우진하은도연예윤호성재희원주아경태상혜동채유건나석찬"
+
+# 태그 설정 (루트 설정 파일과 같은 값)
+FIRST_TAGS_REQUIRED = ["실업무", "cpm", "c-", "9up", "9-", "a1", "netb", "n-", "abl", "fbc"]
+FIRST_TAGS_OPTIONAL = ["공통업무", "연차", "사내행사", "행사공결", "공휴일"]
+SECOND_TAGS_ART = ["회의", "문서작업", "ux/ui", "ui에디팅", "카드", "2d일러", "캐릭터2d", "배경2d", "프랍2d", "2d연출",
+                   "캐릭터3d", "배경3d", "프랍3d", "캐릭터애니", "3d연출", "기타애니"]
+SECOND_TAGS_PROJECT = ["ui기술지원", "아트기술지원", "시스템구현"]
+LEAVE_KEYWORDS = ["연차", "반차", "반반차", "오전반차", "오후반차", "생일", "시간차", "행사공결"]
+WORK_TASKLISTS = ["아트실", "cpm 업무", "9up 업무", "fbc 리소스", "UI팀", "주요일정", "리소스팀"]
+# 제외 Tasklist (루트 exclude_values.txt 값 중 아트실을 뺀 것 — 디자인팀은 합성 데이터에 없는 값)
+EXCLUDE_VALUES = ["주요일정", "UI팀", "리소스팀", "디자인팀"]
+
+# 행 종류별 비율 (합 1.0)
+_TAG_KINDS = {
+    "valid_required": 0.55,   # 필수 그룹 첫 태그 + 허용 두 번째 태그
+    "valid_optional": 0.15,   # 선택 그룹 첫 태그 (두 번째 태그 없음)
+    "bad_first": 0.05,        # 허용되지 않는 첫 태그
+    "missing_second": 0.05,   # 필수 그룹인데 두 번째 태그 없음
+    "bad_second": 0.05,       # 허용되지 않는 두 번째 태그
+    "empty": 0.05,            # 태그 없음
+    "spaced": 0.10,           # 공백/대소문자 섞인 유효 태그 ("cpm-신규 , 회의")
+}
+
+
+def synthetic_people(count, seed=0):
+    """이메일 → 한글 이름 dict (이름 중복 없음)"""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    people = {}
+    names = set()
+    while len(people) < count:
+        name = (_SURNAMES[rng.integers(len(_SURNAMES))]
+                + _GIVEN[rng.integers(len(_GIVEN))] + _GIVEN[rng.integers(len(_GIVEN))])
+        if name in names:
+            continue
+        names.add(name)
+        people[f"user{len(people):05d}@aceproject.co.kr"] = name
+    return people
+
+
+def synthetic_config(people, exclude_count=1, exclude_values=EXCLUDE_VALUES):
+    """합성 데이터용 ProcessingConfig (앞쪽 exclude_count명은 exclude_names, 제외 Tasklist 는 EXCLUDE_VALUES)"""
+    return ProcessingConfig(
+        email_map=people,
+        exclude_names=list(people.values())[:exclude_count],
+        leave_keywords=LEAVE_KEYWORDS,
+        exclude_values=exclude_values,
+        first_tags_required=FIRST_TAGS_REQUIRED,
+        first_tags_optional=FIRST_TAGS_OPTIONAL,
+        second_tags_art=SECOND_TAGS_ART,
+        second_tags_project=SECOND_TAGS_PROJECT,
+    )
+
+
+def _time_strings(rng, count):
+    """Time Spent 값 — HH:MM:SS / MM:SS / 소수 / 빈 값 / 잘못된 값 섞어서"""
+    import numpy as np
+    hours = rng.integers(0, 9, count)
+    minutes = rng.choice([0, 15, 30, 45], count)
+    kind = rng.choice(5, count, p=[0.6, 0.15, 0.15, 0.07, 0.03])
+
+    hms = np.char.add(np.char.add(np.char.zfill(hours.astype(str), 2), ":"),
+                      np.char.add(np.char.zfill(minutes.astype(str), 2), ":00"))
+    ms = np.char.add(np.char.zfill(minutes.astype(str), 2), ":00")
+    decimal = (hours + minutes / 60.0).round(2).astype(str)
+    values = np.where(kind == 0, hms, np.where(kind == 1, ms, np.where(kind == 2, decimal, "")))
+    return np.where(kind == 4, "약 1시간", values).astype(object)
+
+
+def _tag_strings(rng, count):
+    import numpy as np
+    kinds = list(_TAG_KINDS)
+    kind = rng.choice(len(kinds), count, p=list(_TAG_KINDS.values()))
+    required = np.array(FIRST_TAGS_REQUIRED, dtype=object)[rng.integers(len(FIRST_TAGS_REQUIRED), size=count)]
+    optional = np.array(FIRST_TAGS_OPTIONAL, dtype=object)[rng.integers(len(FIRST_TAGS_OPTIONAL), size=count)]
+    second_all = SECOND_TAGS_ART + SECOND_TAGS_PROJECT
+    second = np.array(second_all, dtype=object)[rng.integers(len(second_all), size=count)]
+    suffix = np.array(["", "-신규", " 2차", "_수정"], dtype=object)[rng.integers(4, size=count)]
+    bad = np.array(["xx", "기타", "tmp", "작업"], dtype=object)[rng.integers(4, size=count)]
+
+    tags = np.empty(count, dtype=object)
+    by_kind = {
+        "valid_required": required + suffix + "," + second,
+        "valid_optional": optional,
+        "bad_first": bad + "," + second,
+        "missing_second": required + suffix,
+        "bad_second": required + "," + bad,
+        "empty": np.full(count, None, dtype=object),
+        "spaced": required + suffix + " , " + second + " ",
+    }
+    for i, name in enumerate(kinds):
+        mask = kind == i
+        tags[mask] = by_kind[name][mask]
+    return tags
+
+
+def generate_export(rows, seed=0, people_count=None, month=(2026, 10)):
+    """
+    실제 TU 통계 export와 같은 열 구성의 합성 DataFrame 생성
+
+    - 인원: 기본 행 200개당 1명 (최소 8명), 1%는 담당자 없음, 1%는 email_map 미등록 이메일
+    - Tasklist: 15%는 연차/반차류 키워드
+    - Tags / Time Spent: 정상 + 오류 형식 섞음 (_TAG_KINDS, _time_strings)
+
+    Returns:
+        tuple: (DataFrame, {이메일: 이름})
+    """
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    people = synthetic_people(people_count or max(8, rows // 200), seed=seed)
+    emails = np.array(list(people), dtype=object)
+
+    assigned = emails[rng.integers(len(emails), size=rows)]
+    assignee_kind = rng.random(rows)
+    assigned[assignee_kind < 0.01] = None
+    unknown = (assignee_kind >= 0.01) & (assignee_kind < 0.02)
+    assigned[unknown] = "outsider@partner.com"
+
+    leave = np.array(LEAVE_KEYWORDS, dtype=object)[rng.integers(len(LEAVE_KEYWORDS), size=rows)]
+    work = np.array(WORK_TASKLISTS, dtype=object)[rng.integers(len(WORK_TASKLISTS), size=rows)]
+    tasklist = np.where(rng.random(rows) < 0.15, leave, work)
+
+    task_ids = np.arange(rows).astype(str)
+    task = np.where(rng.random(rows) < 0.5,
+                    np.char.add("작업 ", task_ids),
+                    np.char.add(np.char.add("리소스 제작 - 캐릭터 시안 및 피드백 반영 ", task_ids), "차")).astype(object)
+
+    status = np.array(["Completed", "In Progress", "To Do"], dtype=object)[rng.choice(3, rows, p=[0.4, 0.5, 0.1])]
+
+    df = pd.DataFrame({
+        'Project': f"아트실 {month[1]}월",
+        'Tasklist': tasklist,
+        'Task': task,
+        'Assigned To': assigned,
+        'Tags': _tag_strings(rng, rows),
+        'Status': status,
+        'Time Spent': _time_strings(rng, rows),
+    }, columns=EXPORT_COLUMNS)
+    return df, people
+
+
+def write_export(path, rows, seed=0):
+    """합성 export CSV + email_map 파일 저장 → (CSV 경로, email_map 경로)"""
+    df, people = generate_export(rows, seed=seed)
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    email_map_path = path + ".email_map.txt"
+    with open(email_map_path, 'w', encoding='utf-8') as f:
+        f.write("# 합성 export 용 이메일 → 이름 매핑\n")
+        for email, name in people.items():
+            f.write(f"{email} : {name}\n")
+    return path, email_map_path
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    seed = next((int(a.split("=", 1)[1]) for a in sys.argv[1:] if a.startswith("--seed=")), 0)
+    if not args:
+        print("❌ 사용법: python -m reportbot.fakes.synthetic <행 수> [저장 경로] [--seed=N]")
+        sys.exit(1)
+    rows = int(args[0].lower().replace("k", "000").replace("m", "000000"))
+    path = args[1] if len(args) > 1 else f"export-synthetic-{args[0]}.csv"
+    csv_path, map_path = write_export(path, rows, seed=seed)
+    print(f"🧪 합성 export 저장: {csv_path} ({rows}행), email_map: {map_path}")
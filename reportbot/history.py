@@ -0,0 +1,162 @@
+# reportbot/history.py - 실행 이력 DB (SQLite) + 월별 추세 리포트 (markdown / HTML)
+#
+# 전체 / 검증 / 멀티 팀 실행이 끝날 때마다 실행 리포트(reportbot/tracing.py)를 한 행으로 추가:
+#   runs         — 모드, 대상 월, 전체 소요 시간, 원본/처리 행 수, 이슈 수, 업로드 결과, 성공 여부
+#   stages       — 최상위 단계별 소요 시간 (로그인 / CSV 내보내기 / 처리 / 업로드 ...)
+#   person_hours — 사람별 시간 합계
+#
+# 추세 리포트: python tu_downloader.py history  → run_reports/trend.md, run_reports/trend.html
+# GitHub Actions 에서는 .reportbot_state/ 를 actions/cache 로 유지하므로 이력이 실행 간 누적됨
+import os
+import html
+
+from reportbot.issue_state import STATE_DIR
+
+HISTORY_DB = os.path.join(STATE_DIR, "run_history.sqlite3")
+
+# 추세 리포트의 최근 실행 목록 개수
+RECENT_RUNS = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    backend TEXT,
+    period TEXT,
+    duration_s REAL,
+    ok INTEGER,
+    rows_in INTEGER,
+    rows_out INTEGER,
+    issues INTEGER,
+    hours_issues INTEGER,
+    tag_issues INTEGER,
+    upload TEXT,
+    slack_retries INTEGER
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    stage TEXT NOT NULL,
+    duration_s REAL,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS person_hours (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    hours REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_period ON runs(period, mode);
+"""
+
+
+class RunHistory:
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+
+    def _connect(self):
+        import sqlite3
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def record(self, report):
+        """실행 리포트 dict (Tracer.report()) 1건 저장 → run id"""
+        metrics = report.get("metrics", {})
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO runs (started_at, mode, backend, period, duration_s, ok, rows_in, rows_out,"
+                    " issues, hours_issues, tag_issues, upload, slack_retries)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (report["started_at"], report["mode"], metrics.get("backend"), metrics.get("period"),
+                     report.get("duration_s"), None if "ok" not in metrics else int(bool(metrics["ok"])),
+                     metrics.get("rows_in"), metrics.get("rows_out"), metrics.get("issues"),
+                     metrics.get("hours_issues"), metrics.get("tag_issues"), metrics.get("upload"),
+                     metrics.get("slack_retries")))
+                run_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO stages (run_id, stage, duration_s, status) VALUES (?, ?, ?, ?)",
+                    [(run_id, s["name"], s["duration_s"], s["status"])
+                     for s in report.get("spans", []) if s.get("parent") is None])
+                conn.executemany(
+                    "INSERT INTO person_hours (run_id, name, hours) VALUES (?, ?, ?)",
+                    [(run_id, name, float(hours)) for name, hours in report.get("person_hours", {}).items()])
+            return run_id
+        finally:
+            conn.close()
+
+    def _query(self, sql, params=()):
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def tables(self, recent=RECENT_RUNS):
+        """추세 리포트 표 목록 → [(제목, 헤더, 행 목록)]"""
+        recent_runs = self._query(
+            "SELECT started_at, mode, period, duration_s, rows_in, rows_out, issues, upload,"
+            " CASE ok WHEN 1 THEN '✅' WHEN 0 THEN '❌' ELSE '-' END"
+            " FROM runs ORDER BY id DESC LIMIT ?", (recent,))
+
+        # 월별 단계 평균 소요 시간 — 같은 월 안에서 늘어나면 사이트/선택자 지연, 월이 갈수록 늘면 데이터 증가 영향
+        stage_rows = self._query(
+            "SELECT r.period, s.stage, COUNT(*), AVG(s.duration_s), MAX(s.duration_s)"
+            " FROM stages s JOIN runs r ON r.id = s.run_id"
+            " GROUP BY r.period, s.stage ORDER BY r.period, MIN(s.rowid)")
+
+        # 월별 데이터 규모 — 원본 행 수 / 인원 / 총 시간 (해당 월 마지막 실행 기준)
+        growth = self._query(
+            "SELECT r.period, COUNT(DISTINCT r.id), MAX(r.rows_in), MAX(r.rows_out),"
+            " (SELECT COUNT(*) FROM person_hours p WHERE p.run_id = MAX(r.id)),"
+            " (SELECT ROUND(SUM(p.hours), 1) FROM person_hours p WHERE p.run_id = MAX(r.id)),"
+            " ROUND(AVG(r.duration_s), 1), ROUND(AVG(r.issues), 1)"
+            " FROM runs r GROUP BY r.period ORDER BY r.period")
+
+        return [
+            ("최근 실행", ["시작", "모드", "월", "전체(s)", "원본 행", "처리 행", "이슈", "업로드", "성공"],
+             [list(row) for row in recent_runs]),
+            ("월별 단계 소요 시간", ["월", "단계", "실행 수", "평균(s)", "최대(s)"],
+             [[p, s, n, f"{avg or 0:.2f}", f"{mx or 0:.2f}"] for p, s, n, avg, mx in stage_rows]),
+            ("월별 데이터 규모", ["월", "실행 수", "원본 행", "처리 행", "인원", "총 시간", "평균 전체(s)", "평균 이슈"],
+             [list(row) for row in growth]),
+        ]
+
+    def markdown(self, recent=RECENT_RUNS):
+        lines = ["# 📈 실행 이력 추세", ""]
+        for title, headers, rows in self.tables(recent):
+            lines += [f"## {title}", "", "| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+            lines += ["| " + " | ".join(_cell(v) for v in row) + " |" for row in rows]
+            lines.append("")
+        return "\n".join(lines)
+
+    def html(self, recent=RECENT_RUNS):
+        parts = ["<!DOCTYPE html>", "<html lang='ko'><head><meta charset='utf-8'><title>실행 이력 추세</title>",
+                 "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin-bottom:24px}"
+                 "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}</style></head><body>",
+                 "<h1>📈 실행 이력 추세</h1>"]
+        for title, headers, rows in self.tables(recent):
+            parts.append(f"<h2>{html.escape(title)}</h2><table>")
+            parts.append("<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in headers) + "</tr>")
+            for row in rows:
+                parts.append("<tr>" + "".join(f"<td>{html.escape(_cell(v))}</td>" for v in row) + "</tr>")
+            parts.append("</table>")
+        parts.append("</body></html>")
+        return "\n".join(parts)
+
+    def write_trend_report(self, output_dir, recent=RECENT_RUNS):
+        """trend.md / trend.html 저장 → (md 경로, html 경로)"""
+        os.makedirs(output_dir, exist_ok=True)
+        md_path = os.path.join(output_dir, "trend.md")
+        html_path = os.path.join(output_dir, "trend.html")
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(self.markdown(recent))
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(self.html(recent))
+        return md_path, html_path
+
+
+def _cell(value):
+    return "-" if value is None else str(value)
@@ -0,0 +1,218 @@
+# reportbot/instrument.py - Selenium WebDriver 호출 계측 (명령 종류별 횟수 / 총 시간 / 타임아웃, 단계별)
+#
+# 사용 예:
+#   stats = CommandStats()
+#   driver = InstrumentedDriver(webdriver.Chrome(options=...), stats, "tu")
+#   WebDriverWait(driver, 8).until(...)     # 이 모듈의 WebDriverWait — until 전체 시간도 기록
+#   print(stats.table())                     # 단계 × 명령별 횟수/시간 + 가장 느린 호출 N개
+#
+# 단계는 현재 열려 있는 최상위 span 이름 (reportbot/tracing.py, 없으면 "-")
+# 느린 호출에는 가장 안쪽 span (예: probe 의 selector) 을 함께 기록 → 어떤 대체 선택자/대기가 비싼지 확인
+import time
+import heapq
+import threading
+
+from reportbot.tracing import current_span, current_stage
+
+# 가장 느린 호출 목록 크기 (실행 끝에 출력)
+SLOWEST_CALLS = 10
+
+# 시간을 잴 드라이버 메서드 / 속성
+DRIVER_COMMANDS = {"get", "find_element", "find_elements", "execute_script", "quit", "refresh", "back"}
+DRIVER_PROPERTIES = {"page_source", "current_url", "title"}
+
+# 시간을 잴 요소 메서드 / 속성
+ELEMENT_COMMANDS = {"click", "send_keys", "clear", "is_displayed", "is_enabled", "get_attribute",
+                    "find_element", "find_elements"}
+ELEMENT_PROPERTIES = {"text", "tag_name"}
+
+
+class CommandStats:
+    def __init__(self, top_n=SLOWEST_CALLS):
+        """
+        WebDriver 명령 통계 — (단계, 명령) 별 횟수 / 총 시간 / 타임아웃 / 오류 + 가장 느린 호출 top_n개
+
+        Args:
+            top_n (int): 기록할 가장 느린 호출 개수
+        """
+        self.top_n = top_n
+        self.commands = {}     # (단계, 명령) → [횟수, 총 시간, 타임아웃, 기타 오류]
+        self.slowest = []      # (시간, 순번, 호출 정보) 최소 힙
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self):
+        return sum(entry[0] for entry in self.commands.values())
+
+    def record(self, command, duration, error=None, detail=None, driver=None):
+        """명령 1회 기록 (error: 발생한 예외, detail: 선택자/URL 등, driver: 드라이버 이름 tu/art)"""
+        stage = current_stage() or "-"
+        timeout = error is not None and type(error).__name__ == "TimeoutException"
+        inner = current_span()
+        call = {
+            "stage": stage,
+            "command": command,
+            "duration_s": round(duration, 3),
+            **({"driver": driver} if driver else {}),
+            **({"detail": detail} if detail else {}),
+            **({"span": inner.name, **({"selector": inner.attrs["selector"]} if "selector" in inner.attrs else {})}
+               if inner is not None and inner.name != stage else {}),
+            **({"error": type(error).__name__} if error is not None else {}),
+        }
+        with self._lock:
+            entry = self.commands.setdefault((stage, command), [0, 0.0, 0, 0])
+            entry[0] += 1
+            entry[1] += duration
+            if timeout:
+                entry[2] += 1
+            elif error is not None:
+                entry[3] += 1
+            self._seq += 1
+            item = (duration, self._seq, call)
+            if len(self.slowest) < self.top_n:
+                heapq.heappush(self.slowest, item)
+            elif duration > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, item)
+
+    def slowest_calls(self):
+        """가장 느린 호출 목록 (느린 순)"""
+        return [call for _, _, call in sorted(self.slowest, key=lambda item: -item[0])]
+
+    def summary(self):
+        """JSON 직렬화 가능한 통계 dict (실행 리포트의 selenium_commands 항목)"""
+        by_stage = {}
+        for (stage, command), (count, total, timeouts, errors) in self.commands.items():
+            by_stage.setdefault(stage, {})[command] = {
+                "count": count,
+                "total_s": round(total, 3),
+                "timeouts": timeouts,
+                "errors": errors,
+            }
+        return {"by_stage": by_stage, "slowest": self.slowest_calls()}
+
+    def table(self):
+        """단계 × 명령별 표 + 가장 느린 호출 목록"""
+        lines = [f"{'단계':<24}{'명령':<20}{'횟수':>6}{'시간(s)':>10}{'타임아웃':>8}{'오류':>6}"]
+        for (stage, command), (count, total, timeouts, errors) in sorted(
+                self.commands.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{stage[:24]:<24}{command:<20}{count:>6}{total:>10.2f}{timeouts:>8}{errors:>6}")
+        if self.slowest:
+            lines.append(f"🐢 가장 느린 호출 {len(self.slowest)}개:")
+            for call in self.slowest_calls():
+                where = call.get("selector") or call.get("detail") or ""
+                error = f" ❌ {call['error']}" if "error" in call else ""
+                lines.append(f"  {call['duration_s']:>7.2f}s  [{call['stage']}] {call['command']} {where}{error}")
+        return "\n".join(lines)
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, _Instrumented) else value
+
+
+def _detail(command, args):
+    """기록용 호출 정보 — find_element 는 선택자, get 은 URL, execute_script 는 스크립트 앞부분"""
+    if command in ("find_element", "find_elements") and len(args) >= 2:
+        return str(args[1])[:120]
+    if command == "get" and args:
+        return str(args[0])[:120]
+    if command == "execute_script" and args:
+        return str(args[0])[:60]
+    return None
+
+
+class _Instrumented:
+    _commands = frozenset()
+    _properties = frozenset()
+
+    def __init__(self, target, stats, label):
+        self._target = target
+        self._stats = stats
+        self._label = label
+
+    def _wrap(self, value):
+        """find_element(s) 결과 요소도 계측 대상으로 감싸기"""
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        if hasattr(value, "click") and hasattr(value, "send_keys") and not isinstance(value, _Instrumented):
+            return InstrumentedElement(value, self._stats, self._label)
+        return value
+
+    def _timed(self, command, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            value = func(*args, **kwargs)
+        except Exception as e:
+            self._stats.record(command, time.perf_counter() - start, error=e,
+                               detail=_detail(command, args), driver=self._label)
+            raise
+        self._stats.record(command, time.perf_counter() - start, detail=_detail(command, args), driver=self._label)
+        return value
+
+    def __getattr__(self, name):
+        if name in ("_target", "_stats", "_label"):
+            raise AttributeError(name)
+        if name in self._properties:
+            return self._wrap(self._timed(name, getattr, self._target, name))
+        value = getattr(self._target, name)
+        if name not in self._commands or not callable(value):
+            return value
+
+        def command(*args, **kwargs):
+            args = [_unwrap(a) for a in args]
+            kwargs = {k: _unwrap(v) for k, v in kwargs.items()}
+            return self._wrap(self._timed(name, value, *args, **kwargs))
+        return command
+
+    def __eq__(self, other):
+        return self._target == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+
+class InstrumentedDriver(_Instrumented):
+    """WebDriver 프록시 — DRIVER_COMMANDS / DRIVER_PROPERTIES 호출 시간 기록, 나머지는 그대로 전달"""
+    _commands = frozenset(DRIVER_COMMANDS)
+    _properties = frozenset(DRIVER_PROPERTIES)
+
+
+class InstrumentedElement(_Instrumented):
+    """WebElement 프록시 (execute_script 등에 넘길 때는 원래 요소로 되돌려 전달)"""
+    _commands = frozenset(ELEMENT_COMMANDS)
+    _properties = frozenset(ELEMENT_PROPERTIES)
+
+
+_wait_class = None
+
+
+def WebDriverWait(driver, timeout, *args, **kwargs):
+    """selenium WebDriverWait 대신 사용 — InstrumentedDriver 면 until/until_not 전체 시간과 타임아웃 기록"""
+    global _wait_class
+    if _wait_class is None:
+        from selenium.webdriver.support.ui import WebDriverWait as _SeleniumWait
+
+        class _InstrumentedWait(_SeleniumWait):
+            def until(self, method, message=""):
+                return self._timed("wait.until", super().until, method, message)
+
+            def until_not(self, method, message=""):
+                return self._timed("wait.until_not", super().until_not, method, message)
+
+            def _timed(self, command, func, method, message):
+                stats = getattr(self._driver, "_stats", None)
+                label = getattr(self._driver, "_label", None)
+                if stats is None:
+                    return func(method, message)
+                start = time.perf_counter()
+                try:
+                    value = func(method, message)
+                except Exception as e:
+                    stats.record(command, time.perf_counter() - start, error=e,
+                                 detail=f"timeout={self._timeout:g}s", driver=label)
+                    raise
+                stats.record(command, time.perf_counter() - start, driver=label)
+                return value
+
+        _wait_class = _InstrumentedWait
+    return _wait_class(driver, timeout, *args, **kwargs)
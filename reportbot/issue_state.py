@@ -0,0 +1,136 @@
+# reportbot/issue_state.py - 월별 검증 이슈 상태 저장 + 이전 실행 대비 변경분(diff) 계산
+#                            + 월별 통계 업로드 이력 (업로드한 CSV SHA-256 → 같은 내용이면 재업로드 생략)
+import os
+import json
+from datetime import datetime, timezone, timedelta
+
+# 상태 파일 저장 폴더 (GitHub Actions에서는 actions/cache로 실행 간 유지)
+STATE_DIR = ".reportbot_state"
+
+_KST = timezone(timedelta(hours=9))
+
+
+def issue_person(issue):
+    """이슈 문장에서 담당자 이름 추출 ('배진희님 태그 오류 : ...' → '배진희'), 없으면 None"""
+    if "님" not in issue:
+        return None
+    words = issue.split("님")[0].strip().split()
+    if not words:
+        return None
+    name = words[-1]
+    if len(name) >= 2 and all('가' <= char <= '힣' for char in name):
+        return name
+    return None
+
+
+class IssueDiff:
+    def __init__(self, previous, current):
+        """
+        이전 실행과 현재 실행의 이슈 목록 비교 결과
+
+        Args:
+            previous (list|None): 이전 실행 이슈 목록 (None이면 이번 달 첫 실행)
+            current (list): 현재 실행 이슈 목록
+        """
+        current = list(dict.fromkeys(current))
+        previous_set = set(previous or [])
+        current_set = set(current)
+
+        self.is_first_run = previous is None
+        self.current = current
+        self.new = [issue for issue in current if issue not in previous_set]
+        self.resolved = [issue for issue in dict.fromkeys(previous or []) if issue not in current_set]
+
+        # 사람별 남은(현재) 이슈 수
+        self.person_counts = {}
+        for issue in current:
+            name = issue_person(issue) or '미분류'
+            self.person_counts[name] = self.person_counts.get(name, 0) + 1
+
+    @property
+    def has_changes(self):
+        return bool(self.new or self.resolved)
+
+
+class IssueStateStore:
+    def __init__(self, state_dir=STATE_DIR):
+        self.state_dir = state_dir
+
+    def path(self, year, month):
+        return os.path.join(self.state_dir, f"issues_{str(year)[2:]}_{month}.json")
+
+    def load(self, year, month):
+        """마지막으로 알린 이슈 목록 로드 (파일이 없거나 깨졌으면 None)"""
+        path = self.path(year, month)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return list(json.load(f).get("issues", []))
+        except FileNotFoundError:
+            return None
+        except (ValueError, OSError) as e:
+            print(f"⚠️ 이슈 상태 파일 읽기 실패 ({path}): {e} — 전체 리포트로 전송")
+            return None
+
+    def save(self, year, month, issues):
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.path(year, month)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "year": year,
+                "month": month,
+                "updated_at": datetime.now(_KST).isoformat(timespec='seconds'),
+                "issues": list(dict.fromkeys(issues)),
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def diff(self, year, month, issues):
+        return IssueDiff(self.load(year, month), issues)
+
+
+# 월별 업로드 이력 파일에 남길 최근 업로드 수
+UPLOAD_HISTORY_LIMIT = 50
+
+
+class UploadStateStore:
+    def __init__(self, state_dir=STATE_DIR):
+        self.state_dir = state_dir
+
+    def path(self, year, month):
+        return os.path.join(self.state_dir, f"uploads_{str(year)[2:]}_{month}.json")
+
+    def load(self, year, month):
+        """성공한 업로드 이력 (오래된 순, 파일이 없거나 깨졌으면 빈 목록)"""
+        path = self.path(year, month)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return list(json.load(f).get("uploads", []))
+        except FileNotFoundError:
+            return []
+        except (ValueError, OSError) as e:
+            print(f"⚠️ 업로드 이력 파일 읽기 실패 ({path}): {e} — 업로드 진행")
+            return []
+
+    def last_sha256(self, year, month):
+        """마지막으로 성공한 업로드의 CSV SHA-256 (없으면 None)"""
+        uploads = self.load(year, month)
+        return uploads[-1]["sha256"] if uploads else None
+
+    def record(self, year, month, sha256, file_name):
+        """성공한 업로드 1건 추가"""
+        uploads = self.load(year, month)
+        uploads.append({
+            "sha256": sha256,
+            "file": file_name,
+            "uploaded_at": datetime.now(_KST).isoformat(timespec='seconds'),
+        })
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.path(year, month)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "year": year,
+                "month": month,
+                "uploads": uploads[-UPLOAD_HISTORY_LIMIT:],
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,120 @@
+# reportbot/metrics.py - 실행 메트릭 OpenMetrics 텍스트 파일 (node-exporter textfile collector 용)
+#
+# 실행이 끝날 때마다 실행 리포트(reportbot/tracing.py)에서 계산해 <폴더>/reportbot_<모드>.prom 으로 저장
+#   METRICS_TEXTFILE_DIR 환경변수 → 없으면 run_reports/
+#   예) METRICS_TEXTFILE_DIR=/var/lib/node_exporter/textfile_collector
+#
+# 메트릭 (모든 항목에 mode 라벨):
+#   reportbot_run_success / reportbot_run_duration_seconds / reportbot_run_timestamp_seconds
+#   reportbot_stage_duration_seconds{stage}          — 최상위 단계별 소요 시간
+#   reportbot_export_rows / reportbot_processed_rows — 원본 / 처리 행 수
+#   reportbot_issues{rule}                           — 규칙별 검증 이슈 수
+#   reportbot_persons_failing_hours                  — 시간 합계가 기준과 다른 인원 수
+#   reportbot_upload_success                         — 통계 업로드 결과 (업로드 단계가 있었던 실행만,
+#                                                      마지막 업로드와 같아 생략한 경우 result="unchanged" 1)
+#   reportbot_slack_send_duration_seconds            — 슬랙 API 호출 소요 시간 (histogram)
+#   reportbot_selector_probe_duration_seconds        — Selenium 선택자 탐색 소요 시간 (histogram)
+import os
+from datetime import datetime
+
+from reportbot.tracing import RUN_REPORTS_DIR
+from reportbot.processing import RULE_GROUP_ATTRS
+
+# 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 검증 규칙 group → 실행 리포트 지표 이름 (process_csv 가 group 별 이슈 수로 기록)
+ISSUE_RULES = RULE_GROUP_ATTRS
+
+
+def _labels(**labels):
+    escaped = {k: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for k, v in labels.items()}
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped.items()) + "}"
+
+
+def _number(value):
+    """정수는 그대로, 실수는 유효숫자 손실 없이 (타임스탬프 등)"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(round(value, 6))
+
+
+class _Writer:
+    def __init__(self):
+        self.lines = []
+
+    def gauge(self, name, help_text, samples, unit=None):
+        """samples: [(라벨 dict, 값)] — 값이 None인 샘플은 건너뜀"""
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        self.lines.append(f"# TYPE {name} gauge")
+        if unit:
+            self.lines.append(f"# UNIT {name} {unit}")
+        self.lines.append(f"# HELP {name} {help_text}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels(**labels)} {_number(value)}")
+
+    def histogram(self, name, help_text, labels, values, buckets=LATENCY_BUCKETS):
+        self.lines.append(f"# TYPE {name} histogram")
+        self.lines.append(f"# UNIT {name} seconds")
+        self.lines.append(f"# HELP {name} {help_text}")
+        for bound in buckets:
+            count = sum(1 for v in values if v <= bound)
+            self.lines.append(f"{name}_bucket{_labels(**labels, le=f'{bound:g}')} {count}")
+        self.lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {len(values)}")
+        self.lines.append(f"{name}_sum{_labels(**labels)} {_number(sum(values))}")
+        self.lines.append(f"{name}_count{_labels(**labels)} {len(values)}")
+
+    def text(self):
+        return "\n".join(self.lines + ["# EOF"]) + "\n"
+
+
+def render(report):
+    """실행 리포트 dict (Tracer.report()) → OpenMetrics 텍스트"""
+    mode = report["mode"]
+    metrics = report.get("metrics", {})
+    spans = report.get("spans", [])
+    w = _Writer()
+
+    ok = metrics.get("ok")
+    w.gauge("reportbot_run_success", "마지막 실행 성공 여부 (1 성공 / 0 실패)",
+            [({"mode": mode}, None if ok is None else int(bool(ok)))])
+    w.gauge("reportbot_run_duration_seconds", "마지막 실행 전체 소요 시간",
+            [({"mode": mode}, report.get("duration_s"))], unit="seconds")
+    w.gauge("reportbot_run_timestamp_seconds", "마지막 실행 시작 시각 (unix time)",
+            [({"mode": mode}, datetime.fromisoformat(report["started_at"]).timestamp())], unit="seconds")
+    w.gauge("reportbot_stage_duration_seconds", "마지막 실행의 단계별 소요 시간",
+            [({"mode": mode, "stage": s["name"]}, s["duration_s"]) for s in spans if s.get("parent") is None],
+            unit="seconds")
+    w.gauge("reportbot_export_rows", "TU 통계 export 원본 행 수", [({"mode": mode}, metrics.get("rows_in"))])
+    w.gauge("reportbot_processed_rows", "처리 후 결과 CSV 행 수", [({"mode": mode}, metrics.get("rows_out"))])
+    w.gauge("reportbot_issues", "규칙별 검증 이슈 수",
+            [({"mode": mode, "rule": rule}, metrics.get(key)) for rule, key in ISSUE_RULES.items()])
+    w.gauge("reportbot_persons_failing_hours", "시간 합계가 기준과 다른 인원 수",
+            [({"mode": mode}, metrics.get("hours_issues"))])
+    if "upload" in metrics:
+        w.gauge("reportbot_upload_success", "통계 업로드 결과 (1 성공·내용 같아 생략 / 0 실패·건너뜀)",
+                [({"mode": mode, "result": metrics["upload"]}, int(metrics["upload"] in ("ok", "unchanged")))])
+    w.gauge("reportbot_slack_retries", "슬랙 API 재시도 횟수", [({"mode": mode}, metrics.get("slack_retries"))])
+
+    slack_calls = report.get("slack_calls", [])
+    if slack_calls:
+        w.histogram("reportbot_slack_send_duration_seconds", "슬랙 API 호출 소요 시간 (재시도 포함)",
+                    {"mode": mode}, [c["duration_s"] for c in slack_calls])
+    probes = [s["duration_s"] for s in spans if s["name"] == "probe" and s["duration_s"] is not None]
+    if probes:
+        w.histogram("reportbot_selector_probe_duration_seconds", "Selenium 선택자 탐색 1회 소요 시간",
+                    {"mode": mode}, probes)
+    return w.text()
+
+
+def write_textfile(report, output_dir=None):
+    """<폴더>/reportbot_<모드>.prom 저장 (임시 파일 → rename 으로 collector 가 쓰다 만 파일을 읽지 않게) → 경로"""
+    output_dir = output_dir or os.getenv("METRICS_TEXTFILE_DIR") or RUN_REPORTS_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"reportbot_{report['mode']}.prom")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(render(report))
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,267 @@
+# reportbot/pipeline.py - 단계(DAG) 실행기 + 내용 기반(content-addressed) 산출물 캐시
+#
+# 각 단계는 필요한 입력 / 만드는 출력 이름을 선언하고, 실행기는 요청된 출력에서 거꾸로 필요한 단계만 실행
+#   driver_setup → login → open_team_stats → export_csv → process_csv
+#
+# 캐시 가능한 단계는 입력 내용(파일은 SHA-256)으로 키를 만들어 출력(파일 + 값)을 저장해 두고,
+# 같은 키로 다시 실행되면 단계를 건너뛰고 저장된 출력을 복원
+#   - process_csv: 원본 export 해시 + 설정 + 대상 월/기준 시간 + 처리 코드 → 처리된 CSV + 검증 이슈
+#   - export_csv: --reuse-export 일 때만 (팀, 월) 기준으로 max_age 동안 재사용 → 업로드 실패 직후 재시도 시
+#                 브라우저 실행·로그인·내보내기를 모두 건너뜀 (upstream 단계는 필요할 때만 실행)
+#
+# 캐시 폴더 (.reportbot_state/cache):
+#   objects/<sha256>            — 파일 내용
+#   stages/<단계>/<키>.json      — 출력 목록 (파일은 해시 + 원래 경로, 값은 JSON) + 단계 실행 중 기록된 지표
+import os
+import json
+import time
+import shutil
+import hashlib
+
+from reportbot.issue_state import STATE_DIR
+from reportbot.tracing import span, current, set_metric, add_section
+
+CACHE_DIR = os.path.join(STATE_DIR, "cache")
+
+# 이 기간보다 오래된 캐시 항목은 실행 끝에 정리
+CACHE_MAX_AGE_DAYS = 40
+
+
+def file_digest(path):
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _manifest_path(self, stage, key):
+        return os.path.join(self.cache_dir, "stages", stage, f"{key}.json")
+
+    def _object_path(self, digest):
+        return os.path.join(self.cache_dir, "objects", digest)
+
+    def load(self, stage, key, max_age=None):
+        """저장된 출력 manifest (없거나 max_age초보다 오래됐거나 파일이 빠졌으면 None)"""
+        path = self._manifest_path(stage, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if max_age is not None and time.time() - manifest.get("created_at", 0) > max_age:
+            return None
+        for item in manifest["files"].values():
+            if not os.path.exists(self._object_path(item["sha256"])):
+                return None
+        return manifest
+
+    def restore(self, manifest):
+        """manifest 출력 복원 → {출력 이름: 값} (파일은 원래 경로에 다시 쓰고 경로 반환)"""
+        outputs = dict(manifest["values"])
+        for name, item in manifest["files"].items():
+            path = item["path"]
+            if not os.path.exists(path) or file_digest(path) != item["sha256"]:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                shutil.copyfile(self._object_path(item["sha256"]), path)
+            outputs[name] = path
+        return outputs
+
+    def save(self, stage, key, outputs, file_outputs, metrics=None):
+        """단계 출력 저장 (file_outputs 에 있는 이름은 파일 경로 → 내용을 objects/ 에 저장)"""
+        files, values = {}, {}
+        for name, value in outputs.items():
+            if name in file_outputs:
+                digest = file_digest(value)
+                object_path = self._object_path(digest)
+                if not os.path.exists(object_path):
+                    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                    shutil.copyfile(value, object_path + ".tmp")
+                    os.replace(object_path + ".tmp", object_path)
+                files[name] = {"path": value, "sha256": digest}
+            else:
+                values[name] = value
+        path = self._manifest_path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump({"stage": stage, "created_at": time.time(), "files": files, "values": values,
+                       "metrics": metrics or {}}, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def prune(self, max_age_days=CACHE_MAX_AGE_DAYS):
+        """오래된 manifest 삭제 + 어떤 manifest 도 가리키지 않는 파일 삭제 → 삭제한 manifest 수"""
+        stages_dir = os.path.join(self.cache_dir, "stages")
+        objects_dir = os.path.join(self.cache_dir, "objects")
+        if not os.path.isdir(stages_dir):
+            return 0
+        cutoff = time.time() - max_age_days * 86400
+        removed, referenced = 0, set()
+        for root, _, names in os.walk(stages_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    manifest = {}
+                if manifest.get("created_at", 0) < cutoff:
+                    os.remove(path)
+                    removed += 1
+                else:
+                    referenced.update(item["sha256"] for item in manifest.get("files", {}).values())
+        if os.path.isdir(objects_dir):
+            for name in os.listdir(objects_dir):
+                if name not in referenced:
+                    os.remove(os.path.join(objects_dir, name))
+        return removed
+
+
+class Stage:
+    def __init__(self, name, func, inputs=(), outputs=(), error=None, key=None, key_inputs=(), files=(), max_age=None):
+        """
+        파이프라인 단계
+
+        Args:
+            name (str): 단계 이름 (실행 리포트 span 이름)
+            func (callable): func(context) → 출력 dict (성공) / 오류 메시지 str / None·False (실패, error 사용)
+            inputs (tuple): 필요한 입력 이름 (다른 단계 출력 또는 run() 에 넘긴 초기값)
+            outputs (tuple): 만드는 출력 이름
+            error (str): func 가 None/False 를 반환했을 때 오류 메시지
+            key (callable): key(context) → 캐시 키 재료 list (None이면 캐시하지 않음)
+            key_inputs (tuple): 캐시 키 계산에 필요한 입력 — 이것만 먼저 준비해서 캐시를 확인하고,
+                                캐시가 맞으면 나머지 입력(과 그 upstream 단계)은 실행하지 않음
+            files (tuple): 출력 중 파일 경로인 이름 (캐시에 내용 저장 후 복원)
+            max_age (float): 캐시 재사용 최대 기간(초) — None이면 무기한
+        """
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.error = error or f"{name} 실패"
+        self.key = key
+        self.key_inputs = tuple(key_inputs)
+        self.files = tuple(files)
+        self.max_age = max_age
+
+
+class PipelineResult:
+    def __init__(self, context):
+        self.context = context
+        self.error = None
+        self.failed_stage = None
+        self.executed = []   # 실제로 실행한 단계
+        self.cached = []     # 캐시에서 복원한 단계
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class Pipeline:
+    def __init__(self, stages, cache=None):
+        """
+        Args:
+            stages (list): Stage 목록 (출력 이름은 단계 간 중복 불가)
+            cache (ArtifactCache): None이면 캐시 없이 항상 실행
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.cache = cache
+        self.producers = {}
+        for stage in stages:
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(f"출력 '{output}' 을 만드는 단계가 둘 이상: {self.producers[output].name}, {stage.name}")
+                self.producers[output] = stage
+
+    def run(self, targets, context=None):
+        """targets 출력을 만드는 데 필요한 단계만 실행 → PipelineResult (단계 실패 시 그 자리에서 중단)"""
+        result = PipelineResult(dict(context or {}))
+        done = set()
+        for target in targets:
+            if not self._resolve(target, result, done, ()):
+                break
+        return result
+
+    def _resolve(self, name, result, done, path):
+        if name in result.context:
+            return True
+        stage = self.producers.get(name)
+        if stage is None:
+            result.error = f"'{name}' 을 만드는 단계 없음"
+            return False
+        if stage.name in path:
+            raise ValueError(f"단계 순환 의존: {' → '.join(path + (stage.name,))}")
+        if stage.name in done:
+            return True
+        return self._run_stage(stage, result, done, path + (stage.name,))
+
+    def _run_stage(self, stage, result, done, path):
+        cache_key = None
+        if self.cache is not None and stage.key is not None:
+            # 캐시 키에 필요한 입력만 먼저 준비 — key_inputs 가 없는 단계(export_csv)는 upstream 없이 바로 확인
+            manifest, cache_key = self._lookup(stage, result, done, path)
+            if result.error is not None:
+                return False
+            if manifest is not None:
+                with span(stage.name, cached=True):
+                    result.context.update(self.cache.restore(manifest))
+                    for key, value in manifest.get("metrics", {}).items():
+                        if key == "sections":
+                            for section, data in value.items():
+                                add_section(section, data)
+                        else:
+                            set_metric(key, value)
+                print(f"♻️ [{stage.name}] 입력이 같아 캐시된 결과 사용 (키 {cache_key[:12]})")
+                result.cached.append(stage.name)
+                done.add(stage.name)
+                return True
+
+        for name in stage.inputs:
+            if not self._resolve(name, result, done, path):
+                return False
+
+        tracer = current()
+        metrics_before = dict(tracer.metrics) if tracer else {}
+        sections_before = set(tracer.sections) if tracer else set()
+        with span(stage.name) as item:
+            outputs = stage.func(result.context)
+            if not isinstance(outputs, dict):
+                result.error = outputs if isinstance(outputs, str) else stage.error
+                result.failed_stage = stage.name
+                item.fail("failed", result.error)
+                return False
+        result.context.update(outputs)
+        result.executed.append(stage.name)
+        done.add(stage.name)
+
+        if self.cache is not None and stage.key is not None:
+            if cache_key is None:
+                cache_key = self._key(stage, result.context)
+            stage_metrics = {}
+            if tracer:
+                stage_metrics = {k: v for k, v in tracer.metrics.items() if metrics_before.get(k) != v}
+                new_sections = {k: v for k, v in tracer.sections.items() if k not in sections_before}
+                if new_sections:
+                    stage_metrics["sections"] = new_sections
+            try:
+                self.cache.save(stage.name, cache_key, {k: outputs[k] for k in stage.outputs if k in outputs},
+                                stage.files, stage_metrics)
+            except Exception as e:
+                print(f"⚠️ [{stage.name}] 캐시 저장 실패: {e}")
+        return True
+
+    def _lookup(self, stage, result, done, path):
+        for name in stage.key_inputs:
+            if not self._resolve(name, result, done, path):
+                return None, None
+        cache_key = self._key(stage, result.context)
+        return self.cache.load(stage.name, cache_key, stage.max_age), cache_key
+
+    def _key(self, stage, context):
+        parts = [stage.name] + [str(p) for p in stage.key(context)]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,446 @@
+# reportbot/processing.py - TU export 처리 + 검증 (파일/콘솔 입출력 없는 순수 함수 API)
+#
+# 사용 예:
+#   config = downloader.load_config()                      # 설정 파일 → ProcessingConfig
+#   result = process_export(pd.read_csv("export.csv"), config, (2026, 10))
+#   if result.ok:
+#       result.frame.to_csv(...)                           # 저장은 호출하는 쪽에서
+#       print(result.issues)
+#
+# 설정 파일 읽기 / 결과 CSV 저장 / 진행 메시지 출력은 TaskworldDownloader.process_csv 가 담당
+# 입력 DataFrame은 수정하지 않음
+from reportbot.settings import PERSON_HOURS_OVERRIDE, required_hours_for
+
+# 최종 결과 4열 (통계 페이지 업로드 형식, 헤더 없이 저장)
+OUTPUT_COLUMNS = ['Name', 'Task', 'Tags', 'Time Spent']
+
+# 검증 규칙 group (reportbot/rules.py) → ProcessResult 이슈 목록
+RULE_GROUP_ATTRS = {
+    "completed_common_tag": "completed_tag_issues",
+    "assigned_to_empty": "assigned_issues",
+    "hours_total": "hours_issues",
+    "tag_format": "tag_issues",
+}
+
+
+class ProcessingConfig:
+    def __init__(self, email_map=None, exclude_names=None, leave_keywords=None, exclude_values=None,
+                 first_tags_required=None, first_tags_optional=None,
+                 second_tags_art=None, second_tags_project=None, person_hours_override=None, rules=None,
+                 workers=1):
+        """
+        처리/검증 설정 (설정 파일 내용을 메모리에 들고 있는 값 객체)
+
+        Args:
+            email_map (dict): 이메일 → 이름 (email_map.txt)
+            exclude_names (set): 결과 CSV와 검증에서 제외할 이름 (exclude_names.txt)
+            leave_keywords (set): 연차/반차류 Tasklist 키워드 (leave_keywords.txt)
+            exclude_values (list): 처리 전에 통째로 제외할 Tasklist 값 (exclude_values.txt, 완전 일치 — 연차 키워드 값은 무시)
+            first_tags_required (list): 두 번째 태그가 필수인 첫 번째 태그 (부분 일치)
+            first_tags_optional (list): 두 번째 태그가 선택인 첫 번째 태그 (부분 일치)
+            second_tags_art / second_tags_project (list): 허용되는 두 번째 태그 (완전 일치)
+            person_hours_override (dict): (연도, 월, 이름) → 기준 시간 (None이면 settings 값)
+            rules (RuleSet): 검증 규칙 (validation_rules.txt, None이면 reportbot.rules 기본 규칙)
+            workers (int): 검증 규칙 병렬 평가 프로세스 수 (1: 단일 프로세스, 0: CPU 수 — 결과는 같음)
+        """
+        self.email_map = dict(email_map or {})
+        self.exclude_names = set(exclude_names or ())
+        self.leave_keywords = set(leave_keywords or ())
+        self.exclude_values = [value for value in dict.fromkeys(exclude_values or ()) if value not in self.leave_keywords]
+        self.first_tags_required = list(first_tags_required or [])
+        self.first_tags_optional = list(first_tags_optional or [])
+        self.second_tags_art = list(second_tags_art or [])
+        self.second_tags_project = list(second_tags_project or [])
+        self.person_hours_override = PERSON_HOURS_OVERRIDE if person_hours_override is None else person_hours_override
+        if rules is None:
+            from reportbot.rules import default_rules
+            rules = default_rules()
+        self.rules = rules
+        self.workers = workers
+        self._identity = None
+
+    @property
+    def identity(self):
+        """email_map 담당자 색인 (IdentityIndex, 처음 쓸 때 한 번만 생성)"""
+        if self._identity is None:
+            self._identity = IdentityIndex(self.email_map)
+        return self._identity
+
+    @property
+    def second_tags(self):
+        return self.second_tags_art + self.second_tags_project
+
+    def fingerprint(self):
+        """설정 내용 해시 (처리 결과 캐시 키용, 순서 무관한 집합 값은 정렬 — workers 는 결과와 무관해서 제외)"""
+        import hashlib
+        import json
+        data = {
+            "email_map": sorted(self.email_map.items()),
+            "exclude_names": sorted(self.exclude_names),
+            "leave_keywords": sorted(self.leave_keywords),
+            "exclude_values": sorted(self.exclude_values),
+            "first_tags_required": self.first_tags_required,
+            "first_tags_optional": self.first_tags_optional,
+            "second_tags_art": self.second_tags_art,
+            "second_tags_project": self.second_tags_project,
+            "person_hours_override": sorted((list(k), v) for k, v in self.person_hours_override.items()),
+            "rules": self.rules.source,
+        }
+        return hashlib.sha256(json.dumps(data, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# Assigned To 한 칸에 담당자가 여러 명일 때 구분자 (email_map.txt 왼쪽의 별칭 구분자와 같음)
+ASSIGNEE_SEPARATORS = r"[,;]"
+
+
+class IdentityIndex:
+    def __init__(self, email_map):
+        """
+        담당자 → 이름 색인 (email_map.txt 를 한 번만 정규화)
+
+        - 키는 공백 제거 + 대소문자 무시 (JHee@AceProject.co.kr 도 같은 사람)
+        - 별칭: email_map.txt 왼쪽에 쉼표로 여러 주소 (예: jhee@aceproject.co.kr, jhee@old.co.kr : 배진희)
+        - 담당자가 여러 명인 칸 (쉼표/세미콜론 구분)은 첫 번째 담당자 기준
+
+        Args:
+            email_map (dict): 이메일(별칭은 쉼표 구분) → 이름
+        """
+        import re
+        self.names = {}
+        for key, name in email_map.items():
+            for alias in re.split(ASSIGNEE_SEPARATORS, str(key)):
+                if alias.strip():
+                    self.names[alias.strip().casefold()] = name
+
+    def __len__(self):
+        return len(self.names)
+
+    def resolve(self, assigned):
+        """Assigned To 열 → (Name Series, 미등록 주소 목록, 담당자 여러 명인 행 수)
+
+        담당자 칸의 고유값마다 한 번만 해석한 뒤 map 1회로 행에 펼침
+        - Name: 등록된 주소는 이름, 미등록은 원래 주소 (앞뒤 공백 제거), 비어 있으면 ''
+        - 미등록 주소 목록: [{"address": 주소, "rows": 행 수}] (처음 나온 순서, email_map 이 비어 있으면 [])
+        """
+        import re
+        import pandas as pd
+        filled = assigned.where(assigned.notna(), None)
+        counts = filled.value_counts(sort=False, dropna=True)
+        resolved, unmapped, multi_rows = {}, {}, 0
+        for value in pd.unique(filled.dropna()):
+            parts = [part.strip() for part in re.split(ASSIGNEE_SEPARATORS, str(value))]
+            parts = [part for part in parts if part] or [str(value).strip()]
+            resolved[value] = self.names.get(parts[0].casefold(), parts[0])
+            if len(parts) > 1:
+                multi_rows += int(counts[value])
+            for part in parts:
+                if self.names and part and part.casefold() not in self.names:
+                    unmapped[part] = unmapped.get(part, 0) + int(counts[value])
+        names = filled.map(resolved).where(filled.notna(), '')
+        return names, [{"address": address, "rows": rows} for address, rows in unmapped.items()], multi_rows
+
+
+class ProcessResult:
+    def __init__(self, frame=None, error=None, original_count=0):
+        """
+        process_export 결과
+
+        - frame: 최종 4열 DataFrame (Name, Task, Tags, Time Spent, Name/Tags 는 category) — 오류 시 None
+        - columns: frame 의 파생 열 (reportbot.rules.RowColumns — 첫/두 번째 태그, 시간 등 한 번만 계산해 재사용)
+        - issues: 전체 검증 이슈 (완료 업무 태그 → 담당자 없음 → 시간 합계 → 태그 → 그 밖의 규칙 순)
+        - issue_counts: 규칙 group → 이슈 수 (메트릭 / 월별 집계의 이슈 종류별 수는 모두 이 값 기준)
+        - error: 처리 자체가 실패한 경우 오류 메시지 (성공 시 None)
+        """
+        self.frame = frame
+        self.columns = None
+        self.error = error
+        self.original_count = original_count
+
+        self.name_mapped = False         # Assigned To → Name 변환 여부 (열이 없으면 False)
+        self.tasklist_excluded = {}      # exclude_values 로 제거된 Tasklist 값 → 행 수 (설정 파일 순서)
+        self.unmapped = []               # email_map에 없는 주소 [{"address", "rows"}]
+        self.multi_assignee_count = 0    # 담당자가 여러 명인 행 (첫 번째 담당자 기준으로 변환)
+        self.excluded_count = 0          # exclude_names로 제거된 행 수
+        self.leave_count = 0             # 연차/반차 자동 태그 처리된 행 수
+
+        self.completed_tag_issues = []   # 완료된 업무에 '공통업무' 태그
+        self.assigned_issues = []        # Assigned To 비어있음
+        self.hours_issues = []           # 사람별 시간 합계
+        self.tag_issues = []             # 태그 형식
+        self.other_issues = []           # 규칙 파일에 추가한 그 밖의 group
+        self.issue_counts = {}           # 규칙 group → 이슈 수
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def tasklist_excluded_count(self):
+        return sum(self.tasklist_excluded.values())
+
+    @property
+    def unmapped_emails(self):
+        """email_map에 없는 주소 목록 (unmapped 의 주소만)"""
+        return [item["address"] for item in self.unmapped]
+
+    @property
+    def issues(self):
+        return self.completed_tag_issues + self.assigned_issues + self.hours_issues + self.tag_issues + self.other_issues
+
+    def add_rule_issues(self, issues):
+        """RuleSet.evaluate 결과 {group: 이슈 목록} → 이슈 목록에 반영"""
+        for group, group_issues in issues.items():
+            self.issue_counts[group] = self.issue_counts.get(group, 0) + len(group_issues)
+            attr = RULE_GROUP_ATTRS.get(group)
+            if attr:
+                setattr(self, attr, getattr(self, attr) + group_issues)
+            else:
+                self.other_issues += group_issues
+
+
+def convert_time_to_hours(time_str):
+    """시간 문자열 (HH:MM:SS / MM:SS / 숫자)을 시간 단위로 변환 (소수 첫째 자리 반올림)"""
+    import pandas as pd
+    try:
+        if pd.isna(time_str) or time_str == '' or time_str == 0:
+            return 0.0
+
+        time_str = str(time_str).strip()
+
+        if ':' in time_str:
+            parts = time_str.split(':')
+            if len(parts) == 3:
+                hours = int(parts[0])
+                minutes = int(parts[1])
+                seconds = int(parts[2])
+                total_hours = hours + (minutes / 60.0) + (seconds / 3600.0)
+                return round(total_hours, 1)
+            elif len(parts) == 2:
+                minutes = int(parts[0])
+                seconds = int(parts[1])
+                total_hours = (minutes / 60.0) + (seconds / 3600.0)
+                return round(total_hours, 1)
+
+        return round(float(time_str), 1)
+
+    except (ValueError, IndexError, TypeError):
+        return 0.0
+
+
+def person_hours(df, columns=None):
+    """사람별 시간 합계 → {이름: 시간(소수 첫째 자리)} (이름 없는 행은 '미분류', 시간 열을 못 찾으면 None)
+
+    Args:
+        columns (RowColumns): df 의 파생 열 (process_export 결과의 result.columns, None이면 새로 계산)
+    """
+    if columns is None:
+        from reportbot.rules import RowColumns
+        # Time Spent 컬럼 찾기
+        time_column = next((c for c in ('Time Spent', 'Time_Spent') if c in df.columns),
+                           df.columns[3] if len(df.columns) >= 4 else None)
+        if time_column is None:
+            return None
+        name_col = 'Name' if 'Name' in df.columns else 'Assigned To'
+        columns = RowColumns(df[[name_col, time_column]].set_axis(['Name', 'Time Spent'], axis=1))
+    totals = columns['hours'].groupby(columns['name']).sum()
+    return {name: round(total, 1) for name, total in totals.items()}
+
+
+def hours_series(values):
+    """시간 열 → 시간 float Series (convert_time_to_hours 를 고유값마다 한 번만 적용)"""
+    import pandas as pd
+    filled = values.where(values.notna(), '')
+    mapping = {value: convert_time_to_hours(value) for value in pd.unique(filled)}
+    return filled.map(mapping).astype(float)
+
+
+def tag_columns(tags):
+    """Tags 열 → (첫 번째 태그, 두 번째 태그) Series (빈 항목은 건너뜀, 없으면 '')"""
+    normalized = (tags.fillna('').astype(str)
+                  .str.replace(r'\s*,\s*', ',', regex=True)
+                  .str.replace(r',{2,}', ',', regex=True)
+                  .str.strip(', '))
+    parts = normalized.str.split(',', n=2)
+    return tuple(parts.str.get(i).fillna('').astype(str).str.strip() for i in (0, 1))
+
+
+# 사람 × 태그 시간 리포트 열 이름
+TAG_REPORT_COLUMNS = ['Name', '첫번째 태그', '두번째 태그', '그룹', '시간']
+
+
+def tag_hours_report(df, config, columns=None):
+    """처리된 4열 DataFrame → 사람 × 첫 번째 태그 × 두 번째 태그 × 그룹(아트/프로젝트) 시간 합계 (groupby 1회)
+
+    그룹: 두 번째 태그가 second_tags_art → '아트', second_tags_project → '프로젝트', 없으면 '-', 그 외 '기타'
+
+    Args:
+        columns (RowColumns): df 의 파생 열 (process_export 결과의 result.columns, None이면 새로 계산)
+    """
+    import numpy as np
+    import pandas as pd
+    if columns is None:
+        from reportbot.rules import RowColumns
+        columns = RowColumns(df, config)
+    first, second, names = columns['first_tag'], columns['second_tag'], columns['name']
+    group = np.select(
+        [second.isin(config.second_tags_art), second.isin(config.second_tags_project), second == ''],
+        ['아트', '프로젝트', '-'], default='기타')
+    frame = pd.DataFrame({
+        'Name': names,
+        '첫번째 태그': first.replace('', '(태그 없음)'),
+        '두번째 태그': second,
+        '그룹': group,
+        '시간': columns['hours'],
+    })
+    report = frame.groupby(TAG_REPORT_COLUMNS[:4], sort=True)['시간'].sum().reset_index()
+    report['시간'] = report['시간'].round(1)
+    return report
+
+
+def tag_hours_pivot(report):
+    """tag_hours_report 결과 → 사람별 1행 표 (첫번째:<태그> / 두번째:<태그> / 그룹:<그룹> 시간 + 합계)"""
+    import pandas as pd
+    sections = []
+    for column, prefix in (('첫번째 태그', '첫번째:'), ('두번째 태그', '두번째:'), ('그룹', '그룹:')):
+        rows = report[report[column] != ''] if column == '두번째 태그' else report
+        sections.append(rows.pivot_table(index='Name', columns=column, values='시간', aggfunc='sum', fill_value=0)
+                        .add_prefix(prefix))
+    pivot = pd.concat(sections, axis=1).fillna(0).round(1)
+    pivot['합계'] = report.groupby('Name')['시간'].sum().round(1)
+    return pivot.reset_index()
+
+
+def validate_time_totals(df, min_hours, period, exclude_names=None, person_hours_override=None, rules=None):
+    """사람별 시간 합계 검증 (규칙 group hours_total) → 이슈 목록 (df는 수정하지 않음)"""
+    time_column = next((c for c in ('Time Spent', 'Time_Spent') if c in df.columns),
+                       df.columns[3] if len(df.columns) >= 4 else None)
+    if time_column is None:
+        return ["시간 데이터 컬럼을 찾을 수 없습니다."]
+    if time_column != 'Time Spent':
+        df = df.rename(columns={time_column: 'Time Spent'})
+    if 'Name' not in df.columns and 'Assigned To' in df.columns:
+        df = df.rename(columns={'Assigned To': 'Name'})
+
+    config = ProcessingConfig(exclude_names=exclude_names, person_hours_override=person_hours_override, rules=rules)
+    return config.rules.evaluate("processed", df, config, period, min_hours, groups=["hours_total"]).get("hours_total", [])
+
+
+def validate_tags(df, config):
+    """태그 검증 (규칙 group tag_format: 첫 번째 태그 부분 일치 / 두 번째 태그 완전 일치) → 이슈 목록"""
+    if 'Tags' not in df.columns:
+        return ["Tags 열이 존재하지 않습니다."]
+    if 'Name' not in df.columns:
+        return ["Name 열이 존재하지 않습니다. email_map.txt 설정을 확인하세요."]
+    try:
+        return config.rules.evaluate("processed", df, config, groups=["tag_format"]).get("tag_format", [])
+    except Exception as e:
+        return [f"태그 검증 중 오류 발생: {str(e)}"]
+
+
+def validate_processed(df, config, period, min_hours):
+    """최종 4열 데이터 검증 → (시간 합계 이슈, 태그 이슈)"""
+    issues = evaluate_processed(df, config, period, min_hours)
+    return issues.get("hours_total", []), issues.get("tag_format", [])
+
+
+def evaluate_processed(df, config, period, min_hours, columns=None):
+    """최종 4열 데이터에 processed 규칙 전체를 한 번에 평가 → {group: 이슈 목록} (columns: 미리 계산한 RowColumns)"""
+    if len(df.columns) < 4:
+        return {"hours_total": ["열 수가 부족합니다. 최소 4개 열이 필요합니다."]}
+
+    missing = [c for c in OUTPUT_COLUMNS if c not in df.columns]
+    if missing:
+        return {"hours_total": [f"필수 컬럼 없음: {missing}"]}
+
+    try:
+        return config.rules.evaluate("processed", df, config, period, min_hours, columns=columns)
+    except Exception as e:
+        return {"hours_total": [f"검증 중 오류 발생: {str(e)}"]}
+
+
+def process_export(df, config, period, min_hours=None):
+    """
+    TU export DataFrame 처리 + 검증 (파일/콘솔 입출력 없음)
+
+    1. exclude_values Tasklist 행 제거 (이후 단계는 제외된 행을 보지 않음)
+    2. Assigned To 이메일 → Name 변환 (email_map)
+    3. 완료된 업무의 '공통업무' 태그 / 담당자 없음 검사
+    4. 최종 4열 추출 → exclude_names 행 제거 → 연차/반차 Tasklist 행 자동 태그
+    5. 사람별 시간 합계 + 태그 검증
+
+    Args:
+        df (DataFrame): TU 통계 export 원본 (수정하지 않음)
+        config (ProcessingConfig): 처리/검증 설정
+        period (tuple): 처리 대상 (연도, 월)
+        min_hours (float): 기준 시간 (None이면 MONTHLY_HOURS의 해당 월 값)
+
+    Returns:
+        ProcessResult: 실패해도 예외 대신 result.error 에 메시지
+    """
+    import numpy as np
+    import pandas as pd
+    from reportbot.rules import RowColumns
+    result = ProcessResult(original_count=len(df))
+    try:
+        if min_hours is None:
+            min_hours = required_hours_for(*period)
+
+        # 제외 Tasklist (주요일정 / 팀 공용 목록 등) — isin 마스크 1회로 가장 먼저 제거
+        if config.exclude_values and 'Tasklist' in df.columns:
+            excluded = df['Tasklist'].isin(config.exclude_values)
+            if excluded.any():
+                counts = df.loc[excluded, 'Tasklist'].value_counts()
+                result.tasklist_excluded = {value: int(counts[value]) for value in config.exclude_values
+                                            if value in counts.index}
+                df = df[~excluded]
+        # Assigned To 이메일 → 이름 변환 (정규화 색인, 고유값마다 한 번) + 미등록 주소 수집
+        if 'Assigned To' in df.columns:
+            names, result.unmapped, result.multi_assignee_count = config.identity.resolve(df['Assigned To'])
+            df = df.assign(Name=names)
+            result.name_mapped = True
+        else:
+            df = df.assign(Name='')
+
+        # 원본 행 규칙 (완료 업무 '공통업무' 태그, Assigned To 비어있음 — 오류로 수집, 제거하지 않음)
+        result.add_rule_issues(config.rules.evaluate("export", df, config, period, min_hours))
+
+        # 최종 4열: Name, Task, Tags, Time Spent
+        missing_columns = [col for col in OUTPUT_COLUMNS if col not in df.columns]
+        if missing_columns:
+            result.error = f"열을 찾을 수 없음: {missing_columns}"
+            return result
+
+        # exclude_names에 포함된 이름은 CSV에서 제외 (행 선택만 — 열 복사 없음)
+        kept = df[OUTPUT_COLUMNS + [c for c in ('Tasklist',) if c in df.columns]]
+        if config.exclude_names:
+            keep = ~kept['Name'].isin(config.exclude_names)
+            result.excluded_count = int((~keep).sum())
+            kept = kept[keep]
+
+        # 연차/반차류 행 자동 태그 처리
+        # Tasklist가 연차 키워드인 행 → Task를 Tasklist 값으로, Tags를 "연차"로 설정 (행사공결은 사내행사)
+        task, tags = kept['Task'], kept['Tags']
+        if len(kept):
+            tasklist = kept['Tasklist']
+            leave = tasklist.isin(config.leave_keywords).to_numpy()
+            result.leave_count = int(leave.sum())
+            if result.leave_count:
+                event = (tasklist == '행사공결').fillna(False).to_numpy(dtype=bool)
+                task = task.mask(leave, tasklist.mask(event, '사내행사'))
+                tags = tags.mask(leave, np.where(event, '사내행사', '연차'))
+
+        # 최종 4열 (Name / Tags 는 반복이 많아 category), 새 RangeIndex 로 한 번만 만들고 이후 검증/리포트는 읽기만
+        final_df = pd.DataFrame({
+            'Name': kept['Name'].astype('category').array,
+            'Task': task.array,
+            'Tags': tags.astype('category').array,
+            'Time Spent': kept['Time Spent'].array,
+        }, copy=False)
+        result.columns = RowColumns(final_df, config)
+        result.add_rule_issues(evaluate_processed(final_df, config, period, min_hours, result.columns))
+        result.frame = final_df
+        return result
+
+    except Exception as e:
+        result.error = f"CSV 처리 오류: {str(e)}"
+        return result
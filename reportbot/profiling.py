@@ -0,0 +1,110 @@
+# reportbot/profiling.py - --profile 실행 시 단계별 CPU(cProfile) / 메모리(tracemalloc) 프로파일
+#
+# 사용 예:
+#   tracer = Tracer("full", profiler=StageProfiler("profile_20261018_070012_full"))
+#   with tracer.activate():
+#       with span("login"):       # 최상위 span 1개 = 프로파일 1단계
+#           ...
+#
+# 단계별 저장 파일 (output_dir):
+#   NN_<단계>.pstats     — python -m pstats NN_<단계>.pstats 또는 snakeviz 로 확인
+#   NN_<단계>.alloc.txt  — 단계 시작 대비 늘어난 메모리 할당 상위 N개 (파일:줄)
+#   summary.txt          — 단계별 실행 시간 / CPU 시간 / 최대 메모리
+#
+# --profile 이 없으면 이 모듈은 import 되지 않음 (Tracer 에 profiler=None → 추가 비용 없음)
+# 멀티 팀 모드의 팀별 처리(process_teams)는 별도 프로세스에서 실행되므로 CPU 프로파일에 포함되지 않음
+import os
+import re
+import time
+
+# 단계별 메모리 할당 보고서에 적을 상위 항목 수
+PROFILE_TOP_ALLOCATIONS = 25
+
+# tracemalloc 이 기록할 호출 스택 깊이 (클수록 느려짐)
+TRACEMALLOC_FRAMES = 10
+
+
+class StageProfiler:
+    def __init__(self, output_dir, top=PROFILE_TOP_ALLOCATIONS):
+        """
+        최상위 span(단계)마다 cProfile + tracemalloc 스냅샷을 떠서 파일로 저장
+
+        Args:
+            output_dir (str): 프로파일 파일 저장 폴더 (없으면 생성)
+            top (int): 메모리 할당 보고서에 적을 상위 항목 수
+        """
+        self.output_dir = output_dir
+        self.top = top
+        self.stages = []       # [{"stage", "wall_s", "cpu_s", "peak_mb", "pstats", "alloc"}]
+        self._current = None
+
+    def start(self, name):
+        """단계 프로파일 시작 → 시작했으면 True (이미 다른 단계를 프로파일 중이면 False)"""
+        if self._current is not None:
+            return False
+        import cProfile
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        self._current = (name, profile, before, time.perf_counter(), time.process_time())
+        profile.enable()
+        return True
+
+    def stop(self):
+        """현재 단계 프로파일 종료 + 파일 저장"""
+        import tracemalloc
+        name, profile, before, wall0, cpu0 = self._current
+        profile.disable()
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        self._current = None
+
+        stage = {"stage": name, "wall_s": round(wall, 3), "cpu_s": round(cpu, 3),
+                 "peak_mb": round(peak / (1024 * 1024), 1)}
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            prefix = os.path.join(self.output_dir, f"{len(self.stages) + 1:02d}_{re.sub(r'[^0-9A-Za-z가-힣_.-]+', '_', name)}")
+            profile.dump_stats(prefix + ".pstats")
+            self._write_allocations(prefix + ".alloc.txt", name, before, after, peak)
+            stage.update(pstats=prefix + ".pstats", alloc=prefix + ".alloc.txt")
+        except Exception as e:
+            print(f"⚠️ [{name}] 프로파일 저장 실패: {e}")
+        self.stages.append(stage)
+
+    def _write_allocations(self, path, name, before, after, peak):
+        import tracemalloc
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"))
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# [{name}] 단계 시작 대비 메모리 할당 상위 {self.top}개 (최대 사용 {peak / (1024 * 1024):.1f}MB)\n")
+            for stat in diff[:self.top]:
+                f.write(f"{stat}\n")
+
+    def close(self):
+        """tracemalloc 종료 (실행 끝)"""
+        import tracemalloc
+        tracemalloc.stop()
+
+    def summary(self):
+        """실행 리포트용 dict"""
+        return {"output_dir": os.path.abspath(self.output_dir), "stages": self.stages}
+
+    def write_summary(self):
+        """summary.txt 저장 + 표 문자열 반환"""
+        lines = [f"{'단계':<36}{'시간(s)':>10}{'CPU(s)':>10}{'최대 메모리(MB)':>16}"]
+        for stage in self.stages:
+            lines.append(f"{stage['stage'][:36]:<36}{stage['wall_s']:>10.2f}{stage['cpu_s']:>10.2f}{stage['peak_mb']:>16.1f}")
+        table = "\n".join(lines)
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(os.path.join(self.output_dir, "summary.txt"), 'w', encoding='utf-8') as f:
+                f.write(table + "\n")
+        except Exception as e:
+            print(f"⚠️ 프로파일 요약 저장 실패: {e}")
+        return table
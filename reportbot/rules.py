@@ -0,0 +1,528 @@
+# reportbot/rules.py - 선언형 검증 규칙 (validation_rules.txt) → pandas 마스크 / groupby 로 한 번에 평가
+#
+# 규칙 파일 (configparser 형식, 섹션 하나 = 규칙 하나, 위에서부터 순서대로, 주석은 줄 맨 앞 # 만 — 아래 # 설명은 예시용):
+#   [tag_missing]
+#   group = tag_format                # 이슈 묶음 (ProcessResult 목록 / 실행 리포트 지표와 연결)
+#   frame = processed                 # export: 원본 + Name 열 / processed: 최종 4열
+#   scope = row                       # row: 행마다 / person: 사람별 합계 (name, hours, required, excluded)
+#   when = tags_empty                 # 이슈 조건 (DataFrame.eval 식 — 아래 열 이름 사용)
+#   unless = excluded or leave_tag    # 제외 조건 (선택)
+#   message = {name}님 태그 오류 : {task20} (태그 없음)
+#   dedupe = yes                      # 같은 문장 중복 제거 (기본 yes)
+#
+# 같은 group 안에서는 한 행에 먼저 걸린 규칙 하나만 보고 (기존 태그 검증의 continue 순서와 동일)
+# 이슈 순서: group 안에서 행 순서 (person 규칙은 이름 순)
+#
+# row 열 (필요한 열만 계산):
+#   name / excluded / task20 / task25 / tags_empty / tags_blank / leave_tag / first_tag / second_tag
+#   raw_first_tag / first_required / first_optional / second_allowed / status / assigned_empty / hours
+# person 열: name / hours (사람별 합계, 소수 첫째 자리) / required (기준 시간) / excluded
+#
+# 병렬 평가 (ProcessingConfig.workers ≥ 2, PARALLEL_MIN_ROWS 행 이상):
+#   이름 기준으로 행을 조각으로 나눠 (한 사람은 한 조각에만 → 사람별 합계가 조각 안에서 끝남) ProcessPoolExecutor 로 평가,
+#   이슈는 (scope, 원본 행 위치, 이름) 키로 다시 정렬해 합침 → 단일 프로세스와 같은 순서 / 같은 결과
+#   조각에는 규칙에 필요한 원본 열만 실어 보냄 (pickle 복사량 최소화)
+import re
+import string
+
+from reportbot.settings import ConfigFileError
+
+# 규칙 파일이 없을 때 쓰는 기본 규칙 (기존 하드코딩 검증과 같은 결과)
+DEFAULT_RULES = """\
+# 검증 규칙 — 섹션 하나가 규칙 하나 (형식은 reportbot/rules.py 참고)
+# 같은 group 안에서는 한 행에 먼저 걸린 규칙만 보고
+
+[completed_common_tag]
+group = completed_common_tag
+frame = export
+when = status == "Completed" and not tags_blank and raw_first_tag.str.startswith("공통업무")
+message = {name}님 태그 오류 : {task20} (완료된 업무에 '공통업무' 태그 불가)
+
+[assigned_to_empty]
+group = assigned_to_empty
+frame = export
+when = assigned_empty
+message = 담당자 없음 오류 : {task25} (Assigned To 비어있음)
+dedupe = no
+
+[hours_total]
+group = hours_total
+scope = person
+when = hours != required
+unless = excluded
+message = {name}님 합산 오류 (현재: {hours}시간, 기준: {required}시간)
+
+[tag_missing]
+group = tag_format
+when = tags_empty
+unless = excluded or leave_tag
+message = {name}님 태그 오류 : {task20} (태그 없음)
+
+[first_tag_invalid]
+group = tag_format
+when = first_tag != "" and not first_required and not first_optional
+unless = excluded or leave_tag
+message = {name}님 태그 오류 : {task20} (첫번째 태그 '{first_tag}' 불가능)
+
+[second_tag_missing]
+group = tag_format
+when = first_required and second_tag == ""
+unless = excluded or leave_tag
+message = {name}님 태그 오류 : {task20} (두번째 태그 누락, '{first_tag}'는 필수)
+
+[second_tag_invalid]
+group = tag_format
+when = (first_required or first_optional) and second_tag != "" and not second_allowed
+unless = excluded or leave_tag
+message = {name}님 태그 오류 : {task20} (두번째 태그 '{second_tag}' 불가능)
+"""
+
+FRAMES = ("export", "processed")
+SCOPES = ("row", "person")
+
+ROW_COLUMNS = ("name", "excluded", "task20", "task25", "tags_empty", "tags_blank", "leave_tag", "first_tag",
+               "second_tag", "raw_first_tag", "first_required", "first_optional", "second_allowed", "status",
+               "assigned_empty", "hours")
+PERSON_COLUMNS = ("name", "hours", "required", "excluded")
+
+# 파생 열 → 계산에 필요한 원본 열 (병렬 평가 시 조각에 실을 열)
+_SOURCE_COLUMNS = {
+    "name": ("Name",), "excluded": ("Name",), "required": ("Name",),
+    "task20": ("Task",), "task25": ("Task",),
+    "tags_empty": ("Tags",), "tags_blank": ("Tags",), "leave_tag": ("Tags",), "first_tag": ("Tags",),
+    "second_tag": ("Tags",), "raw_first_tag": ("Tags",), "first_required": ("Tags",),
+    "first_optional": ("Tags",), "second_allowed": ("Tags",),
+    "status": ("Status",), "assigned_empty": ("Assigned To",), "hours": ("Time Spent",),
+}
+
+# 병렬 평가 최소 행 수 (이보다 작으면 프로세스 시작 / 조각 전송 비용이 더 큼)
+PARALLEL_MIN_ROWS = 50_000
+
+_STRING_LITERAL = re.compile(r"\"[^\"]*\"|'[^']*'")
+_IDENTIFIER = re.compile(r"(?<![.\w])([A-Za-z_]\w*)")
+_KEYWORDS = {"and", "or", "not", "True", "False", "in"}
+
+
+class RuleFileError(ConfigFileError):
+    """검증 규칙 파일 오류 (형식 / 항목 누락 / 알 수 없는 열 / 식 문법 / 메시지 템플릿) — 메시지에 규칙 이름 포함"""
+
+
+def _text(values):
+    """str(x) 와 같은 문자열 Series (NaN → 'nan')"""
+    return values.where(values.notna(), 'nan').astype(str)
+
+
+def _display(values, limit):
+    """표시용 작업명 (limit 자 초과 시 앞 limit 자 + '...')"""
+    text = _text(values)
+    return text.where(text.str.len() <= limit, text.str.slice(0, limit) + "...")
+
+
+def _equals_zero(values):
+    """x == 0 (숫자 0만 True, 문자열 '0' 은 False)"""
+    import pandas as pd
+    if isinstance(values.dtype, pd.StringDtype):
+        return pd.Series(False, index=values.index)
+    try:
+        return values.eq(0).fillna(False).astype(bool)
+    except TypeError:
+        return pd.Series(False, index=values.index)
+
+
+def _by_unique(values, func):
+    """values 의 고유값마다 func 를 한 번만 적용 → 행 Series (category 열은 categories 기준, 결과는 원래 행으로 펼침)
+
+    func 는 Series → 같은 길이 Series (원소별 계산)여야 함 — 이름 / 태그 / 시간처럼 반복이 많은 열을 고유값 수만큼만 계산
+    """
+    import numpy as np
+    import pandas as pd
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        uniques = pd.Series(values.cat.categories)
+    else:
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques)
+    results = func(uniques.reset_index(drop=True)).to_numpy()
+    missing = codes < 0
+    if missing.any():
+        # 결측은 고유값 목록에 없으므로 따로 한 번 계산해서 마지막 번호로
+        results = np.concatenate([results, func(pd.Series([np.nan], dtype=object)).to_numpy()])
+        codes = np.where(missing, len(uniques), codes)
+    return pd.Series(results.take(codes), index=values.index)
+
+
+class RowColumns:
+    def __init__(self, df, config=None):
+        """
+        평가할 DataFrame 의 파생 열 (요청된 열만 한 번씩, 반복이 많은 열은 고유값마다 한 번씩 계산)
+
+        처리 결과 (process_export) 에 붙여 두고 규칙 평가 / 사람별 시간 / 태그 리포트가 같은 계산을 재사용
+        (df 는 읽기만 하고, 기본 RangeIndex 면 복사 없이 그대로 사용)
+
+        Args:
+            df (DataFrame): 원본 export (+ Name) 또는 최종 4열
+            config (ProcessingConfig): excluded / first_required / first_optional / second_allowed 계산용
+        """
+        import pandas as pd
+        if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+            df = df.reset_index(drop=True)
+        self.df = df
+        self.config = config
+        self.columns = {}
+
+    def _column(self, name, default=''):
+        import pandas as pd
+        if name in self.df.columns:
+            return self.df[name]
+        return pd.Series(default, index=self.df.index, dtype=object)
+
+    def __getitem__(self, name):
+        if name not in self.columns:
+            self.columns[name] = getattr(self, f"_{name}")()
+        return self.columns[name]
+
+    def _name(self):
+        def normalize(values):
+            text = values.where(values.notna(), '').astype(str).str.strip()
+            return text.mask(text == '', '미분류')
+        return _by_unique(self._column('Name'), normalize)
+
+    def _excluded(self):
+        return self['name'].isin(self.config.exclude_names)
+
+    def _task20(self):
+        return _display(self._column('Task'), 20)
+
+    def _task25(self):
+        return _display(self._column('Task'), 25)
+
+    def _tags(self, func):
+        return _by_unique(self._column('Tags', None), func)
+
+    def _tags_empty(self):
+        return self._tags(lambda tags: tags.isna() | tags.eq('').fillna(False).astype(bool) | _equals_zero(tags))
+
+    def _tags_blank(self):
+        return self._tags(lambda tags: tags.isna() | _text(tags).str.strip().isin(['', 'nan']))
+
+    def _leave_tag(self):
+        return self._tags(lambda tags: _text(tags).str.strip() == '연차')
+
+    def _first_tag(self):
+        from reportbot.processing import tag_columns
+        return self._tags(lambda tags: tag_columns(tags)[0])
+
+    def _second_tag(self):
+        from reportbot.processing import tag_columns
+        return self._tags(lambda tags: tag_columns(tags)[1])
+
+    def _raw_first_tag(self):
+        return self._tags(lambda tags: _text(tags).str.split(',').str[0].str.strip())
+
+    def _starts_with_any(self, prefixes):
+        import pandas as pd
+        if not prefixes:
+            return pd.Series(False, index=self.df.index)
+        return self['first_tag'].str.startswith(tuple(prefixes))
+
+    def _first_required(self):
+        return self._starts_with_any(self.config.first_tags_required)
+
+    def _first_optional(self):
+        return self._starts_with_any(self.config.first_tags_optional)
+
+    def _second_allowed(self):
+        return self['second_tag'].isin(self.config.second_tags)
+
+    def _status(self):
+        return _by_unique(self._column('Status'), lambda values: _text(values).str.strip())
+
+    def _assigned_empty(self):
+        return _by_unique(self._column('Assigned To', None),
+                          lambda values: values.isna() | (_text(values).str.strip() == ''))
+
+    def _hours(self):
+        from reportbot.processing import hours_series
+        return _by_unique(self._column('Time Spent', None), hours_series)
+
+    def frame(self, names):
+        import pandas as pd
+        return pd.DataFrame({name: self[name] for name in names}, index=self.df.index, copy=False)
+
+    def take(self, names, mask):
+        """mask 행의 파생 열 DataFrame — 이미 계산된 열은 잘라 쓰고, 나머지 (표시용 task20 / task25 등) 는 그 행만 계산"""
+        import pandas as pd
+        rows = mask.to_numpy()
+        index = self.df.index[rows]
+        subset, data = None, {}
+        for name in names:
+            if name in self.columns:
+                data[name] = self.columns[name][rows]
+            else:
+                if subset is None:
+                    subset = RowColumns(self.df[rows], self.config)
+                data[name] = subset[name].set_axis(index)
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def person_frame(self, period, min_hours):
+        """사람별 합계 (이름 순) — name / hours / required / excluded"""
+        import pandas as pd
+        year, month = period or (None, None)
+        override = self.config.person_hours_override
+        totals = self['hours'].groupby(self['name']).sum()
+        names = list(totals.index)
+        return pd.DataFrame({
+            "name": names,
+            "hours": [round(float(total), 1) for total in totals],
+            "required": pd.Series([override.get((year, month, name), min_hours) for name in names], dtype=object),
+            "excluded": [name in self.config.exclude_names for name in names],
+        })
+
+
+class Rule:
+    def __init__(self, name, when, message, group=None, frame="processed", scope="row", unless=None, dedupe=True):
+        """
+        검증 규칙 1개 (validation_rules.txt 의 섹션)
+
+        Args:
+            name (str): 규칙 이름 (섹션 이름)
+            when (str): 이슈 조건 — DataFrame.eval 식
+            message (str): 이슈 문장 템플릿 ({열 이름} 치환)
+            group (str): 이슈 묶음 (None이면 규칙 이름)
+            frame (str): export / processed
+            scope (str): row / person
+            unless (str): 제외 조건 식 (선택)
+            dedupe (bool): 같은 문장 중복 제거
+        """
+        import ast
+        if frame not in FRAMES:
+            raise RuleFileError(f"[{name}] frame 은 {'/'.join(FRAMES)} 중 하나: {frame}")
+        if scope not in SCOPES:
+            raise RuleFileError(f"[{name}] scope 는 {'/'.join(SCOPES)} 중 하나: {scope}")
+        self.name = name
+        self.when = when
+        self.unless = unless or None
+        self.message = message
+        self.group = group or name
+        self.frame = frame
+        self.scope = scope
+        self.dedupe = dedupe
+        try:
+            self.fields = [field for _, field, _, _ in string.Formatter().parse(message) if field]
+        except ValueError as e:
+            raise RuleFileError(f"[{name}] message 템플릿 오류: {e}")
+
+        allowed = set(ROW_COLUMNS if scope == "row" else PERSON_COLUMNS)
+        expr_used = set()
+        for expr in (when, self.unless):
+            if expr:
+                # 식 문법은 로드 시점에 확인 (평가 도중 실패하지 않도록)
+                try:
+                    ast.parse(expr.strip(), mode="eval")
+                except SyntaxError as e:
+                    raise RuleFileError(f"[{name}] 식 문법 오류: {expr} ({e.msg})")
+                expr_used |= set(_IDENTIFIER.findall(_STRING_LITERAL.sub('""', expr))) - _KEYWORDS
+        used = expr_used | set(self.fields)
+        unknown = sorted(used - allowed)
+        if unknown:
+            raise RuleFileError(f"[{name}] 알 수 없는 열: {', '.join(unknown)} (사용 가능: {', '.join(sorted(allowed))})")
+        self.columns = sorted(used)
+        self.expr_columns = sorted(expr_used)   # 마스크 계산에 필요한 열 (문장에만 쓰는 열은 걸린 행만 계산)
+
+    def mask(self, frame):
+        """이슈 행 마스크 (when and not unless)"""
+        import pandas as pd
+        mask = pd.Series(frame.eval(self.when, engine="python"), index=frame.index).astype(bool)
+        if self.unless:
+            mask &= ~pd.Series(frame.eval(self.unless, engine="python"), index=frame.index).astype(bool)
+        return mask
+
+    def render(self, frame):
+        """frame 각 행의 이슈 문장 Series (템플릿 치환을 열 단위 문자열 연결로)"""
+        import pandas as pd
+        text = pd.Series("", index=frame.index, dtype=object)
+        for literal, field, _, _ in string.Formatter().parse(self.message):
+            if literal:
+                text = text + literal
+            if field:
+                text = text + frame[field].map(str)
+        return text
+
+
+class RuleSet:
+    def __init__(self, rules, source=""):
+        """
+        Args:
+            rules (list): Rule 목록 (파일 순서)
+            source (str): 규칙 파일 내용 (설정 fingerprint 용)
+        """
+        self.rules = list(rules)
+        self.source = source
+
+    @classmethod
+    def parse(cls, text):
+        """규칙 파일 내용 → RuleSet (형식 오류는 RuleFileError)"""
+        import configparser
+        parser = configparser.ConfigParser(interpolation=None, comment_prefixes=("#",), inline_comment_prefixes=None)
+        try:
+            parser.read_string(text)
+        except configparser.Error as e:
+            raise RuleFileError(f"규칙 파일 형식 오류: {e}")
+        rules = []
+        for name in parser.sections():
+            section = parser[name]
+            for key in ("when", "message"):
+                if not section.get(key):
+                    raise RuleFileError(f"[{name}] '{key}' 항목 없음")
+            try:
+                dedupe = section.getboolean("dedupe", fallback=True)
+            except ValueError:
+                raise RuleFileError(f"[{name}] dedupe 는 yes/no")
+            rules.append(Rule(name, section["when"], section["message"], group=section.get("group"),
+                              frame=section.get("frame", "processed"), scope=section.get("scope", "row"),
+                              unless=section.get("unless"), dedupe=dedupe))
+        return cls(rules, text)
+
+    @property
+    def groups(self):
+        return list(dict.fromkeys(rule.group for rule in self.rules))
+
+    def evaluate(self, frame_name, df, config, period=None, min_hours=None, groups=None, columns=None):
+        """frame_name 규칙을 df 에 한 번에 평가 → {group: 이슈 목록} (규칙 파일의 group 순서)
+
+        config.workers 가 2 이상이고 df 가 PARALLEL_MIN_ROWS 행 이상이면 사람별로 나눠 여러 프로세스에서 평가
+        (결과는 단일 프로세스와 같음)
+
+        Args:
+            frame_name (str): export / processed
+            df (DataFrame): 평가할 데이터 (수정하지 않음)
+            config (ProcessingConfig): 제외 이름 / 태그 목록 / 개인별 기준 시간 / 병렬 프로세스 수
+            period (tuple): (연도, 월) — person 규칙의 개인별 기준 시간 조회
+            min_hours (float): person 규칙의 기본 기준 시간
+            groups (list): 평가할 group (None이면 전체)
+            columns (RowColumns): df 의 파생 열 (이미 계산해 둔 것 재사용, None이면 새로 계산)
+        """
+        rules = [rule for rule in self.rules
+                 if rule.frame == frame_name and (groups is None or rule.group in groups)]
+        workers = resolve_workers(getattr(config, "workers", 1))
+        parts = None
+        if workers > 1 and len(df) >= PARALLEL_MIN_ROWS and rules:
+            parts = _evaluate_parallel(rules, df, config, period, min_hours, workers)
+        if parts is None:
+            parts = [_evaluate_keyed(rules, df, config, period, min_hours, columns=columns)]
+        return _merge(rules, parts)
+
+
+def resolve_workers(workers):
+    """병렬 프로세스 수 (0 / None 이면 CPU 수)"""
+    import os
+    return int(workers) if workers else (os.cpu_count() or 1)
+
+
+def _evaluate_keyed(rules, df, config, period, min_hours, positions=None, columns=None):
+    """규칙 평가 → {group: [이슈 문장 Series]} — index 는 (scope, 원본 행 위치, 이름) 정렬 키
+
+    Args:
+        positions (ndarray): df 각 행의 원본 행 위치 (사람별 조각 평가 시, None이면 0..n-1)
+    """
+    import pandas as pd
+    context = columns if columns is not None else RowColumns(df, config)
+    row_names = sorted({c for rule in rules if rule.scope == "row" for c in rule.expr_columns})
+    rows = context.frame(row_names) if row_names else None
+    people = context.person_frame(period, min_hours) if any(r.scope == "person" for r in rules) else None
+
+    results = {}
+    for group in dict.fromkeys(rule.group for rule in rules):
+        messages, claimed = [], {}
+        for rule in (r for r in rules if r.group == group):
+            frame = rows if rule.scope == "row" else people
+            mask = rule.mask(frame)
+            taken = claimed.get(rule.scope)
+            if taken is not None:
+                mask &= ~taken
+            claimed[rule.scope] = mask if taken is None else (taken | mask)
+            if not mask.any():
+                continue
+            rendered = rule.render(context.take(rule.fields, mask) if rule.scope == "row" else frame[mask])
+            if rule.scope == "row":
+                index = rendered.index.to_numpy()
+                keys = [[0] * len(rendered), index if positions is None else positions[index], [""] * len(rendered)]
+            else:
+                keys = [[1] * len(rendered), [-1] * len(rendered), frame.loc[mask, "name"].tolist()]
+            messages.append(rendered.set_axis(pd.MultiIndex.from_arrays(keys)))
+        results[group] = messages
+    return results
+
+
+def _merge(rules, parts):
+    """_evaluate_keyed 결과 (조각별) → {group: 이슈 목록} (행 규칙은 원본 행 순, person 규칙은 이름 순)"""
+    import pandas as pd
+    results = {}
+    for group in dict.fromkeys(rule.group for rule in rules):
+        dedupe = any(rule.dedupe for rule in rules if rule.group == group)
+        messages = [series for part in parts for series in part.get(group, [])]
+        if messages:
+            ordered = pd.concat(messages).sort_index(kind="stable")
+            results[group] = list(pd.unique(ordered)) if dedupe else ordered.tolist()
+        else:
+            results[group] = []
+    return results
+
+
+def _source_columns(rules, df):
+    """규칙 평가에 필요한 원본 열 (조각 전송량을 줄이기 위해 나머지 열은 보내지 않음)"""
+    needed = {"Name"}
+    for rule in rules:
+        for column in rule.columns:
+            needed.update(_SOURCE_COLUMNS.get(column, ()))
+    return [column for column in df.columns if column in needed]
+
+
+def _shards(names, workers):
+    """이름 Series → 조각별 원본 행 위치 목록 (한 사람은 한 조각에만, 행 수가 많은 사람부터 가장 가벼운 조각에 배정)"""
+    import heapq
+    import numpy as np
+    import pandas as pd
+    codes, uniques = pd.factorize(names)
+    counts = np.bincount(codes, minlength=len(uniques))
+    shard_of = np.zeros(len(uniques), dtype=np.int64)
+    heap = [(0, shard) for shard in range(min(workers, len(uniques)))]
+    for code in sorted(range(len(uniques)), key=lambda c: (-counts[c], c)):
+        load, shard = heapq.heappop(heap)
+        shard_of[code] = shard
+        heapq.heappush(heap, (load + int(counts[code]), shard))
+    row_shards = shard_of[codes]
+    return [np.flatnonzero(row_shards == shard) for shard in range(len(heap))]
+
+
+def _evaluate_shard(task):
+    """ProcessPoolExecutor 작업 — 한 조각 평가 (모듈 최상위 함수여야 pickle 가능)"""
+    rules, shard, config, period, min_hours, positions = task
+    return _evaluate_keyed(rules, shard, config, period, min_hours, positions)
+
+
+def _evaluate_parallel(rules, df, config, period, min_hours, workers):
+    """사람별로 나눈 조각을 여러 프로세스에서 평가 → 조각별 결과 목록 (프로세스를 못 띄우면 None → 단일 프로세스)"""
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    source = df[_source_columns(rules, df)].reset_index(drop=True)
+    shards = _shards(RowColumns(source, config)["name"], workers)
+    if len(shards) < 2:
+        return None
+    tasks = [(rules, source.take(positions), config, period, min_hours, positions) for positions in shards]
+    try:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+            return list(pool.map(_evaluate_shard, tasks))
+    except (OSError, BrokenProcessPool):
+        return None
+
+
+_default_rules = None
+
+
+def default_rules():
+    """기본 규칙 (DEFAULT_RULES) — 한 번만 파싱"""
+    global _default_rules
+    if _default_rules is None:
+        _default_rules = RuleSet.parse(DEFAULT_RULES)
+    return _default_rules
@@ -0,0 +1,93 @@
+# reportbot/settings.py - 월별 기준 시간 / 설정 파일 경로 / 기본 실행 옵션
+#
+# 매월 MONTHLY_HOURS에 다음 달 기준 시간을 추가하세요 (tu_downloader.py / tu_downloader_window.py 공용)
+from datetime import datetime, timezone, timedelta
+
+# ==========================================
+# 월별 설정 변수 (매월 MONTHLY_HOURS에 추가)
+# ==========================================
+_KST = timezone(timedelta(hours=9))
+
+MONTHLY_HOURS = {
+    (2026, 6): 168,
+    (2026, 7): 176,
+    (2026, 8): 160,
+    (2026, 9): 160,
+    (2026, 10): 160,
+    (2026, 11): 168,
+    (2026, 12): 168,
+    # 매달 여기에 추가하세요: (연도, 월): 시간
+}
+
+# 특정 인원만 특정 월에 다른 기준 시간 적용 (예: 중도 합류자 일할 계산)
+# 형식: (연도, 월, "이름"): 시간   -> 해당 연/월에만 적용, 다음 달부터는 자동으로 MONTHLY_HOURS 기준으로 복귀
+PERSON_HOURS_OVERRIDE = {
+    (2026, 7, "유연수"): 64,
+}
+
+
+def current_period():
+    """현재 한국 시간 기준 (연도, 월)"""
+    now = datetime.now(_KST)
+    return now.year, now.month
+
+
+def output_filename_for(year, month):
+    """월별 처리 결과 파일명 (예: 2026년 6월 → 26_6.csv)"""
+    return f"{str(year)[2:]}_{month}.csv"
+
+
+def required_hours_for(year, month):
+    """월별 기준 시간 (MONTHLY_HOURS에 없으면 ValueError)"""
+    if (year, month) not in MONTHLY_HOURS:
+        raise ValueError(f"MONTHLY_HOURS에 {year}년 {month}월 기준 시간이 없습니다 "
+                         f"(reportbot/settings.py 의 MONTHLY_HOURS 에 ({year}, {month}): 시간 추가)")
+    return MONTHLY_HOURS[(year, month)]
+
+
+# ==========================================
+# 파일 경로 설정
+# ==========================================
+FIRST_TAGS_REQUIRED_ART_FILE = "first_tags_required_second_art.txt"
+FIRST_TAGS_OPTIONAL_SECOND_FILE = "first_tags_optional_second.txt"
+SECOND_TAGS_ART_FILE = "second_tags_art.txt"
+SECOND_TAGS_PROJECT_FILE = "second_tags_project.txt"
+EXCLUDE_VALUES_FILE = "exclude_values.txt"
+EMAIL_MAP_FILE = "email_map.txt"
+EXCLUDE_NAMES_FILE = "exclude_names.txt"
+LEAVE_KEYWORDS_FILE = "leave_keywords.txt"
+VALIDATION_RULES_FILE = "validation_rules.txt"
+
+
+class ConfigFileError(ValueError):
+    """설정 파일(태그 목록 / 검증 규칙 등)을 읽을 수 없거나 형식이 잘못됨 — 종료 코드는 호출한 쪽(cli.main)이 결정"""
+
+# 단계 캐시 (reportbot/pipeline.py): --reuse-export 로 실행하면 이 시간 안에 받은 같은 팀/월 export를 브라우저 단계 없이 재사용
+# (업로드 실패 직후 재시도 등 — 플래그가 없으면 항상 새로 내보내기)
+EXPORT_REUSE_MINUTES = 30
+
+# 멀티 팀 모드: 팀별 설정/출력 폴더 (teams/<팀명>/), 팀 폴더에 없는 설정 파일은 루트 파일 사용
+TEAMS_DIR = "teams"
+DEFAULT_TEAM = "아트실"
+
+# backfill 모드: 저장된 월별 원본 export 폴더 / 월별 결과 출력 폴더
+BACKFILL_EXPORTS_DIR = "raw_exports"
+BACKFILL_OUTPUT_DIR = "backfill"
+
+# 원본 export 보관 폴더 (reportbot/archive.py, Parquet — pyarrow 필요): <폴더>/period=YYYY-MM/run=<실행 시각>/export.parquet
+# backfill 모드는 BACKFILL_EXPORTS_DIR 에 CSV가 없는 달을 이 폴더의 마지막 보관본으로 처리
+RAW_ARCHIVE_DIR = "raw_archive"
+
+# ==========================================
+# 기타 설정
+# ==========================================
+DEFAULT_HEADLESS = True #True:윈도우X / False:윈도우O
+
+DISABLE_SLACK_NOTIFICATIONS = False #True:노티X / False:노티O (tu_downloader_window.py는 True로 실행)
+
+# 브라우저 백엔드: chrome / edge / http / fake (reportbot/browsers.py)
+DEFAULT_BACKEND = "chrome"
+
+# 검증 규칙 병렬 평가 프로세스 수 (reportbot/rules.py, --workers=N): 1이면 단일 프로세스, 0이면 CPU 수
+# 여러 팀 / 여러 달을 합친 큰 export (rules.PARALLEL_MIN_ROWS 행 이상) 에서만 병렬로 나눔
+VALIDATION_WORKERS = 1
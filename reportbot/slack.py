@@ -0,0 +1,196 @@
+# reportbot/slack.py - 레이트리밋 대응 슬랙 전송기 (재시도 + 백오프 + 커넥션 풀 공유)
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+# 슬랙 Web API 기본 주소 (로컬 가짜 서버로 테스트할 때는 SLACK_API_URL로 덮어쓰기)
+DEFAULT_SLACK_API_URL = "https://slack.com/api/"
+
+# 재시도 설정
+DEFAULT_MAX_RETRIES = 4        # 첫 시도 제외 최대 재시도 횟수
+DEFAULT_BACKOFF_BASE = 1.0     # 지수 백오프 시작값 (초)
+DEFAULT_BACKOFF_MAX = 30.0     # 백오프/Retry-After 상한 (초)
+DEFAULT_TIMEOUT = 30           # 요청 1회 타임아웃 (초)
+
+# 재시도 대상 슬랙 오류 코드 (HTTP 200 + ok:false 로 오는 경우)
+RETRYABLE_SLACK_ERRORS = {"ratelimited", "internal_error", "fatal_error", "service_unavailable", "request_timeout"}
+
+# 같은 요청을 다시 보내면 결과가 중복되는 메서드 (메시지가 두 번 올라감)
+# → 응답 타임아웃 / 5xx / ratelimited 외 오류 코드는 슬랙이 이미 처리했을 수 있으므로 재시도하지 않음
+#   (429·ratelimited 는 처리 전 거절, 연결 거부·연결 타임아웃은 요청이 전송되기 전이라 재시도)
+NON_IDEMPOTENT_METHODS = {"chat.postMessage"}
+
+
+def _failed_before_send(error):
+    """연결 오류가 요청 전송 전에 난 것인지 (연결 거부 / 연결 타임아웃)"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    # urllib3 의 NewConnectionError(연결 거부 등)는 ConnectTimeoutError 의 하위 클래스
+    return isinstance(reason, ConnectTimeoutError)
+
+
+class SlackSender:
+    def __init__(self, token, base_url=None, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff_base=DEFAULT_BACKOFF_BASE, backoff_max=DEFAULT_BACKOFF_MAX,
+                 timeout=DEFAULT_TIMEOUT, pool_size=4, sleep=time.sleep):
+        """
+        슬랙 Web API 전송기 — WebClient 대신 사용 (auth_test / chat_postMessage / conversations_list 호환)
+
+        - 429 응답은 Retry-After 헤더만큼 대기 후 재시도
+        - 5xx / 연결 오류 / ratelimited 등은 지터가 섞인 지수 백오프로 재시도
+          (chat.postMessage 는 중복 게시를 막기 위해 429·ratelimited·전송 전 연결 오류만 재시도)
+        - 하나의 requests.Session(커넥션 풀)을 모든 호출과 채널 fan-out에서 공유
+
+        Args:
+            token (str): 슬랙 봇 토큰
+            base_url (str): API 주소 (None이면 SLACK_API_URL 환경변수 → 기본 주소 순)
+            max_retries (int): 최대 재시도 횟수
+            pool_size (int): 커넥션 풀 크기 (동시 fan-out 채널 수 이상 권장)
+            sleep (callable): 대기 함수 (테스트에서 교체용)
+        """
+        self.token = token
+        self.base_url = (base_url or os.getenv("SLACK_API_URL") or DEFAULT_SLACK_API_URL).rstrip('/') + '/'
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._sleep = sleep
+
+        # 재시도 통계 / API 호출별 소요 시간 (실행 리포트·메트릭용)
+        self.retry_count = 0
+        self.call_timings = []   # [(메서드, 재시도 포함 소요 초, 성공 여부)]
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=utf-8",
+        })
+
+    def _backoff_delay(self, attempt):
+        """지터 포함 지수 백오프 (full jitter): 0 ~ min(상한, 시작값 * 2^attempt)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after_delay(self, response, attempt):
+        """Retry-After 헤더(초)를 우선 사용, 없거나 잘못된 값이면 지수 백오프"""
+        value = response.headers.get("Retry-After")
+        try:
+            delay = float(value)
+        except (TypeError, ValueError):
+            return self._backoff_delay(attempt)
+        # 여러 요청이 동시에 깨어나지 않도록 약간의 지터 추가
+        return min(self.backoff_max, delay) + random.uniform(0, 0.5)
+
+    def api_call(self, method, payload=None):
+        """슬랙 API 호출 (재시도 포함) → 응답 dict 반환
+
+        재시도를 모두 소진하면 {'ok': False, 'error': ...} 형태로 반환 (예외를 던지지 않음)
+        """
+        start = time.perf_counter()
+        data = self._api_call(method, payload)
+        self.call_timings.append((method, time.perf_counter() - start, bool(data.get("ok"))))
+        return data
+
+    def _api_call(self, method, payload):
+        url = self.base_url + method
+        last_error = "unknown_error"
+        idempotent = method not in NON_IDEMPOTENT_METHODS
+
+        for attempt in range(self.max_retries + 1):
+            can_retry = attempt < self.max_retries
+            try:
+                response = self.session.post(url, json=payload or {}, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = f"connection_error: {e}"
+                if not can_retry:
+                    break
+                if not idempotent and not _failed_before_send(e):
+                    print(f"⚠️ 슬랙 {method} 응답 없음 — 이미 전송됐을 수 있어 재시도하지 않음")
+                    return {"ok": False, "error": last_error}
+                delay = self._backoff_delay(attempt)
+                print(f"⚠️ 슬랙 {method} 연결 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self.retry_count += 1
+                self._sleep(delay)
+                continue
+
+            if response.status_code == 429:
+                last_error = "ratelimited"
+                if not can_retry:
+                    break
+                delay = self._retry_after_delay(response, attempt)
+                print(f"⚠️ 슬랙 {method} 레이트리밋(429), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self.retry_count += 1
+                self._sleep(delay)
+                continue
+
+            if response.status_code >= 500:
+                last_error = f"http_{response.status_code}"
+                if not can_retry:
+                    break
+                if not idempotent:
+                    print(f"⚠️ 슬랙 {method} 서버 오류({response.status_code}) — 이미 전송됐을 수 있어 재시도하지 않음")
+                    return {"ok": False, "error": last_error}
+                delay = self._backoff_delay(attempt)
+                print(f"⚠️ 슬랙 {method} 서버 오류({response.status_code}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self.retry_count += 1
+                self._sleep(delay)
+                continue
+
+            try:
+                data = response.json()
+            except ValueError:
+                return {"ok": False, "error": f"invalid_response_http_{response.status_code}"}
+
+            retryable = data.get("error") in RETRYABLE_SLACK_ERRORS and (idempotent or data.get("error") == "ratelimited")
+            if not data.get("ok") and retryable and can_retry:
+                last_error = data.get("error")
+                delay = self._retry_after_delay(response, attempt)
+                print(f"⚠️ 슬랙 {method} 오류({last_error}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                self.retry_count += 1
+                self._sleep(delay)
+                continue
+
+            return data
+
+        print(f"❌ 슬랙 {method} 재시도 소진: {last_error}")
+        return {"ok": False, "error": last_error}
+
+    def auth_test(self):
+        return self.api_call("auth.test")
+
+    def chat_postMessage(self, channel, text, thread_ts=None, **kwargs):
+        payload = {"channel": channel, "text": text, **kwargs}
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+        return self.api_call("chat.postMessage", payload)
+
+    def conversations_list(self, limit=1000, **kwargs):
+        return self.api_call("conversations.list", {"limit": limit, **kwargs})
+
+    def post_to_channels(self, channels, text, parallel=True):
+        """같은 메시지를 여러 채널에 전송 (fan-out) → {채널: 응답 dict}
+
+        parallel=True면 채널별로 스레드를 띄워 동시에 전송 (세션/커넥션 풀은 공유)
+        """
+        channels = list(dict.fromkeys(ch for ch in channels if ch))  # 중복 채널 제거 (순서 유지)
+        if not channels:
+            return {}
+
+        if not parallel or len(channels) == 1:
+            return {ch: self.chat_postMessage(channel=ch, text=text) for ch in channels}
+
+        with ThreadPoolExecutor(max_workers=min(len(channels), self.pool_size)) as executor:
+            futures = {ch: executor.submit(self.chat_postMessage, channel=ch, text=text) for ch in channels}
+            return {ch: future.result() for ch, future in futures.items()}
+
+    def close(self):
+        self.session.close()
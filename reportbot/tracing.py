@@ -0,0 +1,228 @@
+# reportbot/tracing.py - 단계별 소요 시간 측정(span) + 실행 리포트(JSON)
+#
+# 사용 예:
+#   tracer = Tracer("full")
+#   with tracer.activate():
+#       with span("login"):
+#           with span("login.wait_home", timeout=60):
+#               ...
+#       tracer.set("rows", 272)
+#   tracer.write_report()          # run_reports/run_20261018_070012_full.json
+#   print(tracer.summary_table())
+#
+# 활성화된 Tracer가 없으면 span()은 아무것도 기록하지 않음 (백엔드/도구 코드에서 그대로 사용 가능)
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+
+# 실행 리포트 저장 폴더
+RUN_REPORTS_DIR = "run_reports"
+
+_KST = timezone(timedelta(hours=9))
+
+_active = None              # 현재 활성화된 Tracer (프로세스 전체)
+_local = threading.local()  # 스레드별 열린 span 스택
+
+
+class Span:
+    def __init__(self, name, parent, start, attrs):
+        self.name = name
+        self.parent = parent
+        self.start = start
+        self.duration = None
+        self.status = "ok"
+        self.error = None
+        self.attrs = dict(attrs)
+
+    @property
+    def depth(self):
+        depth, parent = 0, self.parent
+        while parent is not None:
+            depth, parent = depth + 1, parent.parent
+        return depth
+
+    def set(self, **attrs):
+        """span에 속성 추가 (예: 찾은 선택자, 파일 크기)"""
+        self.attrs.update(attrs)
+
+    def fail(self, status="error", error=None):
+        """예외 없이 실패한 경우 상태 표시 (예: 선택자 타임아웃 후 다음 선택자 시도)"""
+        self.status = status
+        self.error = error
+
+
+class _NullSpan:
+    def set(self, **attrs):
+        pass
+
+    def fail(self, status="error", error=None):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    def __init__(self, mode, profiler=None):
+        """
+        실행 1회의 span / 지표 모음
+
+        Args:
+            mode (str): 실행 모드 (full / validation / teams ...) — 리포트 파일명에 사용
+            profiler (StageProfiler): 최상위 span마다 CPU/메모리 프로파일 (--profile, reportbot/profiling.py)
+        """
+        self.mode = mode
+        self.profiler = profiler
+        self.started_at = datetime.now(_KST)
+        self._t0 = time.perf_counter()
+        self.spans = []
+        self.metrics = {}
+        self.sections = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self):
+        """이 Tracer를 현재 실행의 기록 대상으로 설정"""
+        global _active
+        previous, _active = _active, self
+        try:
+            yield self
+        finally:
+            _active = previous
+
+    @contextmanager
+    def span(self, name, **attrs):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        profiled = not stack and self.profiler is not None and self.profiler.start(name)
+        item = Span(name, stack[-1] if stack else None, time.perf_counter() - self._t0, attrs)
+        with self._lock:
+            self.spans.append(item)
+        stack.append(item)
+        try:
+            yield item
+        except BaseException as e:
+            item.fail("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            item.duration = time.perf_counter() - self._t0 - item.start
+            stack.pop()
+            if profiled:
+                self.profiler.stop()
+
+    def set(self, key, value):
+        """실행 지표 기록 (행 수, 이슈 수, 재시도 수 등)"""
+        self.metrics[key] = value
+
+    def add(self, key, value=1):
+        self.metrics[key] = self.metrics.get(key, 0) + value
+
+    def add_section(self, key, value):
+        """리포트에 별도 항목 추가 (예: Selenium 명령 통계)"""
+        self.sections[key] = value
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._t0
+
+    def report(self):
+        """JSON 직렬화 가능한 실행 리포트 dict"""
+        index = {id(s): i for i, s in enumerate(self.spans)}
+        return {
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(timespec='seconds'),
+            "duration_s": round(self.elapsed, 3),
+            "metrics": self.metrics,
+            "stages": {s.name: round(s.duration or 0.0, 3) for s in self.spans if s.parent is None},
+            "spans": [{
+                "name": s.name,
+                "parent": index.get(id(s.parent)),
+                "start_s": round(s.start, 3),
+                "duration_s": round(s.duration, 3) if s.duration is not None else None,
+                "status": s.status,
+                **({"error": s.error} if s.error else {}),
+                **({"attrs": s.attrs} if s.attrs else {}),
+            } for s in self.spans],
+            **self.sections,
+        }
+
+    def write_report(self, reports_dir=RUN_REPORTS_DIR):
+        """리포트를 <reports_dir>/run_<시각>_<모드>.json 으로 저장 → 경로 (실패 시 None)"""
+        try:
+            os.makedirs(reports_dir, exist_ok=True)
+            path = os.path.join(reports_dir, f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}_{self.mode}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+            return path
+        except Exception as e:
+            print(f"⚠️ 실행 리포트 저장 실패: {e}")
+            return None
+
+    def summary_table(self, max_depth=1):
+        """단계별 소요 시간 표 (max_depth 단계 하위 span까지)"""
+        lines = [f"{'단계':<36}{'시간(s)':>10}  상태"]
+        for s in self.spans:
+            depth = s.depth
+            if depth > max_depth:
+                continue
+            name = ("  " * depth + s.name)[:36]
+            duration = f"{s.duration:.2f}" if s.duration is not None else "-"
+            status = "✅" if s.status == "ok" else f"❌ {s.status}"
+            lines.append(f"{name:<36}{duration:>10}  {status}")
+        lines.append(f"{'전체':<36}{self.elapsed:>10.2f}")
+        for key, value in self.metrics.items():
+            lines.append(f"  {key}: {value}")
+        return "\n".join(lines)
+
+
+def current():
+    """현재 활성화된 Tracer (없으면 None)"""
+    return _active
+
+
+def current_span():
+    """현재 스레드에서 열려 있는 가장 안쪽 span (없으면 None)"""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if _active is not None and stack else None
+
+
+def current_stage():
+    """현재 스레드에서 열려 있는 최상위 span 이름 (예: login) — 없으면 None"""
+    stack = getattr(_local, "stack", None)
+    return stack[0].name if _active is not None and stack else None
+
+
+@contextmanager
+def span(name, **attrs):
+    """현재 Tracer에 span 기록 — 활성화된 Tracer가 없으면 아무것도 하지 않음"""
+    tracer = _active
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+    with tracer.span(name, **attrs) as item:
+        yield item
+
+
+def set_metric(key, value):
+    if _active is not None:
+        _active.set(key, value)
+
+
+def add_metric(key, value=1):
+    if _active is not None:
+        _active.add(key, value)
+
+
+def add_section(key, value):
+    if _active is not None:
+        _active.add_section(key, value)
+
+
+def traced(name, func, *args, **kwargs):
+    """func(*args, **kwargs)를 span으로 감싸 실행 → func 반환값"""
+    with span(name):
+        return func(*args, **kwargs)
@@ -0,0 +1,47 @@
+# tests/conftest.py - 저장소 루트를 import 경로에 추가 (pytest 를 어디서 실행해도 reportbot 패키지를 찾도록)
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# tests/data/sample_export.csv 의 담당자 (unknown@x.com 은 일부러 미등록)
+SAMPLE_EMAIL_MAP = {
+    "lkpang@aceproject.co.kr": "송민석",
+    "nenoh@aceproject.co.kr": "노노을",
+    "blblyou@aceproject.co.kr": "박지훈",
+    "potato@aceproject.co.kr": "장진서",
+    "jhee@aceproject.co.kr": "배진희",
+    "odradek@aceproject.co.kr": "김찬준",
+    "ysyoo@aceproject.co.kr": "유연수",
+}
+
+
+@pytest.fixture
+def sample_export():
+    """샘플 TU export (300행, 연차/반차 · 주요일정 · UI팀 Tasklist, 오류 태그, 담당자 없음 섞임)"""
+    import pandas as pd
+    return pd.read_csv(os.path.join(DATA_DIR, "sample_export.csv"))
+
+
+@pytest.fixture
+def sample_config():
+    """샘플 export 용 ProcessingConfig 생성 함수 (태그 목록은 루트 설정 파일과 같은 값) — 인자로 항목 덮어쓰기"""
+    from reportbot.processing import ProcessingConfig
+    from reportbot.fakes import synthetic
+
+    def make(**overrides):
+        values = dict(
+            email_map=SAMPLE_EMAIL_MAP, exclude_names=["김찬준"], leave_keywords=synthetic.LEAVE_KEYWORDS,
+            first_tags_required=synthetic.FIRST_TAGS_REQUIRED, first_tags_optional=synthetic.FIRST_TAGS_OPTIONAL,
+            second_tags_art=synthetic.SECOND_TAGS_ART, second_tags_project=synthetic.SECOND_TAGS_PROJECT,
+            person_hours_override={},
+        )
+        values.update(overrides)
+        return ProcessingConfig(**values)
+    return make
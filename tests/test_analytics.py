@@ -0,0 +1,27 @@
+# tests/test_analytics.py - 월별 집계의 이슈 종류별 수 (규칙 group 기준, 메트릭과 같은 값)
+import sqlite3
+
+from reportbot.analytics import MonthlyAggregates
+from reportbot.fakes.synthetic import generate_export, synthetic_config
+from reportbot.processing import process_export
+
+
+def test_issue_type_counts_follow_rule_groups(tmp_path):
+    df, people = generate_export(1000, seed=3)
+    config = synthetic_config(people)
+    result = process_export(df, config, (2026, 10))
+    assert result.ok
+    # '공통업무' 완료 이슈도 메시지에 "태그 오류" 가 들어가지만 태그 형식(tag_format) 이슈가 아님
+    assert result.completed_tag_issues and all("태그 오류" in issue for issue in result.completed_tag_issues)
+
+    store = MonthlyAggregates(str(tmp_path / "analytics.sqlite3"))
+    store.ingest((2026, 10), result.frame, result.issues, result.issue_counts, config, "sha", columns=result.columns)
+
+    with sqlite3.connect(store.path) as conn:
+        issues, hours_issues, tag_issues = conn.execute(
+            "SELECT issues, hours_issues, tag_issues FROM months WHERE period = '2026-10'").fetchone()
+        person_issues = conn.execute("SELECT SUM(issues) FROM person_month WHERE period = '2026-10'").fetchone()[0]
+    assert issues == len(result.issues) == sum(result.issue_counts.values())
+    assert hours_issues == len(result.hours_issues) == result.issue_counts["hours_total"]
+    assert tag_issues == len(result.tag_issues) == result.issue_counts["tag_format"]
+    assert person_issues == len(result.issues)
@@ -0,0 +1,30 @@
+# tests/test_browsers.py - Selenium 백엔드 다운로드 대기 (브라우저 없이 파일만으로 확인)
+import os
+
+from reportbot.browsers import ChromeBackend
+
+
+def test_downloads_fallback_counts_each_file_once(tmp_path, monkeypatch):
+    """~/Downloads 에 받아진 export 는 download_dir 로 옮기고, 다음 확인 때 같은 파일을 다시 세지 않음"""
+    home, download_dir = tmp_path / "home", tmp_path / "work"
+    (home / "Downloads").mkdir(parents=True)
+    download_dir.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    (home / "Downloads" / "export-projects.csv").write_text("a\n1\n", encoding="utf-8")
+
+    backend = ChromeBackend(download_dir=str(download_dir))
+    existing = backend.prepare_download()
+    polls = []
+
+    def sleep(seconds):
+        polls.append(seconds)
+        if len(polls) == 1:
+            (home / "Downloads" / "export-projects (1).csv").write_text("b\n2\n", encoding="utf-8")
+
+    backend._sleep = sleep
+    found = backend.wait_for_exports(existing, expected_count=2, timeout=10)
+
+    assert found == [str(download_dir / "export-projects.csv"), str(download_dir / "export-projects (1).csv")]
+    assert all(os.path.isabs(path) and os.path.exists(path) for path in found)
+    assert not os.listdir(home / "Downloads")
+    assert len(polls) == 1
@@ -0,0 +1,61 @@
+# tests/test_cli.py - 명령행 인자 오류 처리 (reportbot/cli.py)
+import pytest
+
+from reportbot.backfill import parse_month, run_backfill
+from reportbot.cli import main
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("value", ["2026/06", "2026-x", "2026-13", "202606", "-06"])
+def test_parse_month_errors(value):
+    with pytest.raises(ValueError) as error:
+        parse_month(value)
+    assert str(error.value).startswith("월 형식 오류")
+
+
+def test_backfill_reversed_range(workdir, capsys):
+    assert run_backfill((2026, 9), (2026, 6), output_dir=str(workdir / "out")) == []
+    assert "시작월이 끝월보다 늦음" in capsys.readouterr().out
+    assert not (workdir / "out").exists()
+
+
+@pytest.mark.parametrize("argv, usage", [
+    (["backfill", "2026-09", "2026-06"], "시작월이 끝월보다 늦음"),
+    (["backfill", "2026-x", "2026-06"], "사용법: python tu_downloader.py backfill"),
+    (["process", "x.csv", "2026/06"], "사용법: python tu_downloader.py process"),
+])
+def test_bad_month_arguments_exit_1(argv, usage, capsys):
+    assert main(argv + ["--backend=fake"]) == 1
+    out = capsys.readouterr().out
+    assert usage in out and "Traceback" not in out
+
+
+def test_process_month_without_hours(workdir, capsys):
+    """MONTHLY_HOURS 에 없는 달 → 어떤 달인지 / 어디에 추가할지 안내 후 exit 1"""
+    (workdir / "x.csv").write_text("Tasklist,Task\n", encoding="utf-8")
+    assert main(["process", str(workdir / "x.csv"), "2025-01", "--backend=fake"]) == 1
+    out = capsys.readouterr().out
+    assert "2025년 1월 기준 시간이 없습니다" in out and "MONTHLY_HOURS 에 (2025, 1): 시간 추가" in out
+    assert "Traceback" not in out
+
+
+def test_unreadable_tag_file_exits_1(workdir, capsys):
+    """태그 설정 파일 오류 → 프로세스를 직접 종료하지 않고 ConfigFileError, process 모드는 처리 실패 + exit 1"""
+    from reportbot.downloader import TaskworldDownloader
+    from reportbot.settings import ConfigFileError, FIRST_TAGS_REQUIRED_ART_FILE
+
+    (workdir / FIRST_TAGS_REQUIRED_ART_FILE).mkdir()
+    (workdir / "x.csv").write_text("Tasklist,Task\n", encoding="utf-8")
+    processor = TaskworldDownloader(config_dir=str(workdir), connect_slack=False, period=(2026, 10), backend="fake")
+    with pytest.raises(ConfigFileError) as error:
+        processor.load_allowed_tags()
+    assert str(error.value).startswith("태그 설정 파일 읽기 실패")
+
+    assert main(["process", str(workdir / "x.csv"), "2026-10", "--backend=fake"]) == 1
+    out = capsys.readouterr().out
+    assert "❌ 처리 실패: 태그 설정 파일 읽기 실패" in out and "Traceback" not in out
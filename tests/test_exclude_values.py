@@ -0,0 +1,48 @@
+# tests/test_exclude_values.py - 제외 Tasklist (exclude_values) 필터링
+from reportbot.fakes.synthetic import EXCLUDE_VALUES, LEAVE_KEYWORDS, generate_export, synthetic_config
+from reportbot.processing import process_export
+
+PERIOD = (2026, 10)
+
+
+def test_per_value_counts():
+    df, people = generate_export(2000, seed=5)
+    result = process_export(df, synthetic_config(people), PERIOD, min_hours=160)
+    assert result.ok
+
+    counts = df["Tasklist"].value_counts()
+    # 설정 순서, 데이터에 없는 값 (디자인팀) 은 빠짐
+    assert result.tasklist_excluded == {value: int(counts[value]) for value in EXCLUDE_VALUES if value in counts.index}
+    assert list(result.tasklist_excluded) == ["주요일정", "UI팀", "리소스팀"]
+    assert result.original_count == len(df)
+    assert len(result.frame) == len(df) - result.tasklist_excluded_count - result.excluded_count
+
+    # 제외된 업무 (Task 는 행마다 고유) 는 결과 CSV 에 남지 않음
+    excluded_tasks = set(df.loc[df["Tasklist"].isin(EXCLUDE_VALUES), "Task"])
+    assert not excluded_tasks & set(result.frame["Task"])
+
+
+def test_no_exclude_values_keeps_rows():
+    df, people = generate_export(1000, seed=5)
+    result = process_export(df, synthetic_config(people, exclude_values=[]), PERIOD, min_hours=160)
+    assert result.tasklist_excluded == {}
+    assert len(result.frame) == len(df) - result.excluded_count
+
+
+def test_leave_tasklists_are_retagged_not_dropped():
+    """연차 키워드 Tasklist 는 exclude_values 에 들어 있어도 제거하지 않고 연차 / 사내행사 태그로 변환"""
+    df, people = generate_export(2000, seed=5)
+    config = synthetic_config(people, exclude_values=EXCLUDE_VALUES + ["연차", "행사공결"])
+    assert config.exclude_values == EXCLUDE_VALUES
+    result = process_export(df, config, PERIOD, min_hours=160)
+    assert "연차" not in result.tasklist_excluded and "행사공결" not in result.tasklist_excluded
+
+    excluded_name = next(iter(people.values()))
+    leave_rows = df[df["Tasklist"].isin(LEAVE_KEYWORDS) & (df["Assigned To"].map(people) != excluded_name)]
+    assert result.leave_count == len(leave_rows) > 0
+
+    frame = result.frame.astype(str)
+    leave_frame = frame[frame["Task"].isin(LEAVE_KEYWORDS + ["사내행사"])]
+    assert len(leave_frame) == result.leave_count
+    assert set(leave_frame.loc[leave_frame["Task"] == "사내행사", "Tags"]) == {"사내행사"}
+    assert set(leave_frame.loc[leave_frame["Task"] != "사내행사", "Tags"]) == {"연차"}
@@ -0,0 +1,83 @@
+# tests/test_identity.py - Assigned To → 이름 변환 (IdentityIndex)
+import pandas as pd
+
+from reportbot.downloader import TaskworldDownloader
+from reportbot.processing import IdentityIndex, ProcessingConfig, process_export
+
+EMAIL_MAP = {
+    "jhee@aceproject.co.kr, jhee@old.co.kr": "배진희",
+    " YSYoo@AceProject.co.kr ": "유연수",
+    "potato@aceproject.co.kr; potato@gmail.com": "장진서",
+}
+
+
+def _resolve(values, email_map=EMAIL_MAP):
+    names, unmapped, multi_rows = IdentityIndex(email_map).resolve(pd.Series(values, dtype=object))
+    return list(names), unmapped, multi_rows
+
+
+def test_case_and_whitespace_variants():
+    names, unmapped, multi_rows = _resolve([
+        "jhee@aceproject.co.kr", "JHEE@AceProject.CO.KR", "  jhee@aceproject.co.kr\t", "ysyoo@aceproject.co.kr",
+    ])
+    assert names == ["배진희", "배진희", "배진희", "유연수"]
+    assert unmapped == [] and multi_rows == 0
+
+
+def test_aliases_on_left_side():
+    index = IdentityIndex(EMAIL_MAP)
+    assert len(index) == 5
+    names, unmapped, _ = _resolve(["jhee@old.co.kr", "Potato@Gmail.com", "potato@aceproject.co.kr"])
+    assert names == ["배진희", "장진서", "장진서"]
+    assert unmapped == []
+
+
+def test_multiple_assignees_use_first():
+    names, unmapped, multi_rows = _resolve([
+        "jhee@aceproject.co.kr, ysyoo@aceproject.co.kr",
+        "ysyoo@aceproject.co.kr;jhee@old.co.kr",
+        "jhee@aceproject.co.kr, ysyoo@aceproject.co.kr",
+        ", potato@gmail.com",
+    ])
+    assert names == ["배진희", "유연수", "배진희", "장진서"]
+    assert multi_rows == 3
+    assert unmapped == []
+
+
+def test_unmapped_addresses():
+    names, unmapped, multi_rows = _resolve([
+        "new@aceproject.co.kr", " new@aceproject.co.kr ", "jhee@aceproject.co.kr, other@x.com", None, "",
+    ])
+    assert names == ["new@aceproject.co.kr", "new@aceproject.co.kr", "배진희", "", ""]
+    assert unmapped == [{"address": "new@aceproject.co.kr", "rows": 2}, {"address": "other@x.com", "rows": 1}]
+    assert multi_rows == 1
+
+
+def test_empty_map_reports_nothing():
+    names, unmapped, _ = _resolve(["a@x.com", "b@y.com"], email_map={})
+    assert names == ["a@x.com", "b@y.com"]
+    assert unmapped == []
+
+
+def test_email_map_file_aliases(tmp_path, monkeypatch):
+    """email_map.txt 왼쪽 별칭 → process_export 의 Name / unmapped 까지"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "email_map.txt").write_text(
+        "# 이메일 → 이름 매핑\n"
+        "jhee@aceproject.co.kr, jhee@old.co.kr : 배진희\n"
+        "YSYoo@AceProject.co.kr : 유연수\n",
+        encoding="utf-8",
+    )
+    email_map = TaskworldDownloader(config_dir=str(tmp_path), connect_slack=False, backend="fake").load_email_map()
+    frame = pd.DataFrame({
+        "Tasklist": ["아트실"] * 4,
+        "Task": ["a", "b", "c", "d"],
+        "Assigned To": ["JHee@Old.co.kr", "ysyoo@aceproject.co.kr", "jhee@aceproject.co.kr, stranger@x.com", "stranger@x.com"],
+        "Tags": ["공통업무, 회의"] * 4,
+        "Time Spent": ["1:00"] * 4,
+    })
+    result = process_export(frame, ProcessingConfig(email_map=email_map, person_hours_override={}), (2026, 10))
+    assert result.ok and result.name_mapped
+    assert list(result.frame["Name"].astype(str)) == ["배진희", "유연수", "배진희", "stranger@x.com"]
+    assert result.unmapped == [{"address": "stranger@x.com", "rows": 2}]
+    assert result.multi_assignee_count == 1
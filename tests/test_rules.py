@@ -0,0 +1,116 @@
+# tests/test_rules.py - 선언형 검증 규칙 (reportbot/rules.py)
+#
+# tests/data/sample_issues.json 은 규칙 엔진 도입 전 하드코딩 검증(validate_tags / validate_time_totals,
+# 완료 업무 공통업무 / 담당자 없음 검사)으로 tests/data/sample_export.csv 를 처리한 결과
+# → 기본 규칙이 그 결과와 문장 / 순서까지 같아야 함
+import json
+import os
+
+import pytest
+
+from conftest import DATA_DIR
+from reportbot.downloader import TaskworldDownloader
+from reportbot.processing import process_export, validate_tags, validate_time_totals
+from reportbot.rules import DEFAULT_RULES, RuleFileError, RuleSet
+
+REPO_ROOT = os.path.dirname(os.path.dirname(DATA_DIR))
+
+
+@pytest.fixture
+def expected():
+    with open(os.path.join(DATA_DIR, "sample_issues.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _config(sample_config, expected, **overrides):
+    year, month = expected["period"]
+    override = {(year, month, name): hours for name, hours in expected["person_hours_override"].items()}
+    return sample_config(person_hours_override=override, **overrides)
+
+
+def test_default_rules_match_pre_engine_checks(sample_export, sample_config, expected):
+    config = _config(sample_config, expected)
+    result = process_export(sample_export, config, tuple(expected["period"]), min_hours=expected["min_hours"])
+    assert result.ok
+    assert result.completed_tag_issues == expected["issues"]["completed_common_tag"]
+    assert result.assigned_issues == expected["issues"]["assigned_to_empty"]
+    assert result.hours_issues == expected["issues"]["hours_total"]
+    assert result.tag_issues == expected["issues"]["tag_format"]
+    assert result.issue_counts == {group: len(issues) for group, issues in expected["issues"].items()}
+
+
+def test_legacy_validators_match_pre_engine_checks(sample_export, sample_config, expected):
+    """validate_tags / validate_time_totals 단독 호출도 같은 결과 (규칙 group 하나만 평가)"""
+    config = _config(sample_config, expected)
+    period = tuple(expected["period"])
+    frame = process_export(sample_export, config, period, min_hours=expected["min_hours"]).frame
+    assert validate_tags(frame, config) == expected["issues"]["tag_format"]
+    assert validate_time_totals(frame, expected["min_hours"], period, config.exclude_names,
+                                config.person_hours_override) == expected["issues"]["hours_total"]
+
+
+def test_shipped_rule_file_matches_default_rules(sample_export, sample_config, expected):
+    with open(os.path.join(REPO_ROOT, "validation_rules.txt"), encoding="utf-8") as f:
+        rules = RuleSet.parse(f.read())
+    config = _config(sample_config, expected, rules=rules)
+    result = process_export(sample_export, config, tuple(expected["period"]), min_hours=expected["min_hours"])
+    assert result.issue_counts == {group: len(issues) for group, issues in expected["issues"].items()}
+    assert result.issues == sum(expected["issues"].values(), [])
+
+
+@pytest.mark.parametrize("text, message", [
+    ("when = hours > 1\nmessage = x\n", "형식 오류"),
+    ("[r]\nmessage = x\n", "[r] 'when' 항목 없음"),
+    ("[r]\nwhen = hours > 1\n", "[r] 'message' 항목 없음"),
+    ("[r]\nwhen = hourz > 1\nmessage = x\n", "[r] 알 수 없는 열: hourz"),
+    ("[r]\nwhen = hours > 1\nmessage = {nmae}\n", "[r] 알 수 없는 열: nmae"),
+    ("[r]\nwhen = required > 1\nmessage = x\n", "[r] 알 수 없는 열: required"),
+    ("[r]\nwhen = hours >\nmessage = x\n", "[r] 식 문법 오류"),
+    ("[r]\nwhen = hours > 1\nunless = excluded or\nmessage = x\n", "[r] 식 문법 오류"),
+    ("[r]\nwhen = hours > 1\nmessage = {name\n", "[r] message 템플릿 오류"),
+    ("[r]\nframe = raw\nwhen = hours > 1\nmessage = x\n", "[r] frame 은"),
+    ("[r]\nscope = team\nwhen = hours > 1\nmessage = x\n", "[r] scope 는"),
+    ("[r]\nwhen = hours > 1\nmessage = x\ndedupe = maybe\n", "[r] dedupe 는 yes/no"),
+    ("[r]\nwhen = hours > 1\nmessage = x\n[r]\nwhen = hours > 2\nmessage = y\n", "형식 오류"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(RuleFileError) as error:
+        RuleSet.parse(text)
+    assert message in str(error.value)
+
+
+def test_person_scope_columns():
+    rules = RuleSet.parse("[r]\nscope = person\nwhen = hours < required\nunless = excluded\nmessage = {name}\n")
+    assert rules.rules[0].columns == ["excluded", "hours", "name", "required"]
+    assert RuleSet.parse(DEFAULT_RULES).groups == ["completed_common_tag", "assigned_to_empty", "hours_total", "tag_format"]
+
+
+def test_broken_rule_file_fails_processing_without_exiting(tmp_path, monkeypatch):
+    """규칙 파일 오류는 프로세스 종료가 아니라 RuleFileError → process_csv 실패 결과"""
+    monkeypatch.chdir(tmp_path)
+    team_dir = tmp_path / "team"
+    team_dir.mkdir()
+    (team_dir / "validation_rules.txt").write_text("[r]\nwhen = hours >\nmessage = x\n", encoding="utf-8")
+    processor = TaskworldDownloader(config_dir=str(team_dir), connect_slack=False, period=(2026, 10), backend="fake")
+
+    with pytest.raises(RuleFileError) as error:
+        processor.load_rules()
+    assert "validation_rules.txt" in str(error.value)
+
+    result_df, _, message, issues = processor.process_csv(os.path.join(DATA_DIR, "sample_export.csv"))
+    assert result_df is None and issues == []
+    assert message.startswith("검증 규칙 파일 오류") and "식 문법 오류" in message
+
+
+def test_broken_rule_file_fails_pipeline_stage(tmp_path, monkeypatch, capsys):
+    """캐시 키 계산 중 규칙 파일 오류 → 예외로 실행이 죽지 않고 process_csv 단계 실패로 끝남 (설정 로드는 1회)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FAKE_EXPORT_CSV", os.path.join(DATA_DIR, "sample_export.csv"))
+    (tmp_path / "validation_rules.txt").write_text("[r]\nwhen = hours >\nmessage = x\n", encoding="utf-8")
+    processor = TaskworldDownloader(config_dir=str(tmp_path), connect_slack=False, period=(2026, 10), backend="fake")
+
+    collected = processor.build_pipeline("a", "b").run(["processed_file", "validation_issues"])
+    assert not collected.ok
+    assert collected.failed_stage == "process_csv"
+    assert collected.error.startswith("검증 규칙 파일 오류") and "식 문법 오류" in collected.error
+    assert capsys.readouterr().out.count("❌ 검증 규칙 파일 오류") == 1
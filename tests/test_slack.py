@@ -0,0 +1,106 @@
+# tests/test_slack.py - SlackSender 재시도 / Retry-After / fan-out (로컬 가짜 슬랙 서버 사용)
+import socket
+
+from reportbot.slack import SlackSender
+from reportbot.fakes.slack_server import FakeSlackServer
+
+
+def _sender(server_or_url, sleeps, **kwargs):
+    base_url = server_or_url if isinstance(server_or_url, str) else server_or_url.base_url
+    return SlackSender("xoxb-test", base_url=base_url, sleep=sleeps.append, **kwargs)
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_rate_limit_waits_retry_after_then_posts_once():
+    sleeps = []
+    with FakeSlackServer(rate_limit_first=2, retry_after=3) as server:
+        sender = _sender(server, sleeps)
+        data = sender.chat_postMessage(channel="아트실", text="hi")
+        sender.close()
+
+    assert data["ok"]
+    assert sender.retry_count == 2
+    assert len(sleeps) == 2 and all(3 <= delay <= 3.5 for delay in sleeps)
+    assert [status for _, _, _, status in server.requests] == [429, 429, 200]
+    assert server.messages() == [("아트실", "hi")]
+
+
+def test_rate_limit_exhausts_retries():
+    sleeps = []
+    with FakeSlackServer(rate_limit_first=10, retry_after=1) as server:
+        sender = _sender(server, sleeps, max_retries=2)
+        data = sender.chat_postMessage(channel="아트실", text="hi")
+        sender.close()
+
+    assert data == {"ok": False, "error": "ratelimited"}
+    assert sender.retry_count == 2
+    assert len(server.requests) == 3
+    assert server.messages() == []
+
+
+def test_server_error_retried_for_idempotent_method():
+    sleeps = []
+    with FakeSlackServer(server_errors_first=2) as server:
+        sender = _sender(server, sleeps, backoff_base=0.01)
+        data = sender.auth_test()
+        sender.close()
+
+    assert data["ok"]
+    assert sender.retry_count == 2
+    assert [status for _, _, _, status in server.requests] == [500, 500, 200]
+
+
+def test_server_error_not_retried_for_post_message():
+    """5xx 후 재전송하면 이미 올라간 메시지가 중복될 수 있음"""
+    sleeps = []
+    with FakeSlackServer(server_errors_first=1) as server:
+        sender = _sender(server, sleeps)
+        data = sender.chat_postMessage(channel="아트실", text="hi")
+        sender.close()
+
+    assert data == {"ok": False, "error": "http_500"}
+    assert sender.retry_count == 0
+    assert sleeps == []
+    assert len(server.requests) == 1
+
+
+def test_read_timeout_not_retried_for_post_message():
+    sleeps = []
+    with FakeSlackServer(latency=0.5) as server:
+        sender = _sender(server, sleeps, timeout=0.1)
+        data = sender.chat_postMessage(channel="아트실", text="hi")
+        sender.close()
+
+    assert not data["ok"] and data["error"].startswith("connection_error")
+    assert sender.retry_count == 0
+
+
+def test_connection_refused_retried_for_post_message():
+    """연결 자체가 안 된 경우는 요청이 전송되지 않았으므로 재시도"""
+    sleeps = []
+    sender = _sender(f"http://127.0.0.1:{_closed_port()}/api/", sleeps, max_retries=2, backoff_base=0.01)
+    data = sender.chat_postMessage(channel="아트실", text="hi")
+    sender.close()
+
+    assert not data["ok"]
+    assert sender.retry_count == 2
+    assert len(sleeps) == 2
+
+
+def test_post_to_channels_fans_out_to_every_channel():
+    sleeps = []
+    channels = ["아트실", "아트실-검증", "UI팀", "아트실"]
+    with FakeSlackServer(rate_limit_first=1, retry_after=0) as server:
+        sender = _sender(server, sleeps)
+        results = sender.post_to_channels(channels, "검증 결과")
+        sender.close()
+
+    assert list(results) == ["아트실", "아트실-검증", "UI팀"]
+    assert all(data["ok"] for data in results.values())
+    assert sorted(server.messages()) == sorted((ch, "검증 결과") for ch in results)
+    assert sender.retry_count == 1
@@ -0,0 +1,52 @@
+# tests/test_validation_report.py - 검증 결과 / 변경분 슬랙 메시지 (가짜 슬랙 서버로 전송)
+import pytest
+
+from reportbot.downloader import TaskworldDownloader
+from reportbot.issue_state import IssueDiff
+from reportbot.slack import SlackSender
+from reportbot.fakes.slack_server import FakeSlackServer
+
+
+@pytest.fixture
+def slack():
+    with FakeSlackServer() as server:
+        yield server
+
+
+@pytest.fixture
+def downloader(slack, monkeypatch):
+    monkeypatch.setenv("SLACK_CHANNEL_VALIDATION", "#검증")
+    processor = TaskworldDownloader(connect_slack=False, period=(2026, 10), backend="fake",
+                                    disable_slack_notifications=False)
+    processor.slack_client = SlackSender("xoxb-test", base_url=slack.base_url)
+    yield processor
+    processor.slack_client.close()
+
+
+def test_report_without_names_is_still_sent(downloader, slack):
+    """사람 이름이 없는 이슈만 있어도 전송 성공 → True (이슈 상태가 저장되어 다음 실행부터 변경분 모드)"""
+    issues = ["담당자 없음 오류 : 리소스 정리 (Assigned To 비어있음)"]
+    assert downloader.send_validation_report_to_slack(issues) is True
+
+    [(channel, text)] = slack.messages()
+    assert channel == "#검증"
+    assert "확인 필요한 사람" not in text
+    assert issues[0] in text
+
+
+def test_report_mentions_people(downloader, slack):
+    issues = ["배진희님 태그 오류 : 배경 작업", "담당자 없음 오류 : 리소스 정리"]
+    assert downloader.send_validation_report_to_slack(issues, team_name="UI팀") is True
+
+    [(_, text)] = slack.messages()
+    assert text.startswith("[TU 검토] UI팀 오류 발견")
+    assert "확인 필요한 사람 : 배진희" in text
+
+
+def test_diff_uses_team_name(downloader, slack):
+    diff = IssueDiff(["배진희님 태그 오류 : 배경 작업"], ["장진서님 태그 오류 : 캐릭터"])
+    assert downloader.send_validation_diff_to_slack(diff, team_name="UI팀") is True
+
+    [(_, text)] = slack.messages()
+    assert text.startswith("[TU 검토] UI팀 새 오류 1건")
+    assert "아트실" not in text